@@ -9,6 +9,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logger.info("Verbose startup logging enabled.")
 
+import bisect
+import hashlib
+import heapq
 import json
 import math
 import os
@@ -17,7 +20,10 @@ import subprocess
 import threading
 import time
 import uuid
+from collections import Counter
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 from zoneinfo import ZoneInfo
@@ -33,28 +39,41 @@ from flask import (
     jsonify,
     session,
     abort,
+    send_file,
+    stream_with_context,
+    g,
+    has_request_context,
 )
+from flask.json.provider import DefaultJSONProvider
 
 import csv
 import io
 
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 try:
-    from openpyxl.drawing.image import Image as OpenPyxlImage
+    import msal
 except Exception:  # pragma: no cover - optional dependency path
-    OpenPyxlImage = None
+    msal = None
 
 try:
-    from PIL import Image as PILImage, ImageDraw
+    import orjson
 except Exception:  # pragma: no cover - optional dependency path
-    PILImage = None
-    ImageDraw = None
+    orjson = None
+
+
+def _json_loads(raw):
+    # orjson rejects the NaN/Infinity literals stdlib json accepts, so retry
+    # those documents with json.loads. Both raise json.JSONDecodeError
+    # (orjson's subclasses it), so existing handlers keep working.
+    if orjson is None:
+        return json.loads(raw)
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
 
-try:
-    import msal
-except Exception:  # pragma: no cover - optional dependency path
-    msal = None
 
 import db
 from services import (
@@ -192,6 +211,44 @@ def _env_bool(name, default=False):
     return bool(default)
 
 
+class _OrjsonJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson when it is installed.
+
+    Dates still go through Flask's default hook (HTTP date strings) and keys
+    stay sorted, so responses keep their existing shape. Pretty-printed
+    (debug) output and anything orjson rejects fall back to the stdlib
+    encoder.
+    """
+
+    _COMPACT_DUMP_ARGS = {"separators": (",", ":")}
+
+    def _orjson_bytes(self, obj, extra_option=0):
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option | extra_option)
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or (kwargs and kwargs != self._COMPACT_DUMP_ARGS):
+            return super().dumps(obj, **kwargs)
+        try:
+            return self._orjson_bytes(obj).decode("utf-8")
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        # Compact responses hand orjson's bytes straight to the response
+        # instead of decoding to str for Werkzeug to re-encode.
+        if orjson is None or (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = self._orjson_bytes(obj, orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 logger.info("Starting app initialization.")
 app = Flask(
     __name__,
@@ -210,6 +267,7 @@ if not _configured_secret:
     _configured_secret = "dev-session-key"
     logger.warning("Using development session secret key.")
 app.secret_key = _configured_secret
+app.json = _OrjsonJSONProvider(app)
 app.config.update(
     SESSION_COOKIE_HTTPONLY=True,
     SESSION_COOKIE_SAMESITE="Lax",
@@ -509,6 +567,9 @@ DEFAULT_STOP_COLOR_PALETTE = [
 ]
 FALLBACK_STOP_COLOR = "#64748B"
 HEX_COLOR_PATTERN = re.compile(r"^#[0-9A-F]{6}$")
+UNSAFE_FILENAME_PATTERN = re.compile(r"[^A-Za-z0-9_-]+")
+# (table version, specs by SKU); see _get_sku_spec_map.
+_SKU_SPEC_MAP_CACHE = None
 TRAILER_PROFILE_OPTIONS = stack_calculator.trailer_profile_options()
 TUTORIAL_MANIFEST_PATH = os.path.join(
     os.path.dirname(os.path.abspath(__file__)),
@@ -982,6 +1043,7 @@ def session_reset():
         if planning_session and _can_access_planning_session(planning_session):
             _release_draft_loads_for_session(active_session_id)
     session.clear()
+    _clear_request_cache("allowed_plants")
     return redirect(url_for("login"))
 
 
@@ -1028,6 +1090,7 @@ def _clear_profile_session_state():
     session.pop(SESSION_ACTIVE_PLANNING_ID_KEY, None)
     session.pop("role", None)
     session.pop("allowed_plants", None)
+    _clear_request_cache("allowed_plants")
     session.pop("plant_filter", None)
     session.pop("plant_filters", None)
 
@@ -1480,9 +1543,8 @@ def _suggest_sku_for_item(item, desc, specs, category_hint=None):
 def _build_unmapped_suggestions(unmapped_items):
     if not unmapped_items:
         return []
-    specs = db.list_sku_specs()
     prepared_specs = []
-    for spec in specs:
+    for spec in _get_sku_spec_map().values():
         spec_copy = dict(spec)
         spec_copy["_dim"] = _extract_dimensions(spec.get("sku")) or _extract_dimensions(
             spec.get("description") or spec.get("notes")
@@ -2627,9 +2689,34 @@ def _coerce_utilization_grade_thresholds(raw_value):
     return {"A": a, "B": b, "C": c, "D": d}
 
 
+def _request_cache(namespace):
+    """Return a per-request memo dict stored on ``flask.g``.
+
+    Outside a request context a throwaway dict is returned, so callers always
+    fall through to a fresh lookup.
+    """
+    if not has_request_context():
+        return {}
+    caches = g.setdefault("_cot_request_caches", {})
+    return caches.setdefault(namespace, {})
+
+
+def _clear_request_cache(namespace):
+    if has_request_context():
+        g.setdefault("_cot_request_caches", {}).pop(namespace, None)
+
+
 def _get_planning_float_setting(setting_key, default_value):
+    # Freight breakdowns read the same accessorial settings once per load, so
+    # memoize them for the rest of the request instead of re-querying SQLite.
+    cache = _request_cache("planning_float_settings")
+    cache_key = (setting_key, default_value)
+    if cache_key in cache:
+        return cache[cache_key]
     setting = _get_effective_planning_setting(setting_key)
-    return round(_coerce_non_negative_float(setting.get("value_text"), default_value), 2)
+    value = round(_coerce_non_negative_float(setting.get("value_text"), default_value), 2)
+    cache[cache_key] = value
+    return value
 
 
 def _get_stop_fee_amount():
@@ -3171,6 +3258,10 @@ def _upsert_scoped_planning_setting(setting_key, value_text, profile_name=None):
     key = str(setting_key or "").strip()
     if not key:
         return
+    _clear_request_cache("planning_float_settings")
+    _clear_request_cache("stop_color_palette")
+    _clear_request_cache("return_to_origin")
+    _clear_request_cache("stack_capacity_assumptions")
     resolved_profile = str(profile_name or "").strip()
     if not resolved_profile:
         resolved_profile = _active_planner_profile_name()
@@ -3240,7 +3331,20 @@ def _get_planner_trailer_rule_overrides(profile_name=None):
     return sanitized
 
 
+def _copy_cached_settings(values):
+    # Request-cached setting dicts are handed out as copies (lists included)
+    # because callers adjust them in place before saving or applying them.
+    return {key: list(value) if isinstance(value, list) else value for key, value in values.items()}
+
+
 def _get_trailer_assignment_rules():
+    cache = _request_cache("trailer_assignment_rules")
+    if "rules" not in cache:
+        cache["rules"] = _load_trailer_assignment_rules()
+    return _copy_cached_settings(cache["rules"])
+
+
+def _load_trailer_assignment_rules():
     defaults = dict(DEFAULT_TRAILER_ASSIGNMENT_RULES)
     setting = db.get_planning_setting(TRAILER_ASSIGNMENT_RULES_SETTING_KEY) or {}
     raw_text = (setting.get("value_text") or "").strip()
@@ -3649,7 +3753,7 @@ def _resolve_load_carrier_pricing(
     }
 
 
-def _build_freight_breakdown(load, stop_fee_amount, fuel_surcharge_per_mile, load_minimum_amount):
+def _build_freight_breakdown(load, *, stop_fee_amount, fuel_surcharge_per_mile, load_minimum_amount):
     def _as_float(value, default=0.0):
         try:
             return float(value)
@@ -4008,6 +4112,13 @@ def _get_optimizer_default_settings():
 
 
 def _get_stack_capacity_assumptions():
+    cache = _request_cache("stack_capacity_assumptions")
+    if "assumptions" not in cache:
+        cache["assumptions"] = _load_stack_capacity_assumptions()
+    return _copy_cached_settings(cache["assumptions"])
+
+
+def _load_stack_capacity_assumptions():
     defaults = _get_optimizer_default_settings()
     return {
         "stack_overflow_max_height": _coerce_non_negative_int(
@@ -4219,6 +4330,18 @@ def _parse_date(value):
         return None
     if isinstance(value, date):
         return value
+    if isinstance(value, str):
+        # Report lines repeat a handful of due-date strings many times over.
+        return _parse_date_text(value)
+    return _parse_date_uncached(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(value):
+    return _parse_date_uncached(value)
+
+
+def _parse_date_uncached(value):
     try:
         return datetime.fromisoformat(value).date()
     except (TypeError, ValueError):
@@ -4692,7 +4815,7 @@ def _parse_manual_so_nums(raw_text):
 
 def _sku_category_lookup():
     lookup = {}
-    for spec in db.list_sku_specs():
+    for spec in _get_sku_spec_map().values():
         sku_key = str(spec.get("sku") or "").strip().upper()
         if sku_key and sku_key not in lookup:
             lookup[sku_key] = str(spec.get("category") or "").strip()
@@ -5444,15 +5567,25 @@ def _apply_profile_to_session(profile, *, reset_filters=False):
 
     session["role"] = ROLE_ADMIN if profile.get("is_admin") else ROLE_PLANNER
     session["allowed_plants"] = allowed
+    _clear_request_cache("allowed_plants")
 
     if reset_filters or session.get("plant_filters") is None:
         session["plant_filters"] = list(default_plants)
         _sync_legacy_plant_filter(session["plant_filters"], allowed)
 
 
+def _get_request_access_profile(profile_id):
+    # _require_session and the template context processor both resolve the
+    # active profile, so share one lookup per request.
+    cache = _request_cache("access_profiles")
+    if profile_id not in cache:
+        cache[profile_id] = db.get_access_profile(profile_id)
+    return cache[profile_id]
+
+
 def _ensure_active_profile():
     profile_id = session.get(SESSION_PROFILE_ID_KEY)
-    profile = db.get_access_profile(profile_id) if profile_id else None
+    profile = _get_request_access_profile(profile_id) if profile_id else None
     if not profile:
         return None
 
@@ -5494,8 +5627,12 @@ def _set_active_planning_session_id(session_id):
 
 
 def _get_allowed_plants():
-    allowed = session.get("allowed_plants") or []
-    return [code for code in allowed if code in PLANT_CODES]
+    # Most routes call this several times; session writes clear the memo.
+    cache = _request_cache("allowed_plants")
+    if "plants" not in cache:
+        allowed = session.get("allowed_plants") or []
+        cache["plants"] = tuple(code for code in allowed if code in PLANT_CODES)
+    return list(cache["plants"])
 
 
 def _resolve_plant_filters(selected):
@@ -6070,6 +6207,24 @@ def _build_dashboard_load_export_workbook(report_rows, export_scope):
         cell.border = border
         cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
 
+    summary_alignments = [
+        Alignment(
+            horizontal="right" if col_idx in {7, 9, 11, 12, 13, 14, 15, 17, 18, 19, 20} else "left",
+            vertical="center",
+            wrap_text=col_idx in {8, 10, 21, 22, 23},
+        )
+        for col_idx in range(1, len(headers) + 1)
+    ]
+    summary_number_formats = {
+        11: "#,##0.0",
+        12: "#,##0.0",
+        13: "#,##0.0",
+        14: "#,##0.0",
+        15: "0.0%",
+        18: "#,##0.0",
+        19: "$#,##0.00",
+        20: "$#,##0.00",
+    }
     for row_idx, load in enumerate(report_rows or [], start=2):
         so_numbers = list(dict.fromkeys([str(so).strip() for so in (load.get("order_numbers") or []) if str(so).strip()]))
         lines = load.get("lines") or []
@@ -6118,7 +6273,7 @@ def _build_dashboard_load_export_workbook(report_rows, export_scope):
                 utilized_feet,
                 total_linear_feet,
                 capacity_feet,
-                utilization_pct,
+                utilization_pct / 100.0,
                 load.get("schematic_grade") or "",
                 int(load.get("stop_count") or 0),
                 estimated_miles,
@@ -6130,25 +6285,13 @@ def _build_dashboard_load_export_workbook(report_rows, export_scope):
             ]
         )
 
-        for col_idx in range(1, len(headers) + 1):
-            cell = summary.cell(row=row_idx, column=col_idx)
+        for col_idx, cell in enumerate(summary[row_idx], start=1):
             cell.border = border
             cell.font = body_font
-            cell.alignment = Alignment(
-                horizontal="right" if col_idx in {7, 9, 11, 12, 13, 14, 15, 17, 18, 19, 20} else "left",
-                vertical="center",
-                wrap_text=col_idx in {8, 10, 21, 22, 23},
-            )
-
-        summary.cell(row=row_idx, column=11).number_format = "#,##0.0"
-        summary.cell(row=row_idx, column=12).number_format = "#,##0.0"
-        summary.cell(row=row_idx, column=13).number_format = "#,##0.0"
-        summary.cell(row=row_idx, column=14).number_format = "#,##0.0"
-        summary.cell(row=row_idx, column=15).number_format = "0.0%"
-        summary.cell(row=row_idx, column=15).value = utilization_pct / 100.0
-        summary.cell(row=row_idx, column=18).number_format = "#,##0.0"
-        summary.cell(row=row_idx, column=19).number_format = "$#,##0.00"
-        summary.cell(row=row_idx, column=20).number_format = "$#,##0.00"
+            cell.alignment = summary_alignments[col_idx - 1]
+            number_format = summary_number_formats.get(col_idx)
+            if number_format:
+                cell.number_format = number_format
 
     summary.freeze_panes = "A2"
     summary.auto_filter.ref = f"A1:W{max(len(report_rows or []), 1) + 1}"
@@ -6204,6 +6347,15 @@ def _build_dashboard_load_export_workbook(report_rows, export_scope):
         cell.border = border
         cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
 
+    line_alignments = [
+        Alignment(
+            horizontal="right" if col_idx in {9, 12, 13, 14} else "left",
+            vertical="center",
+            wrap_text=col_idx in {11},
+        )
+        for col_idx in range(1, len(line_headers) + 1)
+    ]
+    line_number_formats = {9: "#,##0.0", 12: "#,##0.0", 13: "#,##0.0", 14: "0.0%"}
     line_row = 2
     for load in report_rows or []:
         created_at_est = _to_est_datetime(load.get("created_at"))
@@ -6240,19 +6392,13 @@ def _build_dashboard_load_export_workbook(report_rows, export_scope):
                     float(line.get("utilization_pct") or 0.0) / 100.0,
                 ]
             )
-            for col_idx in range(1, len(line_headers) + 1):
-                cell = line_sheet.cell(row=line_row, column=col_idx)
+            for col_idx, cell in enumerate(line_sheet[line_row], start=1):
                 cell.border = border
                 cell.font = body_font
-                cell.alignment = Alignment(
-                    horizontal="right" if col_idx in {9, 12, 13, 14} else "left",
-                    vertical="center",
-                    wrap_text=col_idx in {11},
-                )
-            line_sheet.cell(row=line_row, column=9).number_format = "#,##0.0"
-            line_sheet.cell(row=line_row, column=12).number_format = "#,##0.0"
-            line_sheet.cell(row=line_row, column=13).number_format = "#,##0.0"
-            line_sheet.cell(row=line_row, column=14).number_format = "0.0%"
+                cell.alignment = line_alignments[col_idx - 1]
+                number_format = line_number_formats.get(col_idx)
+                if number_format:
+                    cell.number_format = number_format
             line_row += 1
 
     line_sheet.freeze_panes = "A2"
@@ -6286,15 +6432,17 @@ def _build_dashboard_load_export_workbook(report_rows, export_scope):
         ("Load Statuses", "APPROVED only"),
         ("Load Count", len(report_rows or [])),
     ]
-    for idx, (label, value) in enumerate(metadata_rows, start=1):
-        metadata.cell(row=idx, column=1, value=label).font = header_font
-        metadata.cell(row=idx, column=1).fill = header_fill
-        metadata.cell(row=idx, column=1).border = border
-        metadata.cell(row=idx, column=1).alignment = Alignment(horizontal="left", vertical="center")
-        metadata.cell(row=idx, column=2, value=value)
-        metadata.cell(row=idx, column=2).font = body_font
-        metadata.cell(row=idx, column=2).border = border
-        metadata.cell(row=idx, column=2).alignment = Alignment(horizontal="left", vertical="center")
+    metadata_alignment = Alignment(horizontal="left", vertical="center")
+    for label, value in metadata_rows:
+        metadata.append([label, value])
+        label_cell, value_cell = metadata[metadata.max_row]
+        label_cell.font = header_font
+        label_cell.fill = header_fill
+        label_cell.border = border
+        label_cell.alignment = metadata_alignment
+        value_cell.font = body_font
+        value_cell.border = border
+        value_cell.alignment = metadata_alignment
     metadata.column_dimensions["A"].width = 24
     metadata.column_dimensions["B"].width = 56
 
@@ -6345,6 +6493,17 @@ def _build_load_thumbnail(load, sku_specs, stop_color_palette=None, max_blocks=4
 
 
 def _line_stop_key(state, zip_code):
+    if (state is None or isinstance(state, str)) and (zip_code is None or isinstance(zip_code, str)):
+        return _line_stop_key_cached(state, zip_code)
+    return _line_stop_key_uncached(state, zip_code)
+
+
+@lru_cache(maxsize=8192)
+def _line_stop_key_cached(state, zip_code):
+    return _line_stop_key_uncached(state, zip_code)
+
+
+def _line_stop_key_uncached(state, zip_code):
     state_value = (state or "").strip().upper()
     raw_zip = (zip_code or "").strip()
     normalized_zip = geo_utils.normalize_zip(raw_zip)
@@ -6461,6 +6620,24 @@ def _normalize_order_identifier(value, fallback=""):
     return text if text else str(fallback or "").strip()
 
 
+def _requested_plant_code(values, allowed_plants):
+    """Upper-cased ``plant`` value, or "" when missing or not in ``allowed_plants``."""
+    plant_code = (values.get("plant") or "").strip().upper()
+    return plant_code if plant_code in allowed_plants else ""
+
+
+def _selected_form_so_nums(form):
+    """Stripped, de-duplicated ``so_nums`` form values in submission order."""
+    selected = []
+    seen = set()
+    for value in form.getlist("so_nums"):
+        so_num = (value or "").strip()
+        if so_num and so_num not in seen:
+            seen.add(so_num)
+            selected.append(so_num)
+    return selected
+
+
 def _stop_key_for_stop(stop):
     state = (stop.get("state") or "").strip().upper()
     raw_zip = (stop.get("zip") or "").strip()
@@ -6505,7 +6682,33 @@ def _normalize_hex_color(value, fallback):
     return fallback_text
 
 
+def _get_sku_spec_map():
+    """Return SKU specs keyed by SKU, shared across requests in this worker.
+
+    The worker-level copy is reused until the ``sku_specifications`` write
+    counter moves, and the version check itself runs once per request.
+    Callers must treat the mapping as read-only.
+    """
+    global _SKU_SPEC_MAP_CACHE
+    cache = _request_cache("sku_specs")
+    if "by_sku" not in cache:
+        version = db.get_table_version("sku_specifications")
+        cached = _SKU_SPEC_MAP_CACHE
+        if version is None or cached is None or cached[0] != version:
+            cached = (version, {spec["sku"]: spec for spec in db.list_sku_specs()})
+            _SKU_SPEC_MAP_CACHE = cached if version is not None else None
+        cache["by_sku"] = cached[1]
+    return cache["by_sku"]
+
+
 def _get_stop_color_palette():
+    cache = _request_cache("stop_color_palette")
+    if "palette" not in cache:
+        cache["palette"] = tuple(_load_stop_color_palette())
+    return list(cache["palette"])
+
+
+def _load_stop_color_palette():
     defaults = list(DEFAULT_STOP_COLOR_PALETTE)
     setting = _get_effective_planning_setting(STOP_COLOR_PALETTE_SETTING_KEY)
     raw_value = (setting.get("value_text") or "").strip()
@@ -6536,7 +6739,7 @@ def _get_stop_color_palette():
 
 
 def _color_for_stop_sequence(stop_sequence, stop_palette=None):
-    palette = list(stop_palette or _get_stop_color_palette())
+    palette = stop_palette or _get_stop_color_palette()
     if not palette:
         return FALLBACK_STOP_COLOR
     sequence = _coerce_int_value(stop_sequence, 0)
@@ -6545,21 +6748,32 @@ def _color_for_stop_sequence(stop_sequence, stop_palette=None):
     return palette[(sequence - 1) % len(palette)]
 
 
-def _build_order_colors_for_lines(lines, stop_sequence_map=None, stop_palette=None):
+@lru_cache(maxsize=64)
+def _stop_bg_color(color):
+    # Route node chips tint the stop color; the palette is small and shared.
+    return f"{color}22"
+
+
+def _build_order_colors_for_lines(lines, stop_sequence_map=None, stop_palette=None, line_stop_sequences=None):
+    """Map each order on ``lines`` to its stop color.
+
+    ``line_stop_sequences`` may carry the stop sequence already looked up for
+    each line (parallel to ``lines``) so the stop keys are not rebuilt here.
+    """
     palette = list(stop_palette or _get_stop_color_palette())
-    order_ids = []
+    lines = lines or []
+    if line_stop_sequences is None:
+        if stop_sequence_map:
+            line_stop_sequences = [stop_sequence_map.get(_stop_key_for_line(line)) for line in lines]
+        else:
+            line_stop_sequences = [None] * len(lines)
+    order_ids = {}
     order_stop_map = {}
-    for line in lines or []:
+    for line, stop_sequence in zip(lines, line_stop_sequences):
         order_id = _normalize_order_identifier(line.get("so_num"))
         if not order_id:
             continue
-        if order_id not in order_ids:
-            order_ids.append(order_id)
-        stop_sequence = None
-        if stop_sequence_map:
-            stop_sequence = stop_sequence_map.get(
-                _stop_key_for_line(line)
-            )
+        order_ids.setdefault(order_id, None)
         stop_value = _coerce_int_value(stop_sequence, 0)
         if stop_value <= 0:
             continue
@@ -6585,20 +6799,27 @@ def _build_order_colors_for_lines(lines, stop_sequence_map=None, stop_palette=No
 def _requires_return_to_origin(lines):
     if not lines:
         return False
-    strategic_setting = _get_effective_planning_setting(STRATEGIC_CUSTOMERS_SETTING_KEY)
-    strategic_customers = _parse_strategic_customers(strategic_setting.get("value_text") or "")
-    return any(
-        bool(
-            (
-                customer_rules.find_matching_strategic_customer(
-                    (line or {}).get("cust_name") or "",
-                    strategic_customers,
-                )
-                or {}
-            ).get("requires_return_to_origin")
-        )
-        for line in (lines or [])
-    )
+    # Load lists call this once per load; the strategic-customer setting and
+    # the per-customer verdicts are shared for the rest of the request.
+    cache = _request_cache("return_to_origin")
+    if "customers" not in cache:
+        strategic_setting = _get_effective_planning_setting(STRATEGIC_CUSTOMERS_SETTING_KEY)
+        cache["customers"] = _parse_strategic_customers(strategic_setting.get("value_text") or "")
+        cache["by_name"] = {}
+    strategic_customers = cache["customers"]
+    by_name = cache["by_name"]
+    for line in lines:
+        cust_name = (line or {}).get("cust_name") or ""
+        if cust_name not in by_name:
+            by_name[cust_name] = bool(
+                (
+                    customer_rules.find_matching_strategic_customer(cust_name, strategic_customers)
+                    or {}
+                ).get("requires_return_to_origin")
+            )
+        if by_name[cust_name]:
+            return True
+    return False
 
 
 def _route_path_distance_miles(origin_coords, ordered_stops, return_to_origin=False):
@@ -6671,17 +6892,32 @@ def _prefer_closest_endpoint_when_route_orientation_tied(
     return stops
 
 
+@lru_cache(maxsize=512)
+def _solved_stop_order(solver, origin_coords, stop_coords, return_to_origin):
+    """Stop indices in the order ``solver`` visits them.
+
+    The solver only looks at coordinates, so equivalent loads re-rendered by
+    any request in this worker reuse the same order. ``solver`` is part of
+    the key so a replaced solver never sees another solver's results.
+    """
+    stops = [{"coords": coords, "route_index": idx} for idx, coords in enumerate(stop_coords)]
+    ordered = solver(origin_coords, stops, return_to_origin=return_to_origin)
+    return tuple(stop["route_index"] for stop in ordered)
+
+
 def _ordered_stops_for_lines(lines, origin_plant, zip_coords, return_to_origin=None):
     stops = _build_route_stops_for_lines(lines, zip_coords)
     origin_coords = geo_utils.plant_coords_for_code(origin_plant)
     if return_to_origin is None:
         return_to_origin = _requires_return_to_origin(lines)
     if origin_coords:
-        ordered = tsp_solver.solve_route(
-            origin_coords,
-            stops,
-            return_to_origin=bool(return_to_origin),
+        stop_order = _solved_stop_order(
+            tsp_solver.solve_route,
+            tuple(origin_coords),
+            tuple(tuple(stop["coords"]) if stop.get("coords") else None for stop in stops),
+            bool(return_to_origin),
         )
+        ordered = [stops[idx] for idx in stop_order]
         return _prefer_closest_endpoint_when_route_orientation_tied(
             origin_coords,
             ordered,
@@ -6835,6 +7071,14 @@ def _build_schematic_line_items(lines, sku_specs, trailer_type, stop_sequence_ma
     return line_items
 
 
+def _schematic_order_numbers(lines):
+    return {
+        _normalize_order_identifier(line.get("so_num"))
+        for line in (lines or [])
+        if _normalize_order_identifier(line.get("so_num"))
+    }
+
+
 def _calculate_load_schematic(
     lines,
     sku_specs,
@@ -6842,11 +7086,7 @@ def _calculate_load_schematic(
     stop_sequence_map=None,
     assumptions=None,
 ):
-    order_numbers = {
-        _normalize_order_identifier(line.get("so_num"))
-        for line in (lines or [])
-        if _normalize_order_identifier(line.get("so_num"))
-    }
+    order_numbers = _schematic_order_numbers(lines)
     assumptions = assumptions or _get_stack_capacity_assumptions()
     line_items = _build_schematic_line_items(
         lines,
@@ -7837,17 +8077,14 @@ def _calculate_load_schematic_with_override(
     order_colors=None,
 ):
     assumptions = assumptions or _get_stack_capacity_assumptions()
-    schematic, line_items, order_numbers = _calculate_load_schematic(
-        lines,
-        sku_specs,
-        trailer_type,
-        stop_sequence_map=stop_sequence_map,
-        assumptions=assumptions,
-    )
-    schematic_warnings = list(schematic.get("warnings") or [])
+    schematic = None
+    schematic_warnings = []
     has_custom_schematic = False
     override = db.get_load_schematic_override(load_id)
-    if override and (override.get("trailer_type") or "").strip().upper() == trailer_type:
+    override_matches_trailer = bool(
+        override and (override.get("trailer_type") or "").strip().upper() == trailer_type
+    )
+    if override_matches_trailer:
         units = _build_schematic_units(
             lines,
             sku_specs,
@@ -7870,10 +8107,29 @@ def _calculate_load_schematic_with_override(
             has_custom_schematic = False
             schematic_warnings = []
 
+    if has_custom_schematic:
+        # The stored layout replaces the packed schematic, so skip the base pack.
+        line_items = _build_schematic_line_items(
+            lines,
+            sku_specs,
+            trailer_type,
+            stop_sequence_map=stop_sequence_map,
+        )
+        order_numbers = _schematic_order_numbers(lines)
+    else:
+        schematic, line_items, order_numbers = _calculate_load_schematic(
+            lines,
+            sku_specs,
+            trailer_type,
+            stop_sequence_map=stop_sequence_map,
+            assumptions=assumptions,
+        )
+        if not override_matches_trailer:
+            schematic_warnings = list(schematic.get("warnings") or [])
+
     if (
         not schematic_warnings
-        and override
-        and (override.get("trailer_type") or "").strip().upper() == trailer_type
+        and override_matches_trailer
         and override.get("warnings_json")
     ):
         try:
@@ -7953,7 +8209,7 @@ def _build_load_schematic_edit_payload(load_id):
     trailer_type = stack_calculator.normalize_trailer_type(load.get("trailer_type"), default="STEP_DECK")
     assumptions = _get_stack_capacity_assumptions()
     lines = db.list_load_lines(load_id)
-    sku_specs = {spec["sku"]: spec for spec in db.list_sku_specs()}
+    sku_specs = _get_sku_spec_map()
     stop_color_palette = _get_stop_color_palette()
     carrier_pricing_context = _build_load_carrier_pricing_context()
 
@@ -8099,15 +8355,18 @@ def _filter_out_past_due_orders(orders):
 def _count_active_orders_by_plant_from_rows(orders, plants=None):
     counts = {plant: 0 for plant in (plants or [])}
     allowed = set(plants or [])
-    for order in orders or []:
-        if _coerce_bool_value(order.get("is_excluded")):
-            continue
-        plant_code = _normalize_plant_code(order.get("plant"))
-        if not plant_code:
-            continue
-        if allowed and plant_code not in allowed:
-            continue
-        counts[plant_code] = counts.get(plant_code, 0) + 1
+    plant_codes = (
+        _normalize_plant_code(order.get("plant"))
+        for order in orders or []
+        if not _coerce_bool_value(order.get("is_excluded"))
+    )
+    counts.update(
+        Counter(
+            plant_code
+            for plant_code in plant_codes
+            if plant_code and (not allowed or plant_code in allowed)
+        )
+    )
     return counts
 
 
@@ -8823,6 +9082,32 @@ def _get_reopt_job(job_id):
         return dict(row)
 
 
+@lru_cache(maxsize=4096)
+def _url_for_cached(script_root, blueprint, endpoint, typed_values):
+    return url_for(endpoint, **{key: value for key, _value_type, value in typed_values})
+
+
+def _template_url_for(endpoint, **values):
+    # List pages call url_for once per row; route building is deterministic for
+    # a given mount point, blueprint, and argument set, so memoize it. External
+    # URLs, underscore options, and unhashable query values use Flask directly.
+    # Value types are part of the key because 1, 1.0 and True hash alike but
+    # render differently.
+    if any(key.startswith("_") for key in values):
+        return url_for(endpoint, **values)
+    try:
+        cache_key = tuple((key, type(value), value) for key, value in sorted(values.items()))
+        hash(cache_key)
+    except TypeError:
+        return url_for(endpoint, **values)
+    return _url_for_cached(request.script_root, request.blueprint, endpoint, cache_key)
+
+
+@cot_bp.app_context_processor
+def inject_template_url_for():
+    return {"url_for": _template_url_for}
+
+
 @cot_bp.app_context_processor
 def inject_session_context():
     profile = _ensure_active_profile()
@@ -9429,7 +9714,7 @@ def _build_performance_dashboard_context(allowed_plants_override=None):
             "line_color": _plant_color(plant_filters[0]) if len(plant_filters) == 1 else "var(--primary)",
         }
 
-        sku_specs = {spec["sku"]: spec for spec in db.list_sku_specs()}
+        sku_specs = _get_sku_spec_map()
         stop_color_palette = _get_stop_color_palette()
 
         def _fetch_review_loads(limit=None, sort_mode="recent", max_utilization=None):
@@ -9817,10 +10102,12 @@ def dashboard_load_export():
     period_segment = (scope.get("period") or "last_30_days").strip().lower()
     filename = f"dashboard_load_export_{period_segment}_{plant_segment}_{date.today().isoformat()}.xlsx"
 
-    return Response(
-        output.getvalue(),
+    return send_file(
+        output,
         mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        as_attachment=True,
+        download_name=filename,
+        conditional=True,
     )
 
 
@@ -11376,6 +11663,26 @@ def api_orders_scope_count():
     return jsonify(snapshot)
 
 
+def _iter_csv_lines(header, rows, batch_size=500):
+    # Format rows in batches with writerows so the csv module does the loop
+    # in C, and flush each batch to the client as one chunk.
+    rows = iter(rows)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if batch:
+            writer.writerows(batch)
+        chunk = buffer.getvalue()
+        if chunk:
+            yield chunk
+            buffer.seek(0)
+            buffer.truncate()
+        if len(batch) < batch_size:
+            break
+
+
 @cot_bp.route("/orders/export")
 def export_orders():
     session_redirect = _require_session()
@@ -11385,15 +11692,10 @@ def export_orders():
     plant_filters = _resolve_plant_filters(request.args.get("plants") or request.args.get("plant"))
     plant_scope = plant_filters or _get_allowed_plants()
     filters = {"plants": plant_scope} if plant_scope else {}
-    data = order_service.list_orders(filters=filters)
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(data["orders"][0].keys() if data["orders"] else [])
-    for order in data["orders"]:
-        writer.writerow(order.values())
-    output.seek(0)
+    orders = order_service.list_orders(filters=filters)["orders"]
+    header = orders[0].keys() if orders else []
     return Response(
-        output.getvalue(),
+        stream_with_context(_iter_csv_lines(header, map(dict.values, orders))),
         mimetype="text/csv",
         headers={"Content-Disposition": "attachment; filename=orders_export.csv"},
     )
@@ -11639,7 +11941,7 @@ def loads():
             active_session["status"] = session_status
     zip_coords = geo_utils.load_zip_coordinates()
     plant_names = {row["plant_code"]: row["name"] for row in db.list_plants()}
-    sku_specs = {spec["sku"]: spec for spec in db.list_sku_specs()}
+    sku_specs = _get_sku_spec_map()
     stop_color_palette = _get_stop_color_palette()
     sku_color_palette = [
         "#137fec",
@@ -11771,17 +12073,17 @@ def loads():
             group["early_days"] = early_days if early_days > 0 else 0
 
         for stop in stop_map.values():
-            coords = None
-            if stop.get("lat") is not None and stop.get("lng") is not None:
-                coords = (stop.get("lat"), stop.get("lng"))
+            lat = stop["lat"]
+            lng = stop["lng"]
+            coords = (lat, lng) if lat is not None and lng is not None else None
             stops.append(
                 {
                     "zip": stop["zip"],
                     "state": stop["state"],
                     "city": stop.get("city") or "",
                     "city_abbr": _city_abbr(stop.get("city")),
-                    "lat": stop.get("lat"),
-                    "lng": stop.get("lng"),
+                    "lat": lat,
+                    "lng": lng,
                     "coords": coords,
                     "customers": sorted(stop.get("customers") or []),
                 }
@@ -11840,15 +12142,22 @@ def loads():
             if math.isfinite(lat) and math.isfinite(lng):
                 stop_coords_by_sequence[idx] = (lat, lng)
         if optimizer_radius_miles > 0 and len(stop_coords_by_sequence) > 1:
-            for seq, coords in stop_coords_by_sequence.items():
-                nearest_miles = None
-                for other_seq, other_coords in stop_coords_by_sequence.items():
-                    if seq == other_seq:
-                        continue
-                    miles = geo_utils.haversine_distance_coords(coords, other_coords)
-                    if nearest_miles is None or miles < nearest_miles:
-                        nearest_miles = miles
-                if nearest_miles is not None and nearest_miles > optimizer_radius_miles:
+            # Each pair is measured once; the trig for every stop is done up front.
+            sequences = list(stop_coords_by_sequence)
+            prepared = [
+                geo_utils.prepare_haversine_point(stop_coords_by_sequence[seq])
+                for seq in sequences
+            ]
+            nearest = [math.inf] * len(sequences)
+            for left in range(len(sequences)):
+                for right in range(left + 1, len(sequences)):
+                    miles = geo_utils.haversine_prepared(prepared[left], prepared[right])
+                    if miles < nearest[left]:
+                        nearest[left] = miles
+                    if miles < nearest[right]:
+                        nearest[right] = miles
+            for seq, nearest_miles in zip(sequences, nearest):
+                if nearest_miles > optimizer_radius_miles:
                     rescue_stop_sequences.add(seq)
                     rescue_stop_reasons.setdefault(seq, set()).add("radius")
 
@@ -11965,15 +12274,18 @@ def loads():
                 "icon": "home",
                 "coords": origin_coords,
                 "sequence": 0,
+                "color": "#38bdf8",
+                "bg": "#38bdf822",
             }
         ]
         for idx, stop in enumerate(ordered_stops, start=1):
-            coords = None
-            if stop.get("lat") is not None and stop.get("lng") is not None:
-                coords = (stop.get("lat"), stop.get("lng"))
+            lat = stop.get("lat")
+            lng = stop.get("lng")
+            coords = (lat, lng) if lat is not None and lng is not None else None
             city = stop.get("city") or ""
             state = stop.get("state") or ""
             subtitle = ", ".join([part for part in [city, state] if part]).strip()
+            color = _color_for_stop_sequence(idx, stop_color_palette)
             route_nodes.append(
                 {
                     "type": "stop",
@@ -11982,6 +12294,8 @@ def loads():
                     "icon": "place",
                     "coords": coords,
                     "sequence": idx,
+                    "color": color,
+                    "bg": _stop_bg_color(color),
                 }
             )
         if requires_return_to_origin and origin_coords and len(route_nodes) > 1:
@@ -11993,27 +12307,14 @@ def loads():
                     "icon": "flag",
                     "coords": origin_coords,
                     "sequence": len(route_nodes),
+                    "color": "#38bdf8",
+                    "bg": "#38bdf822",
                 }
             )
         elif len(route_nodes) > 1:
             route_nodes[-1]["type"] = "final"
             route_nodes[-1]["icon"] = "flag"
 
-        for node in route_nodes:
-            node_type = (node.get("type") or "").strip().lower()
-            is_return_origin = (
-                node_type == "final"
-                and requires_return_to_origin
-                and origin_coords
-                and node.get("coords") == origin_coords
-            )
-            if node_type == "origin" or is_return_origin:
-                color = "#38bdf8"
-            else:
-                color = _color_for_stop_sequence(node.get("sequence"), stop_color_palette)
-            node["color"] = color
-            node["bg"] = f"{color}22"
-
         route_metrics = _load_route_display_metrics(
             load,
             route_nodes,
@@ -12584,6 +12885,7 @@ def planning_sessions():
     allowed_plants = set(_get_allowed_plants())
 
     active_session_id = _get_active_planning_session_id()
+    active_session = None
     if active_session_id:
         active_session = db.get_planning_session(active_session_id)
         if (
@@ -12608,14 +12910,13 @@ def planning_sessions():
     except ValueError:
         archived_all_count = None
 
-    sessions = db.list_planning_sessions(
-        {
-            "plant_code": plant_code or None,
-            "created_by": planner or None,
-            "start_date": start_date or None,
-            "end_date": end_date or None,
-        }
-    )
+    session_filters = {
+        "plant_code": plant_code or None,
+        "created_by": planner or None,
+        "start_date": start_date or None,
+        "end_date": end_date or None,
+    }
+    sessions = db.list_planning_sessions(session_filters)
 
     visible_sessions = []
     for session in sessions:
@@ -12624,12 +12925,11 @@ def planning_sessions():
             continue
         if not can_manage_sessions and not _can_access_planning_session(session):
             continue
-        config = {}
-        if session.get("config_json"):
-            try:
-                config = json.loads(session.get("config_json") or "{}")
-            except json.JSONDecodeError:
-                config = {}
+        raw_config = session.get("config_json")
+        try:
+            config = _json_loads(raw_config) if raw_config else {}
+        except json.JSONDecodeError:
+            config = {}
         session["config"] = config
         session["status"] = _normalize_session_status(session.get("status"))
         session["created_at_label"] = _format_est_datetime_label(session.get("created_at"))
@@ -12690,25 +12990,27 @@ def planning_sessions():
     total_sessions = len(sessions)
     avg_efficiency = 0.0
     loads_optimized = 0
-    active_session_label = None
     if sessions:
         util_values = [
             (session.get("avg_utilization") or 0) for session in sessions if session.get("avg_utilization") is not None
         ]
         avg_efficiency = round(sum(util_values) / len(util_values), 1) if util_values else 0.0
         loads_optimized = sum((session.get("load_count") or 0) for session in sessions)
-    if active_session_id:
-        active = next((session for session in sessions if session.get("id") == active_session_id), None)
-        if not active:
-            fetched = db.get_planning_session(active_session_id)
-            active = fetched if _can_access_planning_session(fetched) else None
-        if active and _can_access_planning_session(active):
-            active_session_label = f"{active.get('plant_code') or ''} - {active.get('session_code') or ''}".strip(" -")
 
-    planner_options = sorted(
-        {session.get("created_by") for session in sessions if session.get("created_by")}
-    )
-    plant_options = sorted({session.get("plant_code") for session in sessions if session.get("plant_code")})
+    # The active session row was already fetched for the draft-release check;
+    # its plant/session code never change, so reuse it for the banner label.
+    active_session_label = None
+    if active_session and _can_access_planning_session(active_session):
+        active_session_label = (
+            f"{active_session.get('plant_code') or ''} - {active_session.get('session_code') or ''}"
+        ).strip(" -")
+
+    session_scope = {
+        "allowed_plants": allowed_plants,
+        "sandbox": None if can_manage_sessions else _is_session_sandbox(),
+    }
+    planner_options = db.list_planning_session_planners(session_filters, **session_scope)
+    plant_options = db.list_planning_session_plants(session_filters, **session_scope)
 
     return render_template(
         "planning_sessions.html",
@@ -12738,8 +13040,8 @@ def _parse_replay_load_json(raw_json):
     if not raw_json:
         return {}
     try:
-        parsed = json.loads(raw_json)
-    except (TypeError, ValueError, json.JSONDecodeError):
+        parsed = _json_loads(raw_json)
+    except (TypeError, ValueError):
         return {}
     return parsed if isinstance(parsed, dict) else {}
 
@@ -12748,14 +13050,20 @@ def _parse_replay_order_numbers(raw_json):
     if not raw_json:
         return []
     try:
-        parsed = json.loads(raw_json)
-    except (TypeError, ValueError, json.JSONDecodeError):
+        parsed = _json_loads(raw_json)
+    except (TypeError, ValueError):
+        return []
+    if not isinstance(parsed, list):
         return []
     values = []
-    for value in parsed if isinstance(parsed, list) else []:
-        text = str(value or "").strip()
+    append = values.append
+    for value in parsed:
+        if value is None:
+            continue
+        # Order numbers are almost always JSON strings; skip the str() copy.
+        text = value.strip() if isinstance(value, str) else str(value).strip()
         if text:
-            values.append(text)
+            append(text)
     return values
 
 
@@ -12763,44 +13071,53 @@ def _build_replay_simulation_loads(load_metrics):
     stop_fee_amount = _get_stop_fee_amount()
     fuel_surcharge_per_mile = _get_fuel_surcharge_per_mile()
     load_minimum_amount = _get_load_minimum_amount()
+    normalize_trailer_type = stack_calculator.normalize_trailer_type
 
     loads = []
     for idx, metric in enumerate(load_metrics or [], start=1):
-        load_data = _parse_replay_load_json(metric.get("load_json"))
-        lines = load_data.get("lines") if isinstance(load_data.get("lines"), list) else []
-        order_numbers = _parse_replay_order_numbers(metric.get("order_numbers_json"))
+        metric_get = metric.get
+        load_data = _parse_replay_load_json(metric_get("load_json"))
+        load_get = load_data.get
+        lines = load_get("lines")
+        if not isinstance(lines, list):
+            lines = []
+        order_numbers = _parse_replay_order_numbers(metric_get("order_numbers_json"))
         if not lines and order_numbers:
             lines = [{"so_num": so_num} for so_num in order_numbers]
 
-        load_number = (metric.get("load_key") or "").strip() or f"SIM-{idx:03d}"
-        stop_count = int(load_data.get("stop_count") or 0)
+        load_number = (metric_get("load_key") or "").strip() or f"SIM-{idx:03d}"
+        stop_count = int(load_get("stop_count") or 0)
         if not stop_count:
-            stop_keys = {
-                f"{(str(line.get('state') or '').strip().upper())}|{str(line.get('zip') or '').strip()}"
-                for line in lines
-                if str(line.get("state") or "").strip() or str(line.get("zip") or "").strip()
-            }
+            stop_keys = set()
+            for line in lines:
+                line_get = line.get
+                state = str(line_get("state") or "").strip().upper()
+                zip_code = str(line_get("zip") or "").strip()
+                if state or zip_code:
+                    stop_keys.add((state, zip_code))
             stop_count = len(stop_keys)
 
+        route = load_get("route")
+        route_legs = load_get("route_legs")
         load = {
             "id": idx,
             "load_number": load_number,
             "status": STATUS_PROPOSED,
             "simulation_status": "SIMULATED",
             "build_source": "OPTIMIZED",
-            "trailer_type": stack_calculator.normalize_trailer_type(load_data.get("trailer_type"), default="STEP_DECK"),
-            "utilization_pct": float(metric.get("utilization_pct") or 0.0),
-            "estimated_miles": float(metric.get("estimated_miles") or 0.0),
-            "estimated_cost": float(metric.get("estimated_cost") or 0.0),
-            "rate_per_mile": float(load_data.get("rate_per_mile") or 0.0),
+            "trailer_type": normalize_trailer_type(load_get("trailer_type"), default="STEP_DECK"),
+            "utilization_pct": float(metric_get("utilization_pct") or 0.0),
+            "estimated_miles": float(metric_get("estimated_miles") or 0.0),
+            "estimated_cost": float(metric_get("estimated_cost") or 0.0),
+            "rate_per_mile": float(load_get("rate_per_mile") or 0.0),
             "stop_count": stop_count,
-            "return_to_origin": bool(load_data.get("return_to_origin")),
-            "return_miles": float(load_data.get("return_miles") or 0.0),
-            "return_cost": float(load_data.get("return_cost") or 0.0),
-            "origin_plant": (load_data.get("origin_plant") or metric.get("plant_code") or "").strip().upper(),
-            "destination_state": (load_data.get("destination_state") or "").strip().upper(),
-            "route": load_data.get("route") if isinstance(load_data.get("route"), list) else [],
-            "route_legs": load_data.get("route_legs") if isinstance(load_data.get("route_legs"), list) else [],
+            "return_to_origin": bool(load_get("return_to_origin")),
+            "return_miles": float(load_get("return_miles") or 0.0),
+            "return_cost": float(load_get("return_cost") or 0.0),
+            "origin_plant": (load_get("origin_plant") or metric_get("plant_code") or "").strip().upper(),
+            "destination_state": (load_get("destination_state") or "").strip().upper(),
+            "route": route if isinstance(route, list) else [],
+            "route_legs": route_legs if isinstance(route_legs, list) else [],
             "lines": lines,
         }
         load["freight_breakdown"] = _build_freight_breakdown(
@@ -12814,177 +13131,185 @@ def _build_replay_simulation_loads(load_metrics):
     return loads
 
 
+_REPLAY_NETWORK_HEADERS = (
+    "Replay Date / Period",
+    "Plants",
+    "Matched Orders",
+    "Missing Orders",
+    "Actual Loads",
+    "Actual Avg Util %",
+    "Actual Miles",
+    "Actual Cost",
+    "Optimized Loads",
+    "Optimized Avg Util %",
+    "Optimized Miles",
+    "Optimized Cost",
+    "Delta Loads",
+    "Delta Util Pts",
+    "Delta Miles",
+    "Delta Cost",
+    "Delta Cost %",
+    "Report Ref Cost",
+    "Report Ref Miles",
+)
+_REPLAY_PLANT_HEADERS = (
+    "Replay Date / Period",
+    "Plant",
+    "Report Rows",
+    "Report Loads",
+    "Report Orders",
+    "Matched Orders",
+    "Missing Orders",
+    "Actual Loads",
+    "Actual Avg Util %",
+    "Actual Miles",
+    "Actual Cost",
+    "Optimized Loads",
+    "Optimized Strategy",
+    "Optimized Avg Util %",
+    "Optimized Miles",
+    "Optimized Cost",
+    "Delta Loads",
+    "Delta Util Pts",
+    "Delta Miles",
+    "Delta Cost",
+    "Delta Cost %",
+    "Report Ref Cost",
+    "Report Ref Miles",
+    "Report Ref Avg Truck Use",
+)
+_REPLAY_ISSUES_HEADERS = (
+    "Replay Date / Period",
+    "Plant",
+    "Load Number",
+    "Order Number",
+    "Issue Type",
+    "Severity",
+    "Message",
+    "Meta JSON",
+)
+_REPLAY_METRICS_HEADERS = (
+    "Replay Date / Period",
+    "Plant",
+    "Scenario",
+    "Load Key",
+    "Order Count",
+    "Utilization %",
+    "Estimated Miles",
+    "Estimated Cost",
+    "Order Numbers JSON",
+)
+
+
+def _create_replay_sheet(workbook, title, headers):
+    # Write-only sheets only honour view/column settings made before the
+    # first row is streamed, so configure them up front.
+    sheet = workbook.create_sheet(title)
+    sheet.freeze_panes = "A2"
+    sheet.sheet_format.defaultColWidth = 18
+    sheet.append(headers)
+    return sheet
+
+
 def _build_replay_workbook(run, network_rows, day_rows, issues, load_metrics):
-    workbook = Workbook()
-    network_sheet = workbook.active
-    network_sheet.title = "Network Daily"
-    network_headers = [
-        "Replay Date / Period",
-        "Plants",
-        "Matched Orders",
-        "Missing Orders",
-        "Actual Loads",
-        "Actual Avg Util %",
-        "Actual Miles",
-        "Actual Cost",
-        "Optimized Loads",
-        "Optimized Avg Util %",
-        "Optimized Miles",
-        "Optimized Cost",
-        "Delta Loads",
-        "Delta Util Pts",
-        "Delta Miles",
-        "Delta Cost",
-        "Delta Cost %",
-        "Report Ref Cost",
-        "Report Ref Miles",
-    ]
-    network_sheet.append(network_headers)
+    workbook = Workbook(write_only=True)
+    network_sheet = _create_replay_sheet(workbook, "Network Daily", _REPLAY_NETWORK_HEADERS)
     for row in network_rows:
+        get = row.get
+        delta_cost_pct = get("delta_cost_pct")
         network_sheet.append(
-            [
-                row.get("date_created") or "",
-                int(row.get("plants") or 0),
-                int(row.get("matched_orders") or 0),
-                int(row.get("missing_orders") or 0),
-                int(row.get("actual_loads") or 0),
-                round(float(row.get("actual_avg_utilization") or 0.0), 2),
-                round(float(row.get("actual_total_miles") or 0.0), 2),
-                round(float(row.get("actual_total_cost") or 0.0), 2),
-                int(row.get("optimized_loads") or 0),
-                round(float(row.get("optimized_avg_utilization") or 0.0), 2),
-                round(float(row.get("optimized_total_miles") or 0.0), 2),
-                round(float(row.get("optimized_total_cost") or 0.0), 2),
-                int(row.get("delta_loads") or 0),
-                round(float(row.get("delta_avg_utilization") or 0.0), 2),
-                round(float(row.get("delta_total_miles") or 0.0), 2),
-                round(float(row.get("delta_total_cost") or 0.0), 2),
-                round(float(row.get("delta_cost_pct") or 0.0), 4) if row.get("delta_cost_pct") is not None else "",
-                round(float(row.get("report_ref_cost") or 0.0), 2),
-                round(float(row.get("report_ref_miles") or 0.0), 2),
-            ]
+            (
+                get("date_created") or "",
+                int(get("plants") or 0),
+                int(get("matched_orders") or 0),
+                int(get("missing_orders") or 0),
+                int(get("actual_loads") or 0),
+                round(float(get("actual_avg_utilization") or 0.0), 2),
+                round(float(get("actual_total_miles") or 0.0), 2),
+                round(float(get("actual_total_cost") or 0.0), 2),
+                int(get("optimized_loads") or 0),
+                round(float(get("optimized_avg_utilization") or 0.0), 2),
+                round(float(get("optimized_total_miles") or 0.0), 2),
+                round(float(get("optimized_total_cost") or 0.0), 2),
+                int(get("delta_loads") or 0),
+                round(float(get("delta_avg_utilization") or 0.0), 2),
+                round(float(get("delta_total_miles") or 0.0), 2),
+                round(float(get("delta_total_cost") or 0.0), 2),
+                round(float(delta_cost_pct or 0.0), 4) if delta_cost_pct is not None else "",
+                round(float(get("report_ref_cost") or 0.0), 2),
+                round(float(get("report_ref_miles") or 0.0), 2),
+            )
         )
 
-    plant_sheet = workbook.create_sheet("Plant Daily")
-    plant_headers = [
-        "Replay Date / Period",
-        "Plant",
-        "Report Rows",
-        "Report Loads",
-        "Report Orders",
-        "Matched Orders",
-        "Missing Orders",
-        "Actual Loads",
-        "Actual Avg Util %",
-        "Actual Miles",
-        "Actual Cost",
-        "Optimized Loads",
-        "Optimized Strategy",
-        "Optimized Avg Util %",
-        "Optimized Miles",
-        "Optimized Cost",
-        "Delta Loads",
-        "Delta Util Pts",
-        "Delta Miles",
-        "Delta Cost",
-        "Delta Cost %",
-        "Report Ref Cost",
-        "Report Ref Miles",
-        "Report Ref Avg Truck Use",
-    ]
-    plant_sheet.append(plant_headers)
+    plant_sheet = _create_replay_sheet(workbook, "Plant Daily", _REPLAY_PLANT_HEADERS)
     for row in day_rows:
+        get = row.get
+        delta_cost_pct = get("delta_cost_pct")
+        report_ref_cost = get("report_ref_cost")
+        report_ref_miles = get("report_ref_miles")
+        report_ref_avg_truck_use = get("report_ref_avg_truck_use")
         plant_sheet.append(
-            [
-                row.get("date_created") or "",
-                row.get("plant_code") or "",
-                int(row.get("report_rows") or 0),
-                int(row.get("report_loads") or 0),
-                int(row.get("report_orders") or 0),
-                int(row.get("matched_orders") or 0),
-                int(row.get("missing_orders") or 0),
-                int(row.get("actual_loads") or 0),
-                round(float(row.get("actual_avg_utilization") or 0.0), 2),
-                round(float(row.get("actual_total_miles") or 0.0), 2),
-                round(float(row.get("actual_total_cost") or 0.0), 2),
-                int(row.get("optimized_loads") or 0),
-                row.get("optimized_strategy") or "",
-                round(float(row.get("optimized_avg_utilization") or 0.0), 2),
-                round(float(row.get("optimized_total_miles") or 0.0), 2),
-                round(float(row.get("optimized_total_cost") or 0.0), 2),
-                int(row.get("delta_loads") or 0),
-                round(float(row.get("delta_avg_utilization") or 0.0), 2),
-                round(float(row.get("delta_total_miles") or 0.0), 2),
-                round(float(row.get("delta_total_cost") or 0.0), 2),
-                round(float(row.get("delta_cost_pct") or 0.0), 4) if row.get("delta_cost_pct") is not None else "",
-                round(float(row.get("report_ref_cost") or 0.0), 2) if row.get("report_ref_cost") is not None else "",
-                round(float(row.get("report_ref_miles") or 0.0), 2) if row.get("report_ref_miles") is not None else "",
-                round(float(row.get("report_ref_avg_truck_use") or 0.0), 2)
-                if row.get("report_ref_avg_truck_use") is not None
-                else "",
-            ]
+            (
+                get("date_created") or "",
+                get("plant_code") or "",
+                int(get("report_rows") or 0),
+                int(get("report_loads") or 0),
+                int(get("report_orders") or 0),
+                int(get("matched_orders") or 0),
+                int(get("missing_orders") or 0),
+                int(get("actual_loads") or 0),
+                round(float(get("actual_avg_utilization") or 0.0), 2),
+                round(float(get("actual_total_miles") or 0.0), 2),
+                round(float(get("actual_total_cost") or 0.0), 2),
+                int(get("optimized_loads") or 0),
+                get("optimized_strategy") or "",
+                round(float(get("optimized_avg_utilization") or 0.0), 2),
+                round(float(get("optimized_total_miles") or 0.0), 2),
+                round(float(get("optimized_total_cost") or 0.0), 2),
+                int(get("delta_loads") or 0),
+                round(float(get("delta_avg_utilization") or 0.0), 2),
+                round(float(get("delta_total_miles") or 0.0), 2),
+                round(float(get("delta_total_cost") or 0.0), 2),
+                round(float(delta_cost_pct or 0.0), 4) if delta_cost_pct is not None else "",
+                round(float(report_ref_cost or 0.0), 2) if report_ref_cost is not None else "",
+                round(float(report_ref_miles or 0.0), 2) if report_ref_miles is not None else "",
+                round(float(report_ref_avg_truck_use or 0.0), 2) if report_ref_avg_truck_use is not None else "",
+            )
         )
 
-    issues_sheet = workbook.create_sheet("Issues")
-    issues_sheet.append(
-        [
-            "Replay Date / Period",
-            "Plant",
-            "Load Number",
-            "Order Number",
-            "Issue Type",
-            "Severity",
-            "Message",
-            "Meta JSON",
-        ]
-    )
+    issues_sheet = _create_replay_sheet(workbook, "Issues", _REPLAY_ISSUES_HEADERS)
     for issue in issues:
+        get = issue.get
         issues_sheet.append(
-            [
-                issue.get("date_created") or "",
-                issue.get("plant_code") or "",
-                issue.get("load_number") or "",
-                issue.get("order_number") or "",
-                issue.get("issue_type") or "",
-                issue.get("severity") or "",
-                issue.get("message") or "",
-                issue.get("meta_json") or "",
-            ]
+            (
+                get("date_created") or "",
+                get("plant_code") or "",
+                get("load_number") or "",
+                get("order_number") or "",
+                get("issue_type") or "",
+                get("severity") or "",
+                get("message") or "",
+                get("meta_json") or "",
+            )
         )
 
-    metrics_sheet = workbook.create_sheet("Load Metrics")
-    metrics_sheet.append(
-        [
-            "Replay Date / Period",
-            "Plant",
-            "Scenario",
-            "Load Key",
-            "Order Count",
-            "Utilization %",
-            "Estimated Miles",
-            "Estimated Cost",
-            "Order Numbers JSON",
-        ]
-    )
+    metrics_sheet = _create_replay_sheet(workbook, "Load Metrics", _REPLAY_METRICS_HEADERS)
     for row in load_metrics:
+        get = row.get
         metrics_sheet.append(
-            [
-                row.get("date_created") or "",
-                row.get("plant_code") or "",
-                row.get("scenario") or "",
-                row.get("load_key") or "",
-                int(row.get("order_count") or 0),
-                round(float(row.get("utilization_pct") or 0.0), 2),
-                round(float(row.get("estimated_miles") or 0.0), 2),
-                round(float(row.get("estimated_cost") or 0.0), 2),
-                row.get("order_numbers_json") or "",
-            ]
+            (
+                get("date_created") or "",
+                get("plant_code") or "",
+                get("scenario") or "",
+                get("load_key") or "",
+                int(get("order_count") or 0),
+                round(float(get("utilization_pct") or 0.0), 2),
+                round(float(get("estimated_miles") or 0.0), 2),
+                round(float(get("estimated_cost") or 0.0), 2),
+                get("order_numbers_json") or "",
+            )
         )
 
-    for sheet in workbook.worksheets:
-        sheet.freeze_panes = "A2"
-        for idx, _ in enumerate(sheet[1], start=1):
-            sheet.column_dimensions[chr(64 + min(idx, 26))].width = 18
     return workbook
 
 
@@ -13055,18 +13380,19 @@ def _planning_sessions_redirect_args(filters):
 
 
 def _session_plant_scope(session_id):
-    plants = set()
     if not session_id:
         return []
+    return _plant_scope_from_codes(db.list_session_plant_codes(session_id))
 
-    planning_session = db.get_planning_session(session_id)
-    if planning_session:
-        plant_code = _normalize_plant_code(planning_session.get("plant_code"))
-        if plant_code in PLANT_CODES:
-            plants.add(plant_code)
 
-    for load in db.list_loads(None, session_id=session_id):
-        plant_code = _normalize_plant_code(load.get("origin_plant"))
+def _plant_scope_from_codes(plant_codes):
+    plants = set()
+    plant_code = _normalize_plant_code(plant_codes["session"])
+    if plant_code in PLANT_CODES:
+        plants.add(plant_code)
+
+    for origin_plant in plant_codes["loads"]:
+        plant_code = _normalize_plant_code(origin_plant)
         if plant_code:
             plants.add(plant_code)
 
@@ -13101,6 +13427,24 @@ def _archive_session_and_release_loads(session_id):
     return True
 
 
+def _archive_sessions_and_release_loads(planning_sessions):
+    session_ids = [entry.get("id") for entry in planning_sessions if entry.get("id")]
+    if not session_ids:
+        return 0
+    live_session_ids = [
+        entry.get("id")
+        for entry in planning_sessions
+        if entry.get("id") and not bool(entry.get("is_sandbox"))
+    ]
+    plants = set()
+    for plant_codes in db.list_session_plant_codes_for_ids(live_session_ids).values():
+        plants.update(_plant_scope_from_codes(plant_codes))
+    db.archive_planning_sessions(session_ids, reintroduce_plants=sorted(plants))
+    if _get_active_planning_session_id() in session_ids:
+        _set_active_planning_session_id(None)
+    return len(session_ids)
+
+
 def _release_draft_loads_for_session(session_id):
     if not session_id:
         return []
@@ -13175,6 +13519,16 @@ def _auto_release_stale_unplanned_sessions(reference_day=None):
     }
 
 
+def _rollup_order_sort_key(entry):
+    # Rollup and report order entries always carry these keys, so index them
+    # directly; undated orders sort last.
+    return (entry["due_date"] or "9999-12-31", entry["so_num"])
+
+
+def _report_order_sort_key(entry):
+    return (entry["stop_order"] or 999, entry["due_date"] or "9999-12-31", entry["so_num"])
+
+
 def _build_planning_session_rollup(loads):
     load_summaries = []
     order_map = {}
@@ -13184,67 +13538,53 @@ def _build_planning_session_rollup(loads):
         stop_keys = set()
         load_order_map = {}
         total_feet = 0.0
+        load_number = load.get("load_number") or f"Load #{load.get('id')}"
 
         for line in lines:
-            so_num = (line.get("so_num") or "").strip()
+            line_get = line.get
+            so_num = (line_get("so_num") or "").strip()
             if not so_num:
                 continue
 
-            total_feet += float(line.get("total_length_ft") or line.get("line_total_feet") or 0)
-            state = (line.get("state") or "").strip().upper()
-            zip_code = (line.get("zip") or "").strip()
-            stop_keys.add(f"{state}|{zip_code}")
+            line_length = float(line_get("total_length_ft") or line_get("line_total_feet") or 0)
+            total_feet += line_length
+            state = (line_get("state") or "").strip().upper()
+            zip_code = (line_get("zip") or "").strip()
+            stop_keys.add((state, zip_code))
 
-            line_due = _parse_date(line.get("due_date"))
-            due_label = line_due.isoformat() if line_due else (line.get("due_date") or "")
-            line_qty = float(line.get("qty") or 0)
-            line_length = float(line.get("total_length_ft") or line.get("line_total_feet") or 0)
+            raw_due = line_get("due_date")
+            line_due = _parse_date(raw_due)
+            line_qty = float(line_get("qty") or 0)
 
             load_order = load_order_map.get(so_num)
-            if not load_order:
-                load_order = {
-                    "so_num": so_num,
-                    "cust_name": (line.get("cust_name") or "").strip(),
-                    "state": state,
-                    "city": (line.get("city") or "").strip(),
-                    "zip": zip_code,
-                    "due_date": due_label,
-                    "due_date_obj": line_due,
-                    "line_count": 0,
-                    "total_qty": 0.0,
-                    "total_length_ft": 0.0,
-                }
-                load_order_map[so_num] = load_order
-            load_order["line_count"] += 1
-            load_order["total_qty"] += line_qty
-            load_order["total_length_ft"] += line_length
-            if line_due and (not load_order.get("due_date_obj") or line_due < load_order["due_date_obj"]):
-                load_order["due_date_obj"] = line_due
-                load_order["due_date"] = line_due.isoformat()
-
             session_order = order_map.get(so_num)
-            if not session_order:
-                session_order = {
+            if load_order is None or session_order is None:
+                # Both rollups seed an order from its first line the same way.
+                base_order = {
                     "so_num": so_num,
-                    "cust_name": (line.get("cust_name") or "").strip(),
+                    "cust_name": (line_get("cust_name") or "").strip(),
                     "state": state,
-                    "city": (line.get("city") or "").strip(),
+                    "city": (line_get("city") or "").strip(),
                     "zip": zip_code,
-                    "due_date": due_label,
+                    "due_date": line_due.isoformat() if line_due else (raw_due or ""),
                     "due_date_obj": line_due,
                     "line_count": 0,
                     "total_qty": 0.0,
                     "total_length_ft": 0.0,
-                    "loads": set(),
                 }
-                order_map[so_num] = session_order
-            session_order["line_count"] += 1
-            session_order["total_qty"] += line_qty
-            session_order["total_length_ft"] += line_length
-            if line_due and (not session_order.get("due_date_obj") or line_due < session_order["due_date_obj"]):
-                session_order["due_date_obj"] = line_due
-                session_order["due_date"] = line_due.isoformat()
-            load_number = load.get("load_number") or f"Load #{load.get('id')}"
+                if load_order is None:
+                    load_order = load_order_map[so_num] = dict(base_order)
+                if session_order is None:
+                    session_order = order_map[so_num] = base_order
+                    base_order["loads"] = set()
+
+            for order_entry in (load_order, session_order):
+                order_entry["line_count"] += 1
+                order_entry["total_qty"] += line_qty
+                order_entry["total_length_ft"] += line_length
+                if line_due and (not order_entry["due_date_obj"] or line_due < order_entry["due_date_obj"]):
+                    order_entry["due_date_obj"] = line_due
+                    order_entry["due_date"] = line_due.isoformat()
             session_order["loads"].add(load_number)
 
         load_orders = []
@@ -13253,12 +13593,12 @@ def _build_planning_session_rollup(loads):
             entry["total_qty"] = round(entry["total_qty"], 1)
             entry["total_length_ft"] = round(entry["total_length_ft"], 1)
             load_orders.append(entry)
-        load_orders.sort(key=lambda entry: (entry.get("due_date") or "9999-12-31", entry.get("so_num") or ""))
+        load_orders.sort(key=_rollup_order_sort_key)
 
         load_summaries.append(
             {
                 "id": load.get("id"),
-                "load_number": load.get("load_number") or f"Load #{load.get('id')}",
+                "load_number": load_number,
                 "status": (load.get("status") or "PROPOSED").upper(),
                 "trailer_type": stack_calculator.normalize_trailer_type(load.get("trailer_type"), default="STEP_DECK"),
                 "utilization_pct": round(float(load.get("utilization_pct") or 0), 1),
@@ -13287,7 +13627,7 @@ def _build_planning_session_rollup(loads):
         entry["total_qty"] = round(entry["total_qty"], 1)
         entry["total_length_ft"] = round(entry["total_length_ft"], 1)
         session_orders.append(entry)
-    session_orders.sort(key=lambda entry: (entry.get("due_date") or "9999-12-31", entry.get("so_num") or ""))
+    session_orders.sort(key=_rollup_order_sort_key)
 
     return {
         "loads": load_summaries,
@@ -13296,14 +13636,24 @@ def _build_planning_session_rollup(loads):
 
 
 def _build_load_report_rows(loads):
-    sku_specs = {spec["sku"]: spec for spec in db.list_sku_specs()}
+    sku_specs = _get_sku_spec_map()
     zip_coords = geo_utils.load_zip_coordinates()
     stop_color_palette = _get_stop_color_palette()
+    # A report only mixes a handful of trailer types; resolve each once.
+    trailer_contexts = {}
     rows = []
 
     for load in loads or []:
         lines = load.get("lines") or []
-        trailer_type = stack_calculator.normalize_trailer_type(load.get("trailer_type"), default="STEP_DECK")
+        raw_trailer_type = load.get("trailer_type")
+        trailer_context = trailer_contexts.get(raw_trailer_type)
+        if trailer_context is None:
+            resolved_type = stack_calculator.normalize_trailer_type(raw_trailer_type, default="STEP_DECK")
+            trailer_context = trailer_contexts[raw_trailer_type] = (
+                resolved_type,
+                _trailer_config_for_type(resolved_type),
+            )
+        trailer_type, trailer_config = trailer_context
         ordered_stops = _ordered_stops_for_lines(lines, load.get("origin_plant"), zip_coords)
         ordered_stops = _apply_route_stop_order(ordered_stops, load=load)
         ordered_stops = _apply_load_route_direction(ordered_stops, load=load)
@@ -13337,7 +13687,6 @@ def _build_load_report_rows(loads):
             trailer_type,
             stop_sequence_map=stop_sequence_map,
         )
-        trailer_config = _trailer_config_for_type(trailer_type)
         schematic = dict(schematic or {})
         schematic.setdefault("positions", [])
         schematic.setdefault("warnings", [])
@@ -13361,51 +13710,54 @@ def _build_load_report_rows(loads):
 
         order_map = {}
         customers = set()
-        for idx, line in enumerate(lines):
-            so_num = _normalize_order_identifier(line.get("so_num"), fallback=f"UNASSIGNED-{idx + 1}")
-            state = (line.get("state") or "").strip().upper()
-            city = (line.get("city") or "").strip()
-            zip_code = (line.get("zip") or "").strip()
-            cust_name = (line.get("cust_name") or "").strip()
-            stop_order = stop_sequence_map.get(_stop_key_for_line(line))
-            due_obj = _parse_date(line.get("due_date"))
-            due_label = due_obj.isoformat() if due_obj else (line.get("due_date") or "")
-            qty = float(line.get("qty") or 0)
-            line_length = float(line.get("total_length_ft") or line.get("line_total_feet") or 0)
+        line_stop_orders = [stop_sequence_map.get(_stop_key_for_line(line)) for line in lines]
+        for idx, (line, stop_order) in enumerate(zip(lines, line_stop_orders)):
+            line_get = line.get
+            so_num = _normalize_order_identifier(line_get("so_num"), fallback=f"UNASSIGNED-{idx + 1}")
+            state = (line_get("state") or "").strip().upper()
+            city = (line_get("city") or "").strip()
+            zip_code = (line_get("zip") or "").strip()
+            cust_name = (line_get("cust_name") or "").strip()
+            raw_due = line_get("due_date")
+            due_obj = _parse_date(raw_due)
+            qty = float(line_get("qty") or 0)
+            line_length = float(line_get("total_length_ft") or line_get("line_total_feet") or 0)
             if cust_name:
                 customers.add(cust_name)
 
             entry = order_map.get(so_num)
-            if not entry:
-                entry = {
+            if entry is None:
+                order_map[so_num] = {
                     "so_num": so_num,
                     "cust_name": cust_name,
                     "state": state,
                     "city": city,
                     "zip": zip_code,
-                    "due_date": due_label,
+                    "due_date": due_obj.isoformat() if due_obj else (raw_due or ""),
                     "due_date_obj": due_obj,
                     "stop_order": stop_order,
-                    "line_count": 0,
-                    "total_qty": 0.0,
-                    "total_length_ft": 0.0,
+                    "line_count": 1,
+                    "total_qty": qty,
+                    "total_length_ft": line_length,
                 }
-                order_map[so_num] = entry
+                continue
+
+            # Repeat lines for an order only add to the totals and fill gaps.
             entry["line_count"] += 1
             entry["total_qty"] += qty
             entry["total_length_ft"] += line_length
-            if stop_order and (not entry.get("stop_order") or stop_order < entry["stop_order"]):
+            if stop_order and (not entry["stop_order"] or stop_order < entry["stop_order"]):
                 entry["stop_order"] = stop_order
-            if due_obj and (not entry.get("due_date_obj") or due_obj < entry["due_date_obj"]):
+            if due_obj and (not entry["due_date_obj"] or due_obj < entry["due_date_obj"]):
                 entry["due_date_obj"] = due_obj
                 entry["due_date"] = due_obj.isoformat()
-            if not entry.get("cust_name") and cust_name:
+            if cust_name and not entry["cust_name"]:
                 entry["cust_name"] = cust_name
-            if not entry.get("city") and city:
+            if city and not entry["city"]:
                 entry["city"] = city
-            if not entry.get("state") and state:
+            if state and not entry["state"]:
                 entry["state"] = state
-            if not entry.get("zip") and zip_code:
+            if zip_code and not entry["zip"]:
                 entry["zip"] = zip_code
 
         ship_date_obj = None
@@ -13415,20 +13767,16 @@ def _build_load_report_rows(loads):
             if due_obj and (not ship_date_obj or due_obj < ship_date_obj):
                 ship_date_obj = due_obj
             order_rows.append(order)
-        order_rows.sort(
-            key=lambda entry: (
-                int(entry.get("stop_order") or 999),
-                entry.get("due_date") or "9999-12-31",
-                entry.get("so_num") or "",
-            )
-        )
+        order_rows.sort(key=_report_order_sort_key)
         order_colors = _build_order_colors_for_lines(
             lines,
             stop_sequence_map=stop_sequence_map,
             stop_palette=stop_color_palette,
+            line_stop_sequences=line_stop_orders,
         )
 
         early_orders = []
+        total_units = 0.0
         for order in order_rows:
             due_obj = order.pop("due_date_obj", None)
             early_days = (due_obj - ship_date_obj).days if due_obj and ship_date_obj else 0
@@ -13436,6 +13784,7 @@ def _build_load_report_rows(loads):
             order["is_early_delivery"] = order["early_days"] > 0
             order["early_flag"] = "YES" if order["is_early_delivery"] else "NO"
             order["total_qty"] = round(order["total_qty"], 1)
+            total_units += order["total_qty"]
             order["total_length_ft"] = round(order["total_length_ft"], 1)
             order["stop_order_display"] = (
                 f"{int(order.get('stop_order')):02d}" if order.get("stop_order") else "--"
@@ -13449,12 +13798,20 @@ def _build_load_report_rows(loads):
             if order["is_early_delivery"]:
                 early_orders.append(order)
 
+        deck_positions = {"lower": [], "upper": []}
+        for pos in schematic.get("positions") or []:
+            deck_key = pos.get("deck") or "lower"
+            if deck_key in deck_positions:
+                deck_positions[deck_key].append(pos)
+
         deck_blocks = {"lower": [], "upper": []}
-        for deck_key in ("lower", "upper"):
-            positions = [
-                pos for pos in (schematic.get("positions") or [])
-                if (pos.get("deck") or "lower") == deck_key
-            ]
+        schematic_segments = []
+        for deck_key, deck_title in (("lower", "Lower"), ("upper", "Upper")):
+            positions = deck_positions[deck_key]
+            if not positions:
+                continue
+            blocks = deck_blocks[deck_key]
+            summary_parts = []
             total_length = sum(float(pos.get("length_ft") or 0) for pos in positions) or 1.0
             for pos in positions:
                 length_ft = float(pos.get("length_ft") or 0)
@@ -13471,32 +13828,17 @@ def _build_load_report_rows(loads):
                 else:
                     label = "Open"
                 width_pct = max((length_ft / total_length) * 100.0, 8.0) if length_ft else 8.0
-                deck_blocks[deck_key].append(
+                rounded_length = round(length_ft, 1)
+                blocks.append(
                     {
-                        "length_ft": round(length_ft, 1),
+                        "length_ft": rounded_length,
                         "order_ids": order_ids,
                         "label": label,
                         "width_pct": round(width_pct, 1),
                     }
                 )
-
-        schematic_segments = []
-        if deck_blocks["lower"]:
-            lower_summary = " > ".join(
-                [
-                    f"{block['label']} ({block['length_ft']:.1f} ft)"
-                    for block in deck_blocks["lower"]
-                ]
-            )
-            schematic_segments.append(f"Lower: {lower_summary}")
-        if deck_blocks["upper"]:
-            upper_summary = " > ".join(
-                [
-                    f"{block['label']} ({block['length_ft']:.1f} ft)"
-                    for block in deck_blocks["upper"]
-                ]
-            )
-            schematic_segments.append(f"Upper: {upper_summary}")
+                summary_parts.append(f"{label} ({rounded_length:.1f} ft)")
+            schematic_segments.append(f"{deck_title}: {' > '.join(summary_parts)}")
 
         early_callout = ""
         if early_orders:
@@ -13516,11 +13858,10 @@ def _build_load_report_rows(loads):
             if route_city or route_state
             else (load.get("destination_state") or "--")
         )
-        unique_cities = sorted({city for city in route_cities if city})
-        if len(unique_cities) > 1:
-            route_label = f"{route_label} (+{len(unique_cities) - 1} more)"
-
-        total_units = sum((order.get("total_qty") or 0) for order in order_rows)
+        # route_cities already excludes blanks; only the distinct count matters.
+        unique_city_count = len(set(route_cities))
+        if unique_city_count > 1:
+            route_label = f"{route_label} (+{unique_city_count - 1} more)"
 
         rows.append(
             {
@@ -13608,28 +13949,29 @@ def _sync_load_utilization_from_report_rows(loads, report_rows, persist=True):
             db.update_load_utilization_pct(load_id, new_util)
 
 
+def _load_report_preview_entry(load, idx, order):
+    return {
+        "load_id": load.get("load_number") or load.get("display_load_id") or "",
+        "stop_order": order.get("stop_order_display") or "--",
+        "so_number": order.get("so_num") or "",
+        "customer_name": order.get("cust_name") or "",
+        "destination_city": order.get("city") or "",
+        "state": order.get("state") or "",
+        "ship_date": load.get("ship_date") or "",
+        "due_date": order.get("due_date") or "",
+        "total_units": order.get("total_qty") or 0,
+        "early_flag": order.get("early_flag") or "NO",
+        "is_group_start": idx == 0,
+    }
+
+
 def _build_load_report_preview_rows(report_rows, limit=8):
-    preview = []
-    for load in report_rows or []:
-        for idx, order in enumerate(load.get("orders") or []):
-            preview.append(
-                {
-                    "load_id": load.get("load_number") or load.get("display_load_id") or "",
-                    "stop_order": order.get("stop_order_display") or "--",
-                    "so_number": order.get("so_num") or "",
-                    "customer_name": order.get("cust_name") or "",
-                    "destination_city": order.get("city") or "",
-                    "state": order.get("state") or "",
-                    "ship_date": load.get("ship_date") or "",
-                    "due_date": order.get("due_date") or "",
-                    "total_units": order.get("total_qty") or 0,
-                    "early_flag": order.get("early_flag") or "NO",
-                    "is_group_start": idx == 0,
-                }
-            )
-            if len(preview) >= limit:
-                return preview
-    return preview
+    entries = (
+        _load_report_preview_entry(load, idx, order)
+        for load in report_rows or []
+        for idx, order in enumerate(load.get("orders") or [])
+    )
+    return list(islice(entries, max(int(limit), 0)))
 
 
 def _hex_to_rgb_tuple(hex_value, fallback):
@@ -13639,34 +13981,31 @@ def _hex_to_rgb_tuple(hex_value, fallback):
     if len(raw) != 6:
         return fallback
     try:
-        return tuple(int(raw[idx:idx + 2], 16) for idx in (0, 2, 4))
+        rgb = bytes.fromhex(raw)
     except ValueError:
         return fallback
+    # fromhex tolerates spaces between byte pairs; only a full triple counts.
+    return tuple(rgb) if len(rgb) == 3 else fallback
 
 
 def _blend_rgb(base_rgb, target_rgb, ratio):
     ratio = max(0.0, min(float(ratio), 1.0))
-    return tuple(
-        int(base_rgb[idx] + (target_rgb[idx] - base_rgb[idx]) * ratio)
-        for idx in range(3)
+    base_r, base_g, base_b = base_rgb
+    target_r, target_g, target_b = target_rgb
+    return (
+        int(base_r + (target_r - base_r) * ratio),
+        int(base_g + (target_g - base_g) * ratio),
+        int(base_b + (target_b - base_b) * ratio),
     )
 
 
-def _measure_text(draw_ctx, text):
-    try:
-        left, top, right, bottom = draw_ctx.textbbox((0, 0), text)
-        return max(right - left, 1), max(bottom - top, 1)
-    except AttributeError:
-        return draw_ctx.textsize(text)
-
-
-
-
+@lru_cache(maxsize=512)
 def _hex_to_excel_argb(hex_color, fallback="#94A3B8"):
     normalized = _normalize_hex_color(hex_color, fallback)
     return f"FF{normalized.lstrip('#')}"
 
 
+@lru_cache(maxsize=512)
 def _lighten_hex_color(hex_color, ratio=0.84):
     base_rgb = _hex_to_rgb_tuple(_normalize_hex_color(hex_color, "#94A3B8"), (148, 163, 184))
     lighter = _blend_rgb(base_rgb, (255, 255, 255), ratio)
@@ -13689,8 +14028,9 @@ def _build_load_sheet_stops(load):
     stops_by_key = {}
     for line in lines:
         key = _stop_key_for_line(line)
-        if key not in stops_by_key:
-            stops_by_key[key] = {
+        stop = stops_by_key.get(key)
+        if stop is None:
+            stop = stops_by_key[key] = {
                 "stop_key": key,
                 "stop_order": None,
                 "state": (line.get("state") or "").strip().upper(),
@@ -13704,7 +14044,6 @@ def _build_load_sheet_stops(load):
                 "sku_rollups": {},
             }
 
-        stop = stops_by_key[key]
         customer = (line.get("cust_name") or "").strip()
         if customer and customer not in stop["customers"]:
             stop["customers"].append(customer)
@@ -13728,13 +14067,13 @@ def _build_load_sheet_stops(load):
             stop["sku_entries"].append(entry)
         if descriptor:
             rollup = stop["sku_rollups"].get(descriptor)
-            if not rollup:
+            if rollup is None:
                 stop["sku_rollups"][descriptor] = {
                     "sku": descriptor,
-                    "qty": float(qty_value or 0),
+                    "qty": qty_value,
                 }
             else:
-                rollup["qty"] = float(rollup.get("qty") or 0) + float(qty_value or 0)
+                rollup["qty"] += qty_value
 
     order_stops = {}
     for order in load.get("orders") or []:
@@ -13765,15 +14104,14 @@ def _build_load_sheet_stops(load):
     return stop_rows
 
 
+@lru_cache(maxsize=512)
 def _color_luminance(hex_color):
-    raw = _normalize_hex_color(hex_color, "#94A3B8").lstrip("#")
-    r = int(raw[0:2], 16)
-    g = int(raw[2:4], 16)
-    b = int(raw[4:6], 16)
+    r, g, b = bytes.fromhex(_normalize_hex_color(hex_color, "#94A3B8")[1:])
     return (0.299 * r) + (0.587 * g) + (0.114 * b)
 
 
 def _expand_schematic_units_for_position(position):
+    """One ``(label, stop_sequence)`` tuple per unit on the position."""
     expanded = []
     for item in position.get("items") or []:
         units = max(_coerce_int_value(item.get("units"), 0), 0)
@@ -13781,16 +14119,45 @@ def _expand_schematic_units_for_position(position):
             continue
         label = (item.get("sku") or item.get("item") or "SKU").strip() or "SKU"
         stop_sequence = _coerce_int_value(item.get("stop_sequence"), 0)
-        for _ in range(units):
-            expanded.append(
-                {
-                    "label": label,
-                    "stop_sequence": stop_sequence,
-                }
-            )
+        expanded.extend([(label, stop_sequence)] * units)
     return expanded
 
 
+# (header fill, value fill, value number format) for each load sheet meta
+# column, Start ZIP through Must Ship By.
+_LOAD_SHEET_META_COLUMN_STYLES = (
+    ("FFF8FAFC", None, None),
+    ("FFF8FAFC", None, None),
+    ("FFF8FAFC", None, None),
+    ("FFF8FAFC", None, None),
+    ("FFF8FAFC", None, None),
+    ("FFF8FAFC", None, None),
+    ("FFF8FAFC", None, "$#,##0.00"),
+    ("FFFFEB99", "FFFFF3BF", None),
+)
+
+
+@lru_cache(maxsize=256)
+def _solid_fill(argb):
+    return PatternFill(fill_type="solid", fgColor=argb)
+
+
+def _build_load_sheet_borders(medium_side, thin_side):
+    """Map (left, right, top, bottom) medium-edge flags to a shared Border."""
+    return {
+        (left, right, top, bottom): Border(
+            left=medium_side if left else thin_side,
+            right=medium_side if right else thin_side,
+            top=medium_side if top else thin_side,
+            bottom=medium_side if bottom else thin_side,
+        )
+        for left in (False, True)
+        for right in (False, True)
+        for top in (False, True)
+        for bottom in (False, True)
+    }
+
+
 def _write_load_sheet_schematic_grid(
     ws,
     start_row,
@@ -13798,12 +14165,25 @@ def _write_load_sheet_schematic_grid(
     stop_palette,
     medium_side,
     thin_side,
+    borders=None,
 ):
     schematic = load.get("schematic") or {}
     positions = list(schematic.get("positions") or [])
     if not positions:
         return start_row
 
+    if borders is None:
+        borders = _build_load_sheet_borders(medium_side, thin_side)
+    title_font = Font(bold=True, color="FF334155")
+    stack_font = Font(bold=True, color="FF475569")
+    unit_light_font = Font(bold=True, color="FFFFFFFF")
+    unit_dark_font = Font(bold=True, color="FF0F172A")
+    left_align = Alignment(horizontal="left", vertical="center")
+    center_align = Alignment(horizontal="center", vertical="center")
+    header_fill = _solid_fill("FFF8FAFC")
+    # stop_sequence -> (fill, font) for unit cells, filled on first use.
+    unit_styles = {}
+
     deck_groups = [
         ("upper", "Upper Deck"),
         ("lower", "Lower Deck"),
@@ -13811,6 +14191,15 @@ def _write_load_sheet_schematic_grid(
     columns = list(range(1, 9))
     chunk_size = len(columns)
     row_cursor = start_row
+    # (col_idx, inner-row border, legend-row border) resolved once per grid.
+    column_borders = [
+        (
+            col_idx,
+            borders[(col_idx == 1, col_idx == columns[-1], False, False)],
+            borders[(col_idx == 1, col_idx == columns[-1], False, True)],
+        )
+        for col_idx in columns
+    ]
 
     for deck_key, deck_label in deck_groups:
         deck_positions = [pos for pos in positions if (pos.get("deck") or "lower") == deck_key]
@@ -13819,8 +14208,8 @@ def _write_load_sheet_schematic_grid(
 
         ws.merge_cells(start_row=row_cursor, start_column=1, end_row=row_cursor, end_column=8)
         title_cell = ws.cell(row=row_cursor, column=1, value=f"{deck_label} Stacking Schematic")
-        title_cell.font = Font(bold=True, color="FF334155")
-        title_cell.alignment = Alignment(horizontal="left", vertical="center")
+        title_cell.font = title_font
+        title_cell.alignment = left_align
         row_cursor += 1
 
         position_chunks = [deck_positions[idx : idx + chunk_size] for idx in range(0, len(deck_positions), chunk_size)]
@@ -13831,74 +14220,81 @@ def _write_load_sheet_schematic_grid(
 
             # Stack/position row
             ws.row_dimensions[row_cursor].height = 20
-            for col_idx in columns:
+            for col_idx, inner_border, _legend_border in column_borders:
                 cell = ws.cell(row=row_cursor, column=col_idx, value="")
                 if col_idx <= len(chunk):
                     cell.value = f"Stack {col_idx}"
-                cell.font = Font(bold=True, color="FF475569")
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-                cell.fill = PatternFill(fill_type="solid", fgColor="FFF8FAFC")
-                cell.border = Border(
-                    left=medium_side if col_idx == 1 else thin_side,
-                    right=medium_side if col_idx == columns[-1] else thin_side,
-                    top=thin_side,
-                    bottom=thin_side,
-                )
+                cell.font = stack_font
+                cell.alignment = center_align
+                cell.fill = header_fill
+                cell.border = inner_border
             row_cursor += 1
 
-            # Unit cells (one SKU per cell), bottom-aligned within each stack.
+            # Unit cells (one SKU per cell), bottom-aligned within each stack
+            # by padding every column with leading blanks up to max_stack.
+            stack_columns = [[None] * (max_stack - len(col_units)) + col_units for col_units in expanded_columns]
+            stack_columns += [[None] * max_stack] * (len(columns) - len(stack_columns))
             for stack_row in range(max_stack):
                 excel_row = row_cursor + stack_row
                 ws.row_dimensions[excel_row].height = 22
-                for col_idx in columns:
+                for (col_idx, inner_border, _legend_border), col_units in zip(column_borders, stack_columns):
+                    # Empty slots keep the grid border so each stack reads as a box.
                     cell = ws.cell(row=excel_row, column=col_idx, value="")
-                    cell.alignment = Alignment(horizontal="center", vertical="center")
-                    cell.border = Border(
-                        left=medium_side if col_idx == 1 else thin_side,
-                        right=medium_side if col_idx == columns[-1] else thin_side,
-                        top=thin_side,
-                        bottom=thin_side,
-                    )
-                    if col_idx > len(expanded_columns):
+                    cell.alignment = center_align
+                    cell.border = inner_border
+                    unit = col_units[stack_row]
+                    if unit is None:
                         continue
-                    col_units = expanded_columns[col_idx - 1]
-                    blank_lead = max_stack - len(col_units)
-                    unit_idx = stack_row - blank_lead
-                    if unit_idx < 0 or unit_idx >= len(col_units):
-                        continue
-                    unit = col_units[unit_idx]
-                    stop_sequence = _coerce_int_value(unit.get("stop_sequence"), 0)
-                    stop_color = _color_for_stop_sequence(stop_sequence, stop_palette)
-                    cell.value = unit.get("label") or "SKU"
-                    cell.fill = PatternFill(fill_type="solid", fgColor=_hex_to_excel_argb(stop_color, fallback="#94A3B8"))
-                    text_color = "FFFFFFFF" if _color_luminance(stop_color) < 138 else "FF0F172A"
-                    cell.font = Font(bold=True, color=text_color)
+                    label, stop_sequence = unit
+                    unit_style = unit_styles.get(stop_sequence)
+                    if unit_style is None:
+                        stop_color = _color_for_stop_sequence(stop_sequence, stop_palette)
+                        unit_style = (
+                            _solid_fill(_hex_to_excel_argb(stop_color, fallback="#94A3B8")),
+                            unit_light_font if _color_luminance(stop_color) < 138 else unit_dark_font,
+                        )
+                        unit_styles[stop_sequence] = unit_style
+                    cell.value = label
+                    cell.fill, cell.font = unit_style
             row_cursor += max_stack
 
             # Stop-sequence legend row aligned to stacks.
             ws.row_dimensions[row_cursor].height = 19
-            for col_idx in columns:
+            for col_idx, _inner_border, legend_border in column_borders:
                 legend = ws.cell(row=row_cursor, column=col_idx, value="")
-                legend.alignment = Alignment(horizontal="center", vertical="center")
-                legend.border = Border(
-                    left=medium_side if col_idx == 1 else thin_side,
-                    right=medium_side if col_idx == columns[-1] else thin_side,
-                    top=thin_side,
-                    bottom=medium_side,
-                )
-                legend.fill = PatternFill(fill_type="solid", fgColor="FFF8FAFC")
+                legend.alignment = center_align
+                legend.border = legend_border
+                legend.fill = header_fill
                 if col_idx > len(expanded_columns):
                     continue
                 col_units = expanded_columns[col_idx - 1]
-                top_sequence = _coerce_int_value((col_units[-1] if col_units else {}).get("stop_sequence"), 0)
+                top_sequence = col_units[-1][1] if col_units else 0
                 if top_sequence > 0:
                     legend.value = f"Stop {top_sequence}"
-                    legend.font = Font(bold=True, color="FF334155")
+                    legend.font = title_font
             row_cursor += 1
             row_cursor += 1
     return row_cursor
 
 
+def _load_sheet_route_values(stop_data):
+    """Cell values for one stop column, in route row order (Route .. SKU / SO)."""
+    stop_sequence = int(stop_data.get("stop_order") or 0)
+    customers = stop_data.get("customers") or []
+    return (
+        f"Stop {stop_sequence}",
+        stop_sequence,
+        ", ".join(customers[:2]) + (f" (+{len(customers)-2})" if len(customers) > 2 else ""),
+        stop_data.get("address") or "(address unavailable)",
+        stop_data.get("city") or "",
+        stop_data.get("state") or "",
+        stop_data.get("zip") or "",
+        "(blank)",
+        "COT Stickers",
+        "\n".join((stop_data.get("sku_entries") or [])[:8]),
+    )
+
+
 def _write_load_sheet_block(
     ws,
     start_row,
@@ -13912,6 +14308,11 @@ def _write_load_sheet_block(
     columns = list(range(1, 9))
     has_medium_right_col = columns[-1]
     route_stops = _build_load_sheet_stops(load)
+    borders = _build_load_sheet_borders(medium_side, thin_side)
+    title_font = Font(bold=True, color="FF1F2937")
+    stop_label_font = Font(bold=True, color="FF1E293B")
+    center_align = Alignment(horizontal="center", vertical="center")
+    center_wrap_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
 
     start_zip = route_stops[0].get("zip") if route_stops else ""
     stop_zip = route_stops[-1].get("zip") if route_stops else ""
@@ -13952,41 +14353,27 @@ def _write_load_sheet_block(
 
     for col_idx in columns:
         cell = ws.cell(row=start_row, column=col_idx, value=load_title_values[col_idx - 1])
-        cell.font = Font(bold=True, color="FF1F2937")
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-        cell.fill = PatternFill(fill_type="solid", fgColor="FFE5E7EB")
-        cell.border = Border(
-            left=medium_side if col_idx == 1 else thin_side,
-            right=medium_side if col_idx == has_medium_right_col else thin_side,
-            top=medium_side,
-            bottom=medium_side,
-        )
+        cell.font = title_font
+        cell.alignment = center_align
+        cell.fill = _solid_fill("FFE5E7EB")
+        cell.border = borders[(col_idx == 1, col_idx == has_medium_right_col, True, True)]
 
     for col_idx in columns:
         header = ws.cell(row=start_row + 1, column=col_idx, value=meta_headers[col_idx - 1])
+        edge_border = borders[(col_idx == 1, col_idx == has_medium_right_col, False, False)]
         header.font = header_font
-        header.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-        header.fill = PatternFill(fill_type="solid", fgColor="FFF8FAFC")
-        header.border = Border(
-            left=medium_side if col_idx == 1 else thin_side,
-            right=medium_side if col_idx == has_medium_right_col else thin_side,
-            top=thin_side,
-            bottom=thin_side,
-        )
+        header.alignment = center_wrap_align
+        header_argb, value_argb, value_number_format = _LOAD_SHEET_META_COLUMN_STYLES[col_idx - 1]
+        header.fill = _solid_fill(header_argb)
+        header.border = edge_border
         value_cell = ws.cell(row=start_row + 2, column=col_idx, value=meta_values[col_idx - 1])
         value_cell.font = body_font
-        value_cell.alignment = Alignment(horizontal="center", vertical="center")
-        value_cell.border = Border(
-            left=medium_side if col_idx == 1 else thin_side,
-            right=medium_side if col_idx == has_medium_right_col else thin_side,
-            top=thin_side,
-            bottom=thin_side,
-        )
-        if col_idx == 7:
-            value_cell.number_format = "$#,##0.00"
-        if col_idx == 8:
-            header.fill = PatternFill(fill_type="solid", fgColor="FFFFEB99")
-            value_cell.fill = PatternFill(fill_type="solid", fgColor="FFFFF3BF")
+        value_cell.alignment = center_align
+        value_cell.border = edge_border
+        if value_number_format:
+            value_cell.number_format = value_number_format
+        if value_argb:
+            value_cell.fill = _solid_fill(value_argb)
 
     ws.merge_cells(start_row=start_row + 3, start_column=1, end_row=start_row + 3, end_column=8)
     instructions_cell = ws.cell(
@@ -13995,78 +14382,50 @@ def _write_load_sheet_block(
         value="Check Special Instructions",
     )
     instructions_cell.font = Font(bold=True, color="FFB91C1C")
-    instructions_cell.alignment = Alignment(horizontal="center", vertical="center")
-    instructions_cell.fill = PatternFill(fill_type="solid", fgColor="FFFEF2F2")
-    instructions_cell.border = Border(left=medium_side, right=medium_side, top=thin_side, bottom=thin_side)
+    instructions_cell.alignment = center_align
+    instructions_cell.fill = _solid_fill("FFFEF2F2")
+    instructions_cell.border = borders[(True, True, False, False)]
 
     chunk_size = 8
     route_rows_per_chunk = 10
     route_start_row = start_row + 4
     stop_chunks = [route_stops[i : i + chunk_size] for i in range(0, len(route_stops), chunk_size)] or [[]]
 
+    last_route_offset = route_rows_per_chunk - 1
+    route_row_fonts = [stop_label_font, header_font] + [body_font] * 6 + [header_font, body_font]
+
     for chunk_idx, stop_chunk in enumerate(stop_chunks):
         chunk_row = route_start_row + (chunk_idx * route_rows_per_chunk)
-        row_labels = [
-            "Route",
-            "Stop #",
-            "Customer",
-            "Address",
-            "City",
-            "State",
-            "ZIP",
-            "Phone",
-            "Group",
-            "SKU / SO",
-        ]
-        for offset, label in enumerate(row_labels):
-            row_number = chunk_row + offset
-            ws.row_dimensions[row_number].height = 26
-            if offset in {8, 9}:
-                ws.row_dimensions[row_number].height = 42
-            for col_idx in columns:
-                cell = ws.cell(row=row_number, column=col_idx)
-                stop_data = stop_chunk[col_idx - 1] if col_idx <= len(stop_chunk) else None
-                stop_sequence = (stop_data or {}).get("stop_order") or 0
-                color_hex = _color_for_stop_sequence(stop_sequence, stop_palette)
-                light_hex = _lighten_hex_color(color_hex, ratio=0.7 if offset == 1 else 0.84)
-                cell.fill = PatternFill(fill_type="solid", fgColor=_hex_to_excel_argb(light_hex, fallback="#EEF2FF"))
-                cell.border = Border(
-                    left=medium_side if col_idx == 1 else thin_side,
-                    right=medium_side if col_idx == has_medium_right_col else thin_side,
-                    top=thin_side,
-                    bottom=medium_side if offset == len(row_labels) - 1 else thin_side,
+        # Fills and cell values depend only on the stop in each column, so
+        # resolve them once per column rather than once per route row.
+        column_specs = []
+        for col_idx in columns:
+            stop_data = stop_chunk[col_idx - 1] if col_idx <= len(stop_chunk) else None
+            stop_sequence = (stop_data or {}).get("stop_order") or 0
+            color_hex = _color_for_stop_sequence(stop_sequence, stop_palette)
+            column_specs.append(
+                (
+                    col_idx,
+                    _solid_fill(_hex_to_excel_argb(_lighten_hex_color(color_hex, ratio=0.7), fallback="#EEF2FF")),
+                    _solid_fill(_hex_to_excel_argb(_lighten_hex_color(color_hex, ratio=0.84), fallback="#EEF2FF")),
+                    _load_sheet_route_values(stop_data) if stop_data else None,
                 )
-                cell.font = body_font
-                cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+            )
 
-                if not stop_data:
+        for offset in range(route_rows_per_chunk):
+            row_number = chunk_row + offset
+            ws.row_dimensions[row_number].height = 42 if offset in {8, 9} else 26
+            is_last_row = offset == last_route_offset
+            for col_idx, stop_fill, detail_fill, route_values in column_specs:
+                cell = ws.cell(row=row_number, column=col_idx)
+                cell.fill = stop_fill if offset == 1 else detail_fill
+                cell.border = borders[(col_idx == 1, col_idx == has_medium_right_col, False, is_last_row)]
+                cell.alignment = center_wrap_align
+                if route_values is None:
+                    cell.font = body_font
                     continue
-                if offset == 0:
-                    cell.value = f"Stop {int(stop_sequence)}"
-                    cell.font = Font(bold=True, color="FF1E293B")
-                elif offset == 1:
-                    cell.value = int(stop_sequence)
-                    cell.font = header_font
-                elif offset == 2:
-                    customers = stop_data.get("customers") or []
-                    cell.value = ", ".join(customers[:2]) + (f" (+{len(customers)-2})" if len(customers) > 2 else "")
-                elif offset == 3:
-                    cell.value = stop_data.get("address") or "(address unavailable)"
-                elif offset == 4:
-                    cell.value = stop_data.get("city") or ""
-                elif offset == 5:
-                    cell.value = stop_data.get("state") or ""
-                elif offset == 6:
-                    cell.value = stop_data.get("zip") or ""
-                elif offset == 7:
-                    cell.value = "(blank)"
-                elif offset == 8:
-                    cell.value = "COT Stickers"
-                    cell.font = header_font
-                elif offset in {8, 9}:
-                    sku_entries = stop_data.get("sku_entries") or []
-                    if offset == 9:
-                        cell.value = "\n".join(sku_entries[:8])
+                cell.font = route_row_fonts[offset]
+                cell.value = route_values[offset]
 
     after_routes_row = route_start_row + (len(stop_chunks) * route_rows_per_chunk) + 1
     row_after_schematic = _write_load_sheet_schematic_grid(
@@ -14076,6 +14435,7 @@ def _write_load_sheet_block(
         stop_palette=stop_palette,
         medium_side=medium_side,
         thin_side=thin_side,
+        borders=borders,
     )
     return max(row_after_schematic + 1, after_routes_row + 3)
 
@@ -14306,7 +14666,19 @@ def _build_single_load_sheet_workbook(load):
     return workbook
 
 
-def _build_load_report_workbook(planning_session, report_rows):
+def _styled_report_row(ws, values, styles):
+    """Build a row of pre-styled cells so the sheet is appended once per row
+    instead of re-addressing every cell after ``append``."""
+    row = []
+    for value, style in zip(values, styles):
+        cell = WriteOnlyCell(ws, value=value)
+        for attr, attr_value in style.items():
+            setattr(cell, attr, attr_value)
+        row.append(cell)
+    return row
+
+
+def _build_load_report_workbook(planning_session, report_rows, include_load_sheets=True):
     workbook = Workbook()
     summary = workbook.active
     summary.title = "Load Summary"
@@ -14325,6 +14697,13 @@ def _build_load_report_workbook(planning_session, report_rows):
     all_border = Border(left=thin_side, right=thin_side, top=thin_side, bottom=thin_side)
     alternating_fill_a = PatternFill(fill_type="solid", fgColor="FFF3F8FF")
     alternating_fill_b = PatternFill(fill_type="solid", fgColor="FFFFFFFF")
+    header_style = {
+        "fill": header_fill,
+        "font": header_font,
+        "border": all_border,
+        "alignment": Alignment(horizontal="center", vertical="center"),
+    }
+    header_styles = [header_style] * 12
 
     summary_headers = [
         "Load ID",
@@ -14338,92 +14717,87 @@ def _build_load_report_workbook(planning_session, report_rows):
         "Total Units",
         "Early Delivery Flag",
     ]
-    summary.append(summary_headers)
-    for cell in summary[1]:
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.border = all_border
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+    summary.append(_styled_report_row(summary, summary_headers, header_styles))
 
     all_preview_rows = _build_load_report_preview_rows(report_rows, limit=200000)
 
-    current_row = 2
+    load_font = Font(bold=True, color="FF111827")
+    group_end_border = Border(left=thin_side, right=thin_side, top=thin_side, bottom=separator_side)
+    left_align = Alignment(horizontal="left", vertical="center")
+    right_align = Alignment(horizontal="right", vertical="center")
+    flag_align = Alignment(horizontal="center")
+    yes_style = {"fill": yes_fill, "font": yes_font, "alignment": flag_align}
+    no_style = {"font": no_font, "alignment": flag_align}
+
     group_index = -1
     previous_load_id = None
-    for row_idx, row in enumerate(all_preview_rows):
-        load_id = str(row.get("load_id") or "").strip()
+    row_count = len(all_preview_rows)
+    preview_load_ids = [str(row.get("load_id") or "").strip() for row in all_preview_rows]
+    next_load_ids = preview_load_ids[1:] + [None]
+    total_units = 0
+    for row, load_id, next_load_id in zip(all_preview_rows, preview_load_ids, next_load_ids):
         if load_id != previous_load_id:
             group_index += 1
-        next_load_id = (
-            str(all_preview_rows[row_idx + 1].get("load_id") or "").strip()
-            if row_idx + 1 < len(all_preview_rows)
-            else None
-        )
-        is_group_end = load_id != next_load_id
-        row_fill = alternating_fill_a if (group_index % 2 == 0) else alternating_fill_b
-
+        base_style = {
+            "fill": alternating_fill_a if (group_index % 2 == 0) else alternating_fill_b,
+            "border": all_border if load_id == next_load_id else group_end_border,
+            "font": body_font,
+            "alignment": left_align,
+        }
+        total_units_value = row.get("total_units") or 0
+        total_units += total_units_value
+        early_flag = row.get("early_flag") or "NO"
+        units_style = {**base_style, "alignment": right_align}
+        if isinstance(total_units_value, (int, float)):
+            units_style["number_format"] = "#,##0"
         summary.append(
-            [
-                load_id,
-                row.get("stop_order") or "--",
-                row.get("so_number") or "",
-                row.get("customer_name") or "",
-                row.get("destination_city") or "",
-                row.get("state") or "",
-                row.get("ship_date") or "",
-                row.get("due_date") or "",
-                row.get("total_units") or 0,
-                row.get("early_flag") or "NO",
-            ]
-        )
-        for col_idx in range(1, 11):
-            cell = summary.cell(row=current_row, column=col_idx)
-            cell.fill = row_fill
-            cell.border = Border(
-                left=thin_side,
-                right=thin_side,
-                top=thin_side,
-                bottom=separator_side if is_group_end else thin_side,
-            )
-            cell.font = body_font
-            cell.alignment = Alignment(
-                horizontal="right" if col_idx in {9} else "left",
-                vertical="center",
+            _styled_report_row(
+                summary,
+                [
+                    load_id,
+                    row.get("stop_order") or "--",
+                    row.get("so_number") or "",
+                    row.get("customer_name") or "",
+                    row.get("destination_city") or "",
+                    row.get("state") or "",
+                    row.get("ship_date") or "",
+                    row.get("due_date") or "",
+                    total_units_value,
+                    early_flag,
+                ],
+                [
+                    {**base_style, "font": load_font if row.get("is_group_start") else muted_font},
+                    base_style,
+                    {**base_style, "font": link_font},
+                    base_style,
+                    base_style,
+                    base_style,
+                    base_style,
+                    base_style,
+                    units_style,
+                    {**base_style, **(yes_style if early_flag == "YES" else no_style)},
+                ],
             )
-        if row.get("is_group_start"):
-            summary.cell(row=current_row, column=1).font = Font(bold=True, color="FF111827")
-        else:
-            summary.cell(row=current_row, column=1).font = muted_font
-        summary.cell(row=current_row, column=3).font = link_font
-        if row.get("early_flag") == "YES":
-            summary.cell(row=current_row, column=10).fill = yes_fill
-            summary.cell(row=current_row, column=10).font = yes_font
-            summary.cell(row=current_row, column=10).alignment = Alignment(horizontal="center")
-        else:
-            summary.cell(row=current_row, column=10).font = no_font
-            summary.cell(row=current_row, column=10).alignment = Alignment(horizontal="center")
-        if isinstance(summary.cell(row=current_row, column=9).value, (int, float)):
-            summary.cell(row=current_row, column=9).number_format = "#,##0"
-        current_row += 1
+        )
         previous_load_id = load_id
 
-    totals_row = current_row
-    total_units = sum((row.get("total_units") or 0) for row in all_preview_rows)
+    totals_row = row_count + 2
+    total_units = round(total_units, 0)
+    total_style = {
+        "fill": total_fill,
+        "font": load_font,
+        "border": all_border,
+        "alignment": Alignment(horizontal="center", vertical="center"),
+    }
+    total_units_style = {**total_style, "alignment": right_align, "number_format": "#,##0"}
+    summary.append(
+        _styled_report_row(
+            summary,
+            ["SESSION TOTALS", None, None, None, None, None, None, None, total_units, ""],
+            [total_style] * 8 + [total_units_style, total_style],
+        )
+    )
     summary.merge_cells(start_row=totals_row, start_column=1, end_row=totals_row, end_column=8)
-    summary.cell(row=totals_row, column=1, value="SESSION TOTALS")
-    summary.cell(row=totals_row, column=9, value=round(total_units, 0))
-    summary.cell(row=totals_row, column=10, value="")
-    for col_idx in range(1, 11):
-        cell = summary.cell(row=totals_row, column=col_idx)
-        cell.fill = total_fill
-        cell.font = Font(bold=True, color="FF111827")
-        cell.border = all_border
-        if col_idx in {9}:
-            cell.alignment = Alignment(horizontal="right", vertical="center")
-        else:
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-        if col_idx in {9} and isinstance(cell.value, (int, float)):
-            cell.number_format = "#,##0"
 
     summary.column_dimensions["A"].width = 13
     summary.column_dimensions["B"].width = 12
@@ -14452,48 +14826,41 @@ def _build_load_report_workbook(planning_session, report_rows):
         "Total Units",
         "Total Length (ft)",
     ]
-    stop_details.append(stop_headers)
-    for cell in stop_details[1]:
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.border = all_border
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+    stop_details.append(_styled_report_row(stop_details, stop_headers, header_styles))
 
-    row_idx = 2
+    detail_style = {"border": all_border, "font": body_font, "alignment": left_align}
+    detail_number_style = {**detail_style, "alignment": right_align}
+    detail_link_style = {**detail_style, "font": link_font}
+    detail_yes_style = {**detail_style, **yes_style}
+    detail_no_style = {**detail_style, **no_style}
     for load in report_rows or []:
+        load_label = load.get("load_number") or load.get("display_load_id") or ""
+        ship_date = load.get("ship_date") or ""
         for order in load.get("orders") or []:
+            early_flag = order.get("early_flag") or "NO"
             stop_details.append(
-                [
-                    load.get("load_number") or load.get("display_load_id") or "",
-                    order.get("stop_order_display") or "--",
-                    order.get("so_num") or "",
-                    order.get("cust_name") or "",
-                    order.get("city") or "",
-                    order.get("state") or "",
-                    order.get("zip") or "",
-                    load.get("ship_date") or "",
-                    order.get("due_date") or "",
-                    order.get("early_flag") or "NO",
-                    order.get("total_qty") or 0,
-                    order.get("total_length_ft") or 0,
-                ]
-            )
-            for col_idx in range(1, 13):
-                cell = stop_details.cell(row=row_idx, column=col_idx)
-                cell.border = all_border
-                cell.font = body_font
-                cell.alignment = Alignment(
-                    horizontal="right" if col_idx in {11, 12} else "left",
-                    vertical="center",
+                _styled_report_row(
+                    stop_details,
+                    [
+                        load_label,
+                        order.get("stop_order_display") or "--",
+                        order.get("so_num") or "",
+                        order.get("cust_name") or "",
+                        order.get("city") or "",
+                        order.get("state") or "",
+                        order.get("zip") or "",
+                        ship_date,
+                        order.get("due_date") or "",
+                        early_flag,
+                        order.get("total_qty") or 0,
+                        order.get("total_length_ft") or 0,
+                    ],
+                    [detail_style, detail_style, detail_link_style]
+                    + [detail_style] * 6
+                    + [detail_yes_style if early_flag == "YES" else detail_no_style]
+                    + [detail_number_style, detail_number_style],
                 )
-            stop_details.cell(row=row_idx, column=3).font = link_font
-            stop_details.cell(row=row_idx, column=10).alignment = Alignment(horizontal="center")
-            if (order.get("early_flag") or "NO") == "YES":
-                stop_details.cell(row=row_idx, column=10).fill = yes_fill
-                stop_details.cell(row=row_idx, column=10).font = yes_font
-            else:
-                stop_details.cell(row=row_idx, column=10).font = no_font
-            row_idx += 1
+            )
 
     stop_details.column_dimensions["A"].width = 13
     stop_details.column_dimensions["B"].width = 12
@@ -14520,38 +14887,28 @@ def _build_load_report_workbook(planning_session, report_rows):
         "Unit Length (ft)",
         "Total Length (ft)",
     ]
-    sku_breakdown.append(sku_headers)
-    for cell in sku_breakdown[1]:
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.border = all_border
-        cell.alignment = Alignment(horizontal="center", vertical="center")
+    sku_breakdown.append(_styled_report_row(sku_breakdown, sku_headers, header_styles))
 
-    sku_row = 2
+    sku_row_styles = [detail_style, detail_link_style] + [detail_style] * 3 + [detail_number_style] * 3
     for load in report_rows or []:
+        load_label = load.get("load_number") or load.get("display_load_id") or ""
         for line in load.get("lines") or []:
             sku_breakdown.append(
-                [
-                    load.get("load_number") or load.get("display_load_id") or "",
-                    line.get("so_num") or "",
-                    line.get("sku") or "",
-                    line.get("item") or "",
-                    line.get("item_desc") or "",
-                    line.get("qty") or 0,
-                    line.get("unit_length_ft") or 0,
-                    line.get("total_length_ft") or line.get("line_total_feet") or 0,
-                ]
-            )
-            for col_idx in range(1, 9):
-                cell = sku_breakdown.cell(row=sku_row, column=col_idx)
-                cell.border = all_border
-                cell.font = body_font
-                cell.alignment = Alignment(
-                    horizontal="right" if col_idx in {6, 7, 8} else "left",
-                    vertical="center",
+                _styled_report_row(
+                    sku_breakdown,
+                    [
+                        load_label,
+                        line.get("so_num") or "",
+                        line.get("sku") or "",
+                        line.get("item") or "",
+                        line.get("item_desc") or "",
+                        line.get("qty") or 0,
+                        line.get("unit_length_ft") or 0,
+                        line.get("total_length_ft") or line.get("line_total_feet") or 0,
+                    ],
+                    sku_row_styles,
                 )
-            sku_breakdown.cell(row=sku_row, column=2).font = link_font
-            sku_row += 1
+            )
 
     sku_breakdown.column_dimensions["A"].width = 13
     sku_breakdown.column_dimensions["B"].width = 14
@@ -14563,6 +14920,11 @@ def _build_load_report_workbook(planning_session, report_rows):
     sku_breakdown.column_dimensions["H"].width = 15
     sku_breakdown.freeze_panes = "A2"
 
+    if not include_load_sheets:
+        # Per-load sheets are also available one at a time from the
+        # single-load export, so callers can skip the heaviest tab here.
+        return workbook
+
     load_sheets = workbook.create_sheet(title="Load Sheets")
     for col_letter in ("A", "B", "C", "D", "E", "F", "G", "H"):
         load_sheets.column_dimensions[col_letter].width = 26
@@ -14588,11 +14950,18 @@ def _build_load_report_workbook(planning_session, report_rows):
     return workbook
 
 
-def _get_session_report_data(session_id):
+@lru_cache(maxsize=512)
+def _safe_filename_part(value):
+    return UNSAFE_FILENAME_PATTERN.sub("_", value).strip("_")
+
+
+def _get_session_report_data(session_id, sync_status=True):
     planning_session = _get_scoped_planning_session_or_404(session_id)
 
     loads = load_builder.list_loads(None, session_id=session_id, include_stack_metrics=False)
-    session_status = _sync_planning_session_status(session_id, loads=loads)
+    # Exports never show the session status, so they skip the status sync
+    # (an extra session read and possibly a write) and keep the stored value.
+    session_status = _sync_planning_session_status(session_id, loads=loads) if sync_status else None
     session_status = _normalize_session_status(session_status or planning_session.get("status"))
     planning_session["status"] = session_status
     all_rows = _build_load_report_rows(loads)
@@ -14605,6 +14974,26 @@ def _get_session_report_data(session_id):
     return planning_session, report_rows
 
 
+def _get_session_report_load_row(session_id, load_id):
+    """Build the report row for a single approved load in the session.
+
+    Returns ``(planning_session, row)``; ``row`` is ``None`` when the load is
+    not part of the session or is not approved.
+    """
+    planning_session = _get_scoped_planning_session_or_404(session_id)
+    planning_session["status"] = _normalize_session_status(planning_session.get("status"))
+
+    loads = load_builder.list_loads(None, session_id=session_id, include_stack_metrics=False)
+    matched_loads = [load for load in loads if int(load.get("id") or 0) == int(load_id)]
+    rows = _build_load_report_rows(matched_loads)
+    _sync_load_utilization_from_report_rows(matched_loads, rows, persist=True)
+    matched = next(
+        (row for row in rows if (row.get("status") or "").strip().upper() == STATUS_APPROVED),
+        None,
+    )
+    return planning_session, matched
+
+
 @cot_bp.route("/load-report/<int:session_id>")
 def load_report(session_id):
     session_redirect = _require_session()
@@ -14650,18 +15039,25 @@ def load_report_export(session_id):
     if session_redirect:
         return session_redirect
 
-    planning_session, report_rows = _get_session_report_data(session_id)
-    workbook = _build_load_report_workbook(planning_session, report_rows)
+    planning_session, report_rows = _get_session_report_data(session_id, sync_status=False)
+    include_load_sheets = _coerce_bool_value(request.args.get("include_sheets", "1"))
+    workbook = _build_load_report_workbook(
+        planning_session,
+        report_rows,
+        include_load_sheets=include_load_sheets,
+    )
     output = io.BytesIO()
     workbook.save(output)
     output.seek(0)
     safe_code = (planning_session.get("session_code") or f"session_{session_id}").replace(" ", "_")
     filename = f"load_report_{safe_code}_{date.today().isoformat()}.xlsx"
 
-    return Response(
-        output.getvalue(),
+    return send_file(
+        output,
         mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        as_attachment=True,
+        download_name=filename,
+        conditional=True,
     )
 
 
@@ -14671,8 +15067,7 @@ def load_report_load_sheet_export(session_id, load_id):
     if session_redirect:
         return session_redirect
 
-    planning_session, report_rows = _get_session_report_data(session_id)
-    matched = next((row for row in (report_rows or []) if int(row.get("id") or 0) == int(load_id)), None)
+    planning_session, matched = _get_session_report_load_row(session_id, load_id)
     if not matched:
         abort(404)
 
@@ -14682,14 +15077,16 @@ def load_report_load_sheet_export(session_id, load_id):
     output.seek(0)
 
     raw_load_number = str(matched.get("load_number") or f"load_{load_id}").strip()
-    safe_load_number = re.sub(r"[^A-Za-z0-9_-]+", "_", raw_load_number).strip("_") or f"load_{load_id}"
+    safe_load_number = _safe_filename_part(raw_load_number) or f"load_{load_id}"
     safe_code = (planning_session.get("session_code") or f"session_{session_id}").replace(" ", "_")
     filename = f"load_sheet_{safe_code}_{safe_load_number}_{date.today().isoformat()}.xlsx"
 
-    return Response(
-        output.getvalue(),
+    return send_file(
+        output,
         mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        as_attachment=True,
+        download_name=filename,
+        conditional=True,
     )
 
 
@@ -14835,16 +15232,14 @@ def planning_sessions_archive_all():
             "end_date": filters.get("end") or None,
         }
     )
-    archived_count = 0
-    for entry in sessions:
-        if not _can_access_planning_session(entry):
-            continue
-        status = _normalize_session_status(entry.get("status"))
-        if status == "ARCHIVED":
-            continue
-        session_id = entry.get("id")
-        if _archive_session_and_release_loads(session_id):
-            archived_count += 1
+    archived_count = _archive_sessions_and_release_loads(
+        [
+            entry
+            for entry in sessions
+            if _can_access_planning_session(entry)
+            and _normalize_session_status(entry.get("status")) != "ARCHIVED"
+        ]
+    )
 
     redirect_args = _planning_sessions_redirect_args(filters)
     redirect_args["archived_all_count"] = archived_count
@@ -14899,15 +15294,62 @@ def manual_load_search():
         return jsonify({"error": "Session expired"}), 401
 
     allowed_plants = _get_allowed_plants()
-    plant_code = (request.args.get("plant") or "").strip().upper()
-    if not plant_code or plant_code not in allowed_plants:
+    plant_code = _requested_plant_code(request.args, allowed_plants)
+    if not plant_code:
         return jsonify({"error": "Invalid plant"}), 400
 
     q = (request.args.get("q") or "").strip()
     orders = db.list_eligible_manual_orders(plant_code, search=q, limit=25)
+    for order in orders:
+        # Sort key for the suggest path's due-date bisect; not part of the payload.
+        order.pop("due_day", None)
     return jsonify({"orders": orders})
 
 
+def _orders_near_due_date(orders, center_date, window_days):
+    """Narrow ``orders`` to those that can fall within ``window_days`` of ``center_date``.
+
+    ``orders`` must come from ``db.list_eligible_manual_orders``, which sorts
+    by SQLite's ``DATE(due_date)`` and returns it as ``due_day``, so the window
+    is found by bisecting that column. Rows SQLite could not date sort first
+    and are always kept. Rows outside SQLite's window are kept only when
+    ``_parse_date`` reads their ``due_date`` differently (or not at all), so
+    every row is still date-parsed (cached); the bisect only spares rows
+    outside the window the rest of the caller's per-row loop body. Callers
+    still apply their exact window check.
+    """
+    undated = bisect.bisect_right(orders, False, key=lambda order: order.get("due_day") is not None)
+    low = center_date - timedelta(days=window_days)
+    high = center_date + timedelta(days=window_days)
+    start = bisect.bisect_left(orders, low.isoformat(), lo=undated, key=lambda order: order["due_day"])
+    end = bisect.bisect_right(orders, high.isoformat(), lo=start, key=lambda order: order["due_day"])
+
+    def _may_be_in_window(order):
+        parsed = _parse_date(order.get("due_date"))
+        return parsed is None or low <= parsed <= high
+
+    return (
+        orders[:undated]
+        + [order for order in orders[undated:start] if _may_be_in_window(order)]
+        + orders[start:end]
+        + [order for order in orders[end:] if _may_be_in_window(order)]
+    )
+
+
+def _manual_suggest_order_payload(so_num, order):
+    return {
+        "so_num": so_num,
+        "cust_name": order.get("cust_name") or "",
+        "due_date": order.get("due_date") or "",
+        "city": order.get("city") or "",
+        "state": order.get("state") or "",
+        "zip": order.get("zip") or "",
+        "total_length_ft": order.get("total_length_ft") or 0,
+        "total_qty": order.get("total_qty") or 0,
+        "utilization_pct": order.get("utilization_pct") or 0,
+    }
+
+
 @cot_bp.route("/loads/manual/suggest")
 def manual_load_suggest():
     session_redirect = _require_session()
@@ -14915,8 +15357,8 @@ def manual_load_suggest():
         return jsonify({"error": "Session expired"}), 401
 
     allowed_plants = _get_allowed_plants()
-    plant_code = (request.args.get("plant") or "").strip().upper()
-    if not plant_code or plant_code not in allowed_plants:
+    plant_code = _requested_plant_code(request.args, allowed_plants)
+    if not plant_code:
         return jsonify({"error": "Invalid plant"}), 400
 
     seed_so_num = (request.args.get("seed") or "").strip()
@@ -14943,9 +15385,18 @@ def manual_load_suggest():
     seed_zip = geo_utils.normalize_zip(seed.get("zip"))
     seed_coords = zip_coords.get(seed_zip) if seed_zip else None
     seed_due = _parse_date(seed.get("due_date"))
+    radius_bounds = (
+        geo_utils.radius_degree_bounds(seed_coords, geo_radius)
+        if seed_coords and geo_radius and geo_radius > 0
+        else None
+    )
 
-    suggestions = []
-    for order in candidates:
+    window_candidates = candidates
+    if seed_due and time_window_days and time_window_days > 0:
+        window_candidates = _orders_near_due_date(candidates, seed_due, time_window_days)
+
+    in_window = []
+    for order in window_candidates:
         so_num = str(order.get("so_num") or "").strip()
         if not so_num or so_num == seed_so_num:
             continue
@@ -14955,51 +15406,45 @@ def manual_load_suggest():
             if abs((order_due - seed_due).days) > time_window_days:
                 continue
 
-        dist = None
         order_zip = geo_utils.normalize_zip(order.get("zip"))
-        order_coords = zip_coords.get(order_zip) if order_zip else None
-        if seed_coords and order_coords:
-            dist = geo_utils.haversine_distance_coords(seed_coords, order_coords)
-            if geo_radius and geo_radius > 0 and dist > geo_radius:
-                continue
+        order_coords = zip_coords.get(order_zip) if (order_zip and seed_coords) else None
+        if order_coords and radius_bounds and (
+            abs(order_coords[0] - seed_coords[0]) > radius_bounds[0]
+            or abs(order_coords[1] - seed_coords[1]) > radius_bounds[1]
+        ):
+            continue
+        in_window.append((so_num, order, order_coords))
 
-        suggestions.append(
-            {
-                "so_num": so_num,
-                "cust_name": order.get("cust_name") or "",
-                "due_date": order.get("due_date") or "",
-                "city": order.get("city") or "",
-                "state": order.get("state") or "",
-                "zip": order.get("zip") or "",
-                "total_length_ft": order.get("total_length_ft") or 0,
-                "total_qty": order.get("total_qty") or 0,
-                "utilization_pct": order.get("utilization_pct") or 0,
-                "distance_miles": round(dist, 1) if dist is not None else None,
-            }
-        )
+    # Distances for every located candidate in one batch, in candidate order.
+    located_coords = [order_coords for _so_num, _order, order_coords in in_window if order_coords]
+    distances = iter(geo_utils.haversine_distances_from(seed_coords, located_coords) if located_coords else ())
 
-    suggestions.sort(
-        key=lambda item: (
-            item["distance_miles"] is None,
-            item["distance_miles"] if item["distance_miles"] is not None else 0,
-            item.get("due_date") or "",
-        )
+    # Rank on (so_num, order, miles) tuples and only serialize the 25 kept.
+    ranked = []
+    for so_num, order, order_coords in in_window:
+        dist = next(distances) if order_coords else None
+        if dist is not None and geo_radius and geo_radius > 0 and dist > geo_radius:
+            continue
+        ranked.append((so_num, order, round(dist, 1) if dist is not None else None))
+
+    nearest = heapq.nsmallest(
+        25,
+        ranked,
+        key=lambda entry: (
+            entry[2] is None,
+            entry[2] if entry[2] is not None else 0,
+            entry[1].get("due_date") or "",
+        ),
     )
+    suggestions = [
+        dict(_manual_suggest_order_payload(so_num, order), distance_miles=miles)
+        for so_num, order, miles in nearest
+    ]
 
     return jsonify(
         {
-            "seed": {
-                "so_num": seed_so_num,
-                "cust_name": seed.get("cust_name") or "",
-                "due_date": seed.get("due_date") or "",
-                "city": seed.get("city") or "",
-                "state": seed.get("state") or "",
-                "zip": seed.get("zip") or "",
-                "total_length_ft": seed.get("total_length_ft") or 0,
-                "total_qty": seed.get("total_qty") or 0,
-                "utilization_pct": seed.get("utilization_pct") or 0,
-            },
-            "suggestions": suggestions[:25],
+            "seed": _manual_suggest_order_payload(seed_so_num, seed),
+            "suggestions": suggestions,
             "params": {
                 "geo_radius": geo_radius,
                 "time_window_days": time_window_days,
@@ -15031,8 +15476,8 @@ def manual_load_create():
             url_for("loads", manual_error="Not authorized for this planning session.", session_id=redirect_session_id)
         )
 
-    plant_code = (request.form.get("plant") or "").strip().upper()
-    if not plant_code or plant_code not in allowed_plants:
+    plant_code = _requested_plant_code(request.form, allowed_plants)
+    if not plant_code:
         return redirect(
             url_for("loads", manual_error="Select a valid plant.", session_id=redirect_session_id)
         )
@@ -15054,11 +15499,7 @@ def manual_load_create():
             )
         )
 
-    so_nums = list(
-        dict.fromkeys(
-            [value.strip() for value in request.form.getlist("so_nums") if (value or "").strip()]
-        )
-    )
+    so_nums = _selected_form_so_nums(request.form)
     if not so_nums:
         return redirect(
             url_for(
@@ -15221,19 +15662,21 @@ def manual_add_suggestions(load_id):
     trailer_type = stack_calculator.normalize_trailer_type(load.get("trailer_type"), default="STEP_DECK")
 
     lines = db.list_load_lines(load_id)
-    existing_so_nums = {
-        _normalize_order_identifier(line.get("so_num"))
-        for line in lines
-        if _normalize_order_identifier(line.get("so_num"))
-    }
     line_totals = {}
     for line in lines:
         so_num = _normalize_order_identifier(line.get("so_num"))
         if not so_num:
             continue
         line_totals[so_num] = line_totals.get(so_num, 0) + float(line.get("total_length_ft") or 0)
+    existing_so_nums = set(line_totals)
 
-    order_rows = db.list_orders_by_so_nums(plant_code, list(existing_so_nums)) if existing_so_nums else []
+    search_query = (request.args.get("q") or "").strip()
+    order_data = db.get_manual_add_order_data(
+        plant_code,
+        sorted(existing_so_nums),
+        search=search_query or None,
+    )
+    order_rows = order_data["existing_orders"]
     order_map = {
         _normalize_order_identifier(row.get("so_num")): row
         for row in order_rows
@@ -15255,6 +15698,11 @@ def manual_add_suggestions(load_id):
         coords = zip_coords.get(zip_code) if zip_code else None
         if coords and coords not in stop_coords:
             stop_coords.append(coords)
+    stop_ruler = (
+        geo_utils.cheap_ruler_factors(sum(coords[0] for coords in stop_coords) / len(stop_coords))
+        if stop_coords
+        else None
+    )
 
     load_payload = _build_load_schematic_payload(load_id) or {}
     payload_schematic = load_payload.get("schematic") or {}
@@ -15322,12 +15770,7 @@ def manual_add_suggestions(load_id):
             "decks": deck_rows,
         }
 
-    search_query = (request.args.get("q") or "").strip()
-    candidates = db.list_eligible_manual_orders(
-        plant_code,
-        search=search_query or None,
-        limit=None,
-    )
+    candidates = order_data["candidates"]
     strategic_setting = _get_effective_planning_setting(STRATEGIC_CUSTOMERS_SETTING_KEY)
     strategic_customers = _parse_strategic_customers(strategic_setting.get("value_text") or "")
     strategic_groups = [
@@ -15342,19 +15785,14 @@ def manual_add_suggestions(load_id):
         for entry in (strategic_customers or [])
         if entry.get("key") and entry.get("include_in_optimizer_workbench", True)
     }
-    candidate_so_nums = []
-    seen_candidate_so_nums = set()
+    candidate_orders = []
     for order in candidates:
         so_num = str(order.get("so_num") or "").strip()
-        if not so_num or so_num in existing_so_nums or so_num in seen_candidate_so_nums:
-            continue
-        seen_candidate_so_nums.add(so_num)
-        candidate_so_nums.append(so_num)
+        if so_num and so_num not in existing_so_nums:
+            candidate_orders.append((so_num, order))
+    seen_candidate_so_nums = {so_num for so_num, _order in candidate_orders}
 
-    sku_lines = db.list_order_lines_for_so_nums(
-        plant_code,
-        list(existing_so_nums) + candidate_so_nums,
-    )
+    sku_lines = order_data["lines"]
     candidate_line_map = {}
     sku_rollups = {}
     for line in sku_lines:
@@ -15380,20 +15818,15 @@ def manual_add_suggestions(load_id):
             pass
 
     def _serialize_sku_rollup(so_num):
-        rollup = sku_rollups.get(so_num, {})
-        entries = []
-        for entry in rollup.values():
-            entries.append(
-                {
-                    "sku": entry.get("sku") or "UNKNOWN",
-                    "ft": round(float(entry.get("ft") or 0), 1),
-                    "qty": int(entry.get("qty") or 0),
-                }
-            )
-        entries.sort(key=lambda item: (-(item.get("ft") or 0), item.get("sku") or ""))
+        # Rollup entries are built above with a non-empty sku, float ft and int qty.
+        entries = [
+            {"sku": entry["sku"], "ft": round(entry["ft"], 1), "qty": entry["qty"]}
+            for entry in sku_rollups.get(so_num, {}).values()
+        ]
+        entries.sort(key=lambda item: (-item["ft"], item["sku"]))
         return entries
 
-    sku_specs = {spec["sku"]: spec for spec in db.list_sku_specs()}
+    sku_specs = _get_sku_spec_map()
     fit_assessments = _manual_add_fit_assessments(
         load=load,
         plant_code=plant_code,
@@ -15432,10 +15865,7 @@ def manual_add_suggestions(load_id):
         )
 
     suggestions = []
-    for order in candidates:
-        so_num = str(order.get("so_num") or "").strip()
-        if not so_num or so_num in existing_so_nums:
-            continue
+    for so_num, order in candidate_orders:
         customer_name = str(order.get("cust_name") or "").strip()
         matched_strategic = None
         for group_entry in strategic_lookup.values():
@@ -15447,10 +15877,7 @@ def manual_add_suggestions(load_id):
         order_zip = geo_utils.normalize_zip(order.get("zip"))
         order_coords = zip_coords.get(order_zip) if order_zip else None
         if order_coords and stop_coords:
-            dist = min(
-                geo_utils.haversine_distance_coords(order_coords, stop)
-                for stop in stop_coords
-            )
+            dist = geo_utils.min_haversine_distance(order_coords, stop_coords, stop_ruler)
 
         total_length_ft = float(order.get("total_length_ft") or 0)
         fit_assessment = fit_assessments.get(so_num) or {
@@ -15534,11 +15961,7 @@ def manual_add_orders(load_id):
     if status == STATUS_APPROVED:
         return jsonify({"error": "Approved loads cannot be modified."}), 400
 
-    selected = list(
-        dict.fromkeys(
-            [value.strip() for value in request.form.getlist("so_nums") if (value or "").strip()]
-        )
-    )
+    selected = _selected_form_so_nums(request.form)
     if not selected:
         return jsonify({"error": "Select at least one order."}), 400
 
@@ -15563,11 +15986,10 @@ def manual_add_orders(load_id):
     if not order_lines:
         return jsonify({"error": "No eligible order lines found."}), 400
 
-    db.update_load_build_source(load_id, "MANUAL")
-    for line in order_lines:
-        db.create_load_line(load_id, line["id"], line.get("total_length_ft") or 0)
-    db.delete_load_schematic_override(load_id)
-    db.reset_load_route_state(load_id)
+    db.add_manual_load_lines(
+        load_id,
+        [(line["id"], line.get("total_length_ft") or 0) for line in order_lines],
+    )
 
     reopt_job_id = _start_reopt_job(
         plant_code,
@@ -15733,7 +16155,7 @@ def load_detail(load_id):
     stop_color_palette = _get_stop_color_palette()
     lines = db.list_load_lines(load_id)
     plant_names = {row["plant_code"]: row["name"] for row in db.list_plants()}
-    sku_specs = {spec["sku"]: spec for spec in db.list_sku_specs()}
+    sku_specs = _get_sku_spec_map()
     stops = []
     stop_map = {}
     zip_coords = geo_utils.load_zip_coordinates()
@@ -15754,16 +16176,16 @@ def load_detail(load_id):
             stop_map[key]["customers"].add(line.get("cust_name"))
 
     for stop in stop_map.values():
-        coords = None
-        if stop.get("lat") is not None and stop.get("lng") is not None:
-            coords = (stop.get("lat"), stop.get("lng"))
+        lat = stop["lat"]
+        lng = stop["lng"]
+        coords = (lat, lng) if lat is not None and lng is not None else None
         stops.append(
             {
                 "zip": stop["zip"],
                 "state": stop["state"],
                 "customers": sorted(stop["customers"]),
-                "lat": stop.get("lat"),
-                "lng": stop.get("lng"),
+                "lat": lat,
+                "lng": lng,
                 "coords": coords,
             }
         )
@@ -15807,20 +16229,46 @@ def load_detail(load_id):
             "icon": "home",
             "coords": origin_coords,
             "sequence": 0,
+            "color": "#38bdf8",
+            "bg": "#38bdf822",
         }
     ]
+    map_stops = []
+    if origin_coords:
+        map_stops.append(
+            {
+                "type": "origin",
+                "lat": origin_coords[0],
+                "lng": origin_coords[1],
+                "label": origin_name or origin_code,
+                "color": "#38bdf8",
+            }
+        )
     for idx, stop in enumerate(ordered_stops, start=1):
-        coords = None
-        if stop.get("lat") is not None and stop.get("lng") is not None:
-            coords = (stop.get("lat"), stop.get("lng"))
+        lat = stop.get("lat")
+        lng = stop.get("lng")
+        coords = (lat, lng) if lat is not None and lng is not None else None
+        label = f"{stop.get('state') or ''} {stop.get('zip') or ''}".strip()
+        color = _color_for_stop_sequence(idx, stop_color_palette)
         route_nodes.append(
             {
                 "type": "customer",
-                "label": f"{stop.get('state') or ''} {stop.get('zip') or ''}".strip(),
+                "label": label,
                 "subtitle": ", ".join(stop.get("customers") or []),
                 "icon": "person_pin_circle",
                 "coords": coords,
                 "sequence": idx,
+                "color": color,
+                "bg": _stop_bg_color(color),
+            }
+        )
+        map_stops.append(
+            {
+                "type": "customer",
+                "lat": lat,
+                "lng": lng,
+                "label": label,
+                "color": color,
             }
         )
     if requires_return_to_origin and origin_coords and len(route_nodes) > 1:
@@ -15832,23 +16280,20 @@ def load_detail(load_id):
                 "icon": "home",
                 "coords": origin_coords,
                 "sequence": len(route_nodes),
+                "color": "#38bdf8",
+                "bg": "#38bdf822",
             }
         )
-
-    for node in route_nodes:
-        node_type = (node.get("type") or "").strip().lower()
-        is_return_origin = (
-            node_type == "final"
-            and requires_return_to_origin
-            and origin_coords
-            and node.get("coords") == origin_coords
+    if requires_return_to_origin and origin_coords:
+        map_stops.append(
+            {
+                "type": "final",
+                "lat": origin_coords[0],
+                "lng": origin_coords[1],
+                "label": origin_name or origin_code,
+                "color": "#38bdf8",
+            }
         )
-        if node_type == "origin" or is_return_origin:
-            color = "#38bdf8"
-        else:
-            color = _color_for_stop_sequence(node.get("sequence"), stop_color_palette)
-        node["color"] = color
-        node["bg"] = f"{color}22"
 
     route_metrics = _load_route_display_metrics(
         load_data,
@@ -15861,41 +16306,6 @@ def load_detail(load_id):
     route_legs = route_metrics["route_legs"]
     route_geometry = route_metrics["route_geometry"]
 
-    map_stops = []
-    if origin_coords:
-        origin_color = route_nodes[0]["color"] if route_nodes else "#38bdf8"
-        map_stops.append(
-            {
-                "type": "origin",
-                "lat": origin_coords[0],
-                "lng": origin_coords[1],
-                "label": origin_name or origin_code,
-                "color": origin_color,
-            }
-        )
-    for idx, stop in enumerate(ordered_stops, start=1):
-        stop_color = route_nodes[idx]["color"] if idx < len(route_nodes) else "#f59e0b"
-        map_stops.append(
-            {
-                "type": "customer",
-                "lat": stop.get("lat"),
-                "lng": stop.get("lng"),
-                "label": f"{stop.get('state') or ''} {stop.get('zip') or ''}".strip(),
-                "color": stop_color,
-            }
-        )
-    if requires_return_to_origin and origin_coords and map_stops:
-        final_color = route_nodes[-1]["color"] if route_nodes else "#f59e0b"
-        map_stops.append(
-            {
-                "type": "final",
-                "lat": origin_coords[0],
-                "lng": origin_coords[1],
-                "label": origin_name or origin_code,
-                "color": final_color,
-            }
-        )
-
     schematic_result = _calculate_load_schematic_with_override(
         load_id,
         lines,
@@ -15937,14 +16347,13 @@ def load_detail(load_id):
     load_data["map_stops"] = map_stops
     load_data["route_reversed"] = bool(reverse_route)
 
-    due_dates = [ _parse_date(line.get("due_date")) for line in lines ]
-    due_dates = [value for value in due_dates if value]
+    line_due_dates = [_parse_date(line.get("due_date")) for line in lines]
+    due_dates = [value for value in line_due_dates if value]
     anchor_date = min(due_dates) if due_dates else None
     today = date.today()
 
     manifest_rows = []
-    for line in lines:
-        due_date = _parse_date(line.get("due_date"))
+    for line, due_date in zip(lines, line_due_dates):
         max_stack = line.get("max_stack_height") or 1
         qty = line.get("qty") or 0
         positions_required = math.ceil(qty / max_stack) if max_stack else qty
@@ -16003,6 +16412,23 @@ def load_detail(load_id):
     )
 
 
+def _cached_route_geometry_etag(load, route_total_miles, route_legs):
+    # Hash the stored geometry text rather than re-serializing the decoded
+    # points. A matching If-None-Match then gets a 304, which saves
+    # re-encoding the geometry payload and sending it again.
+    digest = hashlib.blake2b(digest_size=8)
+    for part in (
+        load.get("route_geometry_json") or json.dumps(load.get("route_geometry") or []),
+        load.get("route_provider") or "",
+        load.get("route_profile") or "",
+        repr(float(route_total_miles or 0.0)),
+        json.dumps(route_legs or [], sort_keys=True, default=str),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
 @cot_bp.route("/api/loads/<int:load_id>/route-geometry")
 def load_route_geometry(load_id):
     session_redirect = _require_session()
@@ -16145,17 +16571,24 @@ def load_route_geometry(load_id):
     }
     force_refresh = _coerce_bool_value(request.args.get("force"))
     if has_cached_road_geometry and not force_refresh and _geometry_matches_sequence(existing_geometry, route_points):
-        return jsonify(
-            {
-                "load_id": load_id,
-                "route_provider": load.get("route_provider"),
-                "route_profile": load.get("route_profile"),
-                "route_fallback": bool(load.get("route_fallback")),
-                "route_total_miles": existing_total_miles,
-                "route_legs": metrics["route_legs"],
-                "route_geometry": existing_geometry,
-            }
-        )
+        etag = _cached_route_geometry_etag(load, existing_total_miles, metrics["route_legs"])
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = jsonify(
+                {
+                    "load_id": load_id,
+                    "route_provider": load.get("route_provider"),
+                    "route_profile": load.get("route_profile"),
+                    "route_fallback": bool(load.get("route_fallback")),
+                    "route_total_miles": existing_total_miles,
+                    "route_legs": metrics["route_legs"],
+                    "route_geometry": existing_geometry,
+                }
+            )
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response
 
     service = routing_service.get_routing_service()
     route_geometry = []
@@ -16309,7 +16742,7 @@ def update_load_trailer(load_id):
     assumptions = _get_stack_capacity_assumptions()
 
     lines = db.list_load_lines(load_id)
-    sku_specs = {spec["sku"]: spec for spec in db.list_sku_specs()}
+    sku_specs = _get_sku_spec_map()
     zip_coords = geo_utils.load_zip_coordinates()
     ordered_stops = _ordered_stops_for_lines(lines, load["origin_plant"], zip_coords)
     ordered_stops = _apply_route_stop_order(ordered_stops, load=load)
@@ -16678,7 +17111,7 @@ def _build_load_schematic_payload(load_id):
     assumptions = _get_stack_capacity_assumptions()
     load["trailer_type"] = trailer_type
     lines = db.list_load_lines(load_id)
-    sku_specs = {spec["sku"]: spec for spec in db.list_sku_specs()}
+    sku_specs = _get_sku_spec_map()
     carrier_pricing_context = _build_load_carrier_pricing_context()
 
     requires_return_to_origin = _requires_return_to_origin(lines)
@@ -18099,6 +18532,7 @@ def save_planning_tools():
             TRAILER_ASSIGNMENT_RULES_SETTING_KEY,
             json.dumps(trailer_rules),
         )
+        _clear_request_cache("trailer_assignment_rules")
     target_tab = (request.form.get("tab") or "overview").strip().lower()
     if target_tab != "overview":
         target_tab = "overview"
@@ -19041,10 +19475,12 @@ def export_sku_cheat_sheet():
     workbook.save(output)
     output.seek(0)
     filename = f"sku_cheat_sheet_{date.today().isoformat()}.xlsx"
-    return Response(
-        output.getvalue(),
+    return send_file(
+        output,
         mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        as_attachment=True,
+        download_name=filename,
+        conditional=True,
     )
 
 
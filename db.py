@@ -1617,6 +1617,12 @@ def init_db():
         connection.execute(
             "CREATE INDEX IF NOT EXISTS idx_replay_eval_load_metrics_run_scenario ON replay_eval_load_metrics(run_id, scenario)"
         )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_replay_eval_issues_run_date ON replay_eval_issues(run_id, date_created, plant_code)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_replay_eval_load_metrics_run_date ON replay_eval_load_metrics(run_id, date_created, plant_code)"
+        )
         connection.execute(
             "CREATE INDEX IF NOT EXISTS idx_replay_eval_source_rows_run_date ON replay_eval_source_rows(run_id, date_created, plant_code)"
         )
@@ -1653,6 +1659,30 @@ def init_db():
         connection.execute(
             "CREATE INDEX IF NOT EXISTS idx_load_order_release_overrides_active ON load_order_release_overrides(is_active)"
         )
+        # Write counters for reference tables that app workers cache in memory.
+        # Triggers bump the counter on every write path (UI edits, seed imports),
+        # so a worker only has to compare one integer to know its copy is stale.
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS table_versions (
+                table_name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        connection.execute(
+            "INSERT OR IGNORE INTO table_versions (table_name, version) VALUES ('sku_specifications', 0)"
+        )
+        for trigger_event in ("INSERT", "UPDATE", "DELETE"):
+            connection.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS trg_sku_specifications_version_{trigger_event.lower()}
+                AFTER {trigger_event} ON sku_specifications
+                BEGIN
+                    UPDATE table_versions SET version = version + 1 WHERE table_name = 'sku_specifications';
+                END
+                """
+            )
         connection.commit()
         _seed_plants(connection)
         _seed_reference_data(connection)
@@ -2397,7 +2427,7 @@ def list_order_lines_by_so_nums(so_nums):
         return [dict(row) for row in rows]
 
 
-def list_order_lines_for_so_nums(origin_plant, so_nums):
+def _select_order_lines_for_so_nums(connection, origin_plant, so_nums):
     if not origin_plant or not so_nums:
         return []
     cleaned = [str(value).strip() for value in so_nums if str(value or "").strip()]
@@ -2405,22 +2435,28 @@ def list_order_lines_for_so_nums(origin_plant, so_nums):
         return []
     placeholders = ", ".join("?" for _ in cleaned)
     params = [origin_plant] + cleaned
+    rows = connection.execute(
+        f"""
+        SELECT *
+        FROM order_lines
+        WHERE is_excluded = 0
+          AND plant = ?
+          AND so_num IN ({placeholders})
+        ORDER BY due_date ASC, id ASC
+        """,
+        params,
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def list_order_lines_for_so_nums(origin_plant, so_nums):
+    if not origin_plant or not so_nums:
+        return []
     with get_connection() as connection:
-        rows = connection.execute(
-            f"""
-            SELECT *
-            FROM order_lines
-            WHERE is_excluded = 0
-              AND plant = ?
-              AND so_num IN ({placeholders})
-            ORDER BY due_date ASC, id ASC
-            """,
-            params,
-        ).fetchall()
-        return [dict(row) for row in rows]
+        return _select_order_lines_for_so_nums(connection, origin_plant, so_nums)
 
 
-def list_orders_by_so_nums(origin_plant, so_nums):
+def _select_orders_by_so_nums(connection, origin_plant, so_nums):
     if not origin_plant or not so_nums:
         return []
     cleaned = [str(value).strip() for value in so_nums if str(value or "").strip()]
@@ -2428,20 +2464,26 @@ def list_orders_by_so_nums(origin_plant, so_nums):
         return []
     placeholders = ", ".join("?" for _ in cleaned)
     params = [origin_plant] + cleaned
+    rows = connection.execute(
+        f"""
+        SELECT *
+        FROM orders
+        WHERE is_excluded = 0
+          AND plant = ?
+          AND COALESCE(UPPER(status), 'OPEN') != 'CLOSED'
+          AND so_num IN ({placeholders})
+        ORDER BY DATE(due_date) ASC, so_num ASC
+        """,
+        params,
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def list_orders_by_so_nums(origin_plant, so_nums):
+    if not origin_plant or not so_nums:
+        return []
     with get_connection() as connection:
-        rows = connection.execute(
-            f"""
-            SELECT *
-            FROM orders
-            WHERE is_excluded = 0
-              AND plant = ?
-              AND COALESCE(UPPER(status), 'OPEN') != 'CLOSED'
-              AND so_num IN ({placeholders})
-            ORDER BY DATE(due_date) ASC, so_num ASC
-            """,
-            params,
-        ).fetchall()
-        return [dict(row) for row in rows]
+        return _select_orders_by_so_nums(connection, origin_plant, so_nums)
 
 
 
@@ -2521,6 +2563,36 @@ def list_assigned_so_nums_for_active_loads(origin_plant, include_approved=True):
 def list_eligible_manual_orders(origin_plant, search=None, limit=25):
     if not origin_plant:
         return []
+    with get_connection() as connection:
+        return _select_eligible_manual_orders(connection, origin_plant, search=search, limit=limit)
+
+
+def get_manual_add_order_data(origin_plant, existing_so_nums, search=None):
+    """Load everything the manual-add panel reads on one connection.
+
+    Returns ``existing_orders`` (orders already on the load), ``candidates``
+    (eligible manual orders matching ``search``) and ``lines`` (order lines
+    for both sets, existing SOs first).
+    """
+    if not origin_plant:
+        return {"existing_orders": [], "candidates": [], "lines": []}
+    existing = [str(value).strip() for value in existing_so_nums or [] if str(value or "").strip()]
+    existing_set = set(existing)
+    with get_connection() as connection:
+        existing_orders = _select_orders_by_so_nums(connection, origin_plant, existing)
+        candidates = _select_eligible_manual_orders(connection, origin_plant, search=search, limit=None)
+        candidate_so_nums = []
+        seen = set(existing_set)
+        for order in candidates:
+            so_num = str(order.get("so_num") or "").strip()
+            if so_num and so_num not in seen:
+                seen.add(so_num)
+                candidate_so_nums.append(so_num)
+        lines = _select_order_lines_for_so_nums(connection, origin_plant, existing + candidate_so_nums)
+    return {"existing_orders": existing_orders, "candidates": candidates, "lines": lines}
+
+
+def _select_eligible_manual_orders(connection, origin_plant, search=None, limit=25):
     search_value = (search or "").strip()
     where = [
         "orders.is_excluded = 0",
@@ -2551,27 +2623,27 @@ def list_eligible_manual_orders(origin_plant, search=None, limit=25):
     limit_clause = ""
     if isinstance(limit, int) and limit > 0:
         limit_clause = f"LIMIT {int(limit)}"
-    with get_connection() as connection:
-        rows = connection.execute(
-            f"""
-            SELECT
-                orders.*,
-                (
-                    SELECT city
-                    FROM order_lines
-                    WHERE order_lines.so_num = orders.so_num
-                      AND city IS NOT NULL
-                      AND city != ''
-                    LIMIT 1
-                ) AS city
-            FROM orders
-            WHERE {where_clause}
-            ORDER BY DATE(orders.due_date) ASC, orders.so_num ASC
-            {limit_clause}
-            """,
-            params,
-        ).fetchall()
-        return [dict(row) for row in rows]
+    rows = connection.execute(
+        f"""
+        SELECT
+            orders.*,
+            DATE(orders.due_date) AS due_day,
+            (
+                SELECT city
+                FROM order_lines
+                WHERE order_lines.so_num = orders.so_num
+                  AND city IS NOT NULL
+                  AND city != ''
+                LIMIT 1
+            ) AS city
+        FROM orders
+        WHERE {where_clause}
+        ORDER BY due_day ASC, orders.so_num ASC
+        {limit_clause}
+        """,
+        params,
+    ).fetchall()
+    return [dict(row) for row in rows]
 
 
 def list_order_lines_for_optimization(origin_plant, min_due_date=None, session_id=None):
@@ -2792,21 +2864,25 @@ def include_orders_for_plants(plants=None):
 
     with get_connection() as connection:
         if cleaned:
-            placeholders = ", ".join("?" for _ in cleaned)
-            connection.execute(
-                f"UPDATE orders SET is_excluded = 0 WHERE plant IN ({placeholders})",
-                cleaned,
-            )
-            connection.execute(
-                f"UPDATE order_lines SET is_excluded = 0 WHERE plant IN ({placeholders})",
-                cleaned,
-            )
+            _include_orders_for_plant_codes(connection, cleaned)
         else:
             connection.execute("UPDATE orders SET is_excluded = 0")
             connection.execute("UPDATE order_lines SET is_excluded = 0")
         connection.commit()
 
 
+def _include_orders_for_plant_codes(connection, plant_codes):
+    placeholders = ", ".join("?" for _ in plant_codes)
+    connection.execute(
+        f"UPDATE orders SET is_excluded = 0 WHERE plant IN ({placeholders})",
+        plant_codes,
+    )
+    connection.execute(
+        f"UPDATE order_lines SET is_excluded = 0 WHERE plant IN ({placeholders})",
+        plant_codes,
+    )
+
+
 def list_sku_specs():
     with get_connection() as connection:
         rows = connection.execute(
@@ -2820,6 +2896,20 @@ def list_sku_specs():
         return [dict(row) for row in rows]
 
 
+def get_table_version(table_name):
+    """Return the write counter for ``table_name``, or ``None`` when the
+    database predates the ``table_versions`` table."""
+    with get_connection() as connection:
+        try:
+            row = connection.execute(
+                "SELECT version FROM table_versions WHERE table_name = ?",
+                (table_name,),
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return int(row["version"]) if row else None
+
+
 def get_sku_spec_by_sku(sku):
     sku_key = str(sku or "").strip().upper()
     if not sku_key:
@@ -4113,6 +4203,68 @@ def list_loads(origin_plant=None, session_id=None):
         return [dict(row) for row in rows]
 
 
+def list_session_plant_codes(session_id):
+    """Return the session's own plant code and the distinct load origins.
+
+    Result is ``{"session": <plant_code or None>, "loads": [origin_plant, ...]}``
+    with raw, un-normalized values.
+    """
+    if not session_id:
+        return {"session": None, "loads": []}
+    with get_connection() as connection:
+        rows = connection.execute(
+            """
+            SELECT 'session' AS source, plant_code AS code
+            FROM planning_sessions
+            WHERE id = ?
+            UNION ALL
+            SELECT DISTINCT 'load' AS source, origin_plant AS code
+            FROM loads
+            WHERE planning_session_id = ?
+            """,
+            (session_id, session_id),
+        ).fetchall()
+    result = {"session": None, "loads": []}
+    for row in rows:
+        if row["source"] == "session":
+            result["session"] = row["code"]
+        else:
+            result["loads"].append(row["code"])
+    return result
+
+
+def list_session_plant_codes_for_ids(session_ids):
+    """Bulk form of ``list_session_plant_codes`` keyed by session id."""
+    cleaned_ids = sorted({int(value) for value in session_ids or [] if value})
+    if not cleaned_ids:
+        return {}
+    result = {session_id: {"session": None, "loads": []} for session_id in cleaned_ids}
+    with get_connection() as connection:
+        # Each id is bound twice, so halve the usual chunk to stay under
+        # SQLite's 999-variable limit on older builds.
+        for chunk in _chunked(cleaned_ids, size=450):
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = connection.execute(
+                f"""
+                SELECT 'session' AS source, id AS session_id, plant_code AS code
+                FROM planning_sessions
+                WHERE id IN ({placeholders})
+                UNION ALL
+                SELECT DISTINCT 'load' AS source, planning_session_id AS session_id, origin_plant AS code
+                FROM loads
+                WHERE planning_session_id IN ({placeholders})
+                """,
+                chunk + chunk,
+            ).fetchall()
+            for row in rows:
+                entry = result[row["session_id"]]
+                if row["source"] == "session":
+                    entry["session"] = row["code"]
+                else:
+                    entry["loads"].append(row["code"])
+    return result
+
+
 def create_planning_session(
     session_code,
     plant_code,
@@ -4195,6 +4347,32 @@ def archive_planning_session(session_id):
 
 
 
+def archive_planning_sessions(session_ids, reintroduce_plants=None):
+    """Archive several sessions in one transaction.
+
+    Orders for ``reintroduce_plants`` are returned to the pool in the same
+    commit; an empty list leaves every order untouched.
+    """
+    cleaned_ids = [value for value in session_ids or [] if value]
+    if not cleaned_ids:
+        return
+    archived_at = datetime.utcnow().isoformat(timespec="seconds")
+    placeholders = ", ".join("?" for _ in cleaned_ids)
+    with get_connection() as connection:
+        if reintroduce_plants:
+            _include_orders_for_plant_codes(connection, list(reintroduce_plants))
+        connection.execute(
+            f"""
+            UPDATE planning_sessions
+            SET status = 'ARCHIVED',
+                archived_at = ?
+            WHERE id IN ({placeholders})
+            """,
+            [archived_at] + cleaned_ids,
+        )
+        connection.commit()
+
+
 def compute_planning_session_status(session_id):
     if not session_id:
         return None
@@ -4280,7 +4458,7 @@ def count_planning_sessions_for_day(created_by, plant_code, date_value):
         return int(row["total"] or 0) if row else 0
 
 
-def list_planning_sessions(filters=None):
+def _planning_session_where(filters=None, allowed_plants=None, sandbox=None):
     filters = filters or {}
     where = []
     params = []
@@ -4299,7 +4477,23 @@ def list_planning_sessions(filters=None):
     if filters.get("end_date"):
         where.append("DATE(ps.created_at) <= DATE(?)")
         params.append(filters["end_date"])
+    if allowed_plants is not None:
+        plants = sorted({str(code or "").strip().upper() for code in allowed_plants if str(code or "").strip()})
+        plant_clause = "TRIM(COALESCE(ps.plant_code, '')) = ''"
+        if plants:
+            placeholders = ", ".join("?" for _ in plants)
+            plant_clause = f"({plant_clause} OR UPPER(TRIM(ps.plant_code)) IN ({placeholders}))"
+            params.extend(plants)
+        where.append(plant_clause)
+    if sandbox is not None:
+        where.append("COALESCE(ps.is_sandbox, 0) = ?")
+        params.append(1 if sandbox else 0)
     where_clause = f"WHERE {' AND '.join(where)}" if where else ""
+    return where_clause, params
+
+
+def list_planning_sessions(filters=None):
+    where_clause, params = _planning_session_where(filters)
     with get_connection() as connection:
         rows = connection.execute(
             f"""
@@ -4328,6 +4522,31 @@ def list_planning_sessions(filters=None):
         return [_decode_load_route_fields(dict(row)) for row in rows]
 
 
+def _list_planning_session_distinct(column, filters=None, allowed_plants=None, sandbox=None):
+    where_clause, params = _planning_session_where(filters, allowed_plants, sandbox)
+    value_predicate = f"ps.{column} IS NOT NULL AND ps.{column} != ''"
+    where_clause = f"{where_clause} AND {value_predicate}" if where_clause else f"WHERE {value_predicate}"
+    with get_connection() as connection:
+        rows = connection.execute(
+            f"""
+            SELECT DISTINCT ps.{column}
+            FROM planning_sessions ps
+            {where_clause}
+            ORDER BY 1
+            """,
+            params,
+        ).fetchall()
+        return [row[0] for row in rows]
+
+
+def list_planning_session_planners(filters=None, allowed_plants=None, sandbox=None):
+    return _list_planning_session_distinct("created_by", filters, allowed_plants, sandbox)
+
+
+def list_planning_session_plants(filters=None, allowed_plants=None, sandbox=None):
+    return _list_planning_session_distinct("plant_code", filters, allowed_plants, sandbox)
+
+
 def list_stale_planning_sessions(before_date):
     cutoff = str(before_date or "").strip()
     if not cutoff:
@@ -4480,6 +4699,36 @@ def create_load_line(load_id, order_line_id, line_total_feet, connection=None):
         inner_connection.commit()
 
 
+def add_manual_load_lines(load_id, line_rows):
+    """Attach ``(order_line_id, line_total_feet)`` rows to a load in one commit.
+
+    Marks the load as manually built and clears its schematic override and
+    route state, as adding orders invalidates both.
+    """
+    created_at = datetime.utcnow().isoformat(timespec="seconds")
+    with get_connection() as connection:
+        connection.execute(
+            "UPDATE loads SET build_source = 'MANUAL' WHERE id = ?",
+            (load_id,),
+        )
+        connection.executemany(
+            """
+            INSERT INTO load_lines (load_id, order_line_id, line_total_feet, created_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            [
+                (load_id, order_line_id, line_total_feet, created_at)
+                for order_line_id, line_total_feet in line_rows
+            ],
+        )
+        connection.execute(
+            "DELETE FROM load_schematic_overrides WHERE load_id = ?",
+            (load_id,),
+        )
+        _reset_load_route_state(connection, load_id)
+        connection.commit()
+
+
 def list_load_lines(load_id):
     lines_by_load = list_load_lines_for_load_ids([load_id])
     return lines_by_load.get(load_id, [])
@@ -4624,24 +4873,28 @@ def reset_load_route_state(load_id):
     if not load_id:
         return
     with get_connection() as connection:
-        connection.execute(
-            """
-            UPDATE loads
-            SET route_reversed = 0,
-                route_stop_order_json = NULL,
-                route_provider = NULL,
-                route_profile = NULL,
-                route_total_miles = NULL,
-                route_legs_json = '[]',
-                route_geometry_json = '[]',
-                route_fallback = 1
-            WHERE id = ?
-            """,
-            (load_id,),
-        )
+        _reset_load_route_state(connection, load_id)
         connection.commit()
 
 
+def _reset_load_route_state(connection, load_id):
+    connection.execute(
+        """
+        UPDATE loads
+        SET route_reversed = 0,
+            route_stop_order_json = NULL,
+            route_provider = NULL,
+            route_profile = NULL,
+            route_total_miles = NULL,
+            route_legs_json = '[]',
+            route_geometry_json = '[]',
+            route_fallback = 1
+        WHERE id = ?
+        """,
+        (load_id,),
+    )
+
+
 def _list_load_numbers_for_prefix(prefix):
     with get_connection() as connection:
         rows = connection.execute(
@@ -6059,26 +6312,59 @@ def add_replay_eval_issues(run_id, issues):
         connection.commit()
 
 
-def list_replay_eval_issues(run_id, issue_type=None):
-    if not run_id:
-        return []
-    params = [run_id]
+def _replay_eval_run_filters(run_id, date_created=None, plant_code=None):
     where = ["run_id = ?"]
+    params = [run_id]
+    if date_created:
+        where.append("date_created = ?")
+        params.append(date_created)
+    if plant_code:
+        where.append("plant_code = ?")
+        params.append(str(plant_code).strip().upper())
+    return where, params
+
+
+def _iter_query_rows(query, params, batch_size=1000):
+    with get_connection() as connection:
+        cursor = connection.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
+
+
+def iter_replay_eval_issues(run_id, issue_type=None, date_created=None, plant_code=None, batch_size=1000):
+    """Yield replay issues in export order, fetching ``batch_size`` rows at a time."""
+    if not run_id:
+        return iter(())
+    where, params = _replay_eval_run_filters(run_id, date_created, plant_code)
     if issue_type:
         where.append("issue_type = ?")
         params.append(issue_type)
     where_clause = " AND ".join(where)
-    with get_connection() as connection:
-        rows = connection.execute(
-            f"""
-            SELECT *
-            FROM replay_eval_issues
-            WHERE {where_clause}
-            ORDER BY date_created ASC, plant_code ASC, load_number ASC, order_number ASC, id ASC
-            """,
-            params,
-        ).fetchall()
-        return [dict(row) for row in rows]
+    return _iter_query_rows(
+        f"""
+        SELECT *
+        FROM replay_eval_issues
+        WHERE {where_clause}
+        ORDER BY date_created ASC, plant_code ASC, load_number ASC, order_number ASC, id ASC
+        """,
+        params,
+        batch_size=batch_size,
+    )
+
+
+def list_replay_eval_issues(run_id, issue_type=None, date_created=None, plant_code=None):
+    return list(
+        iter_replay_eval_issues(
+            run_id,
+            issue_type=issue_type,
+            date_created=date_created,
+            plant_code=plant_code,
+        )
+    )
 
 
 def add_replay_eval_load_metrics(run_id, rows):
@@ -6196,24 +6482,34 @@ def list_replay_eval_source_rows(run_id, date_created=None, plant_code=None):
         return [dict(row) for row in rows]
 
 
-def list_replay_eval_load_metrics(run_id, scenario=None):
+def iter_replay_eval_load_metrics(run_id, scenario=None, date_created=None, plant_code=None, batch_size=1000):
+    """Yield replay load metrics in export order, fetching ``batch_size`` rows at a time."""
     if not run_id:
-        return []
-    where = ["run_id = ?"]
-    params = [run_id]
+        return iter(())
+    where, params = _replay_eval_run_filters(run_id, date_created, plant_code)
     if scenario:
         where.append("scenario = ?")
         params.append(str(scenario).upper())
     where_clause = " AND ".join(where)
-    with get_connection() as connection:
-        rows = connection.execute(
-            f"""
-            SELECT *
-            FROM replay_eval_load_metrics
-            WHERE {where_clause}
-            ORDER BY date_created ASC, plant_code ASC, scenario ASC, load_key ASC, id ASC
-            """,
-            params,
-        ).fetchall()
-        return [dict(row) for row in rows]
+    return _iter_query_rows(
+        f"""
+        SELECT *
+        FROM replay_eval_load_metrics
+        WHERE {where_clause}
+        ORDER BY date_created ASC, plant_code ASC, scenario ASC, load_key ASC, id ASC
+        """,
+        params,
+        batch_size=batch_size,
+    )
+
+
+def list_replay_eval_load_metrics(run_id, scenario=None, date_created=None, plant_code=None):
+    return list(
+        iter_replay_eval_load_metrics(
+            run_id,
+            scenario=scenario,
+            date_created=date_created,
+            plant_code=plant_code,
+        )
+    )
 
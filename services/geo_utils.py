@@ -1,7 +1,9 @@
 import json
 import math
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import sqlite3
 
 ZIP_COORDS_PATH = Path(__file__).resolve().parent.parent / "static" / "data" / "zip_coords.json"
@@ -95,6 +97,78 @@ def haversine_distance_coords(coords1, coords2):
     return r * c
 
 
+def prepare_haversine_point(coords):
+    """``(lat_rad, lon_rad, cos_lat)`` for repeated ``haversine_prepared`` calls."""
+    lat_rad = math.radians(coords[0])
+    return lat_rad, math.radians(coords[1]), math.cos(lat_rad)
+
+
+def haversine_prepared(point1, point2):
+    """``haversine_distance_coords`` for points from ``prepare_haversine_point``."""
+    lat1, lon1, cos1 = point1
+    lat2, lon2, cos2 = point2
+    a = math.sin((lat2 - lat1) / 2) ** 2 + cos1 * cos2 * math.sin((lon2 - lon1) / 2) ** 2
+    return 3959 * 2 * math.asin(math.sqrt(a))
+
+
+def cheap_ruler_factors(lat):
+    """Miles per degree of longitude and latitude near ``lat`` (flat-earth)."""
+    miles_per_degree = 3959 * math.pi / 180
+    return miles_per_degree * math.cos(math.radians(lat)), miles_per_degree
+
+
+def min_haversine_distance(coords, points, ruler):
+    """Haversine distance from ``coords`` to the nearest of ``points``.
+
+    ``ruler`` is ``cheap_ruler_factors`` for the points' area; it ranks the
+    points without trig so only the winner pays for a haversine call.
+    """
+    lat, lon = coords
+    kx, ky = ruler
+    nearest = min(
+        points,
+        key=lambda point: ((point[0] - lat) * ky) ** 2 + ((point[1] - lon) * kx) ** 2,
+    )
+    return haversine_distance_coords(coords, nearest)
+
+
+def radius_degree_bounds(coords, radius_miles):
+    """Latitude/longitude deltas (degrees) that contain every point within
+    ``radius_miles`` of ``coords``.
+
+    Points outside ``abs(dlat) <= lat_delta and abs(dlon) <= lon_delta`` are
+    guaranteed to be farther than the radius, so callers can reject them
+    without a haversine call. The bounds are padded slightly so float noise
+    never rejects a point the haversine check would keep.
+    """
+    lat = coords[0]
+    angle = radius_miles / 3959
+    lat_delta = math.degrees(angle) * 1.001
+    max_abs_lat = min(abs(lat) + lat_delta, 90.0)
+    cos_max = math.cos(math.radians(max_abs_lat))
+    ratio = math.sin(min(angle, math.pi) / 2) / cos_max if cos_max > 1e-9 else 1.0
+    if ratio >= 1.0:
+        return lat_delta, 180.0
+    return lat_delta, math.degrees(2 * math.asin(ratio)) * 1.001
+
+
+def haversine_distances_from(origin_coords, coords_list):
+    """Distances in miles from ``origin_coords`` to each of ``coords_list``.
+
+    Small inputs use the scalar formula; larger ones are computed in one
+    NumPy pass. Results are returned as a list in input order.
+    """
+    if len(coords_list) < 64:
+        return [haversine_distance_coords(origin_coords, coords) for coords in coords_list]
+    points = np.asarray(coords_list, dtype=np.float64)
+    lat1 = math.radians(origin_coords[0])
+    lats = np.radians(points[:, 0])
+    dlat = lats - lat1
+    dlon = np.radians(points[:, 1] - origin_coords[1])
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lats) * np.sin(dlon / 2) ** 2
+    return (2 * 3959 * np.arcsin(np.sqrt(a))).tolist()
+
+
 def nearest_neighbor_route(origin_coords, destinations, zip_coords_dict):
     if not origin_coords:
         return []
@@ -167,16 +241,26 @@ def normalize_zip(value):
         if math.isnan(value):
             return ""
         digits = str(int(value))
+    elif isinstance(value, str):
+        return _normalize_zip_text(value)
     else:
-        raw = str(value).strip()
-        if not raw:
-            return ""
-        if "-" in raw:
-            raw = raw.split("-", 1)[0].strip()
-        if raw.endswith(".0") and raw.replace(".", "").isdigit():
-            raw = raw.split(".", 1)[0]
-        digits = "".join(ch for ch in raw if ch.isdigit())
+        return _normalize_zip_text(str(value))
+
+    if not digits:
+        return ""
+    return digits.zfill(5)[:5]
 
+
+@lru_cache(maxsize=65536)
+def _normalize_zip_text(value):
+    raw = value.strip()
+    if not raw:
+        return ""
+    if "-" in raw:
+        raw = raw.split("-", 1)[0].strip()
+    if raw.endswith(".0") and raw.replace(".", "").isdigit():
+        raw = raw.split(".", 1)[0]
+    digits = "".join(ch for ch in raw if ch.isdigit())
     if not digits:
         return ""
     return digits.zfill(5)[:5]
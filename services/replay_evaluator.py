@@ -5,6 +5,7 @@ import re
 from collections import defaultdict
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 import db
@@ -1172,47 +1173,119 @@ def _evaluate_buckets(parsed_rows, preset, evaluation_scope=EVAL_SCOPE_DAILY_SHI
     return day_plant_rows, issues, load_metrics
 
 
-def build_network_daily_rollup(day_rows):
-    grouped = defaultdict(list)
-    for row in day_rows or []:
-        grouped[row.get("date_created")].append(row)
+_REPLAY_INT_COLUMNS = (
+    "actual_loads",
+    "optimized_loads",
+    "matched_orders",
+    "missing_orders",
+)
+_REPLAY_FLOAT_COLUMNS = (
+    "actual_avg_utilization",
+    "optimized_avg_utilization",
+    "actual_total_miles",
+    "optimized_total_miles",
+    "actual_total_cost",
+    "optimized_total_cost",
+    "delta_total_miles",
+    "delta_total_cost",
+    "report_ref_cost",
+    "report_ref_miles",
+)
+
+
+def _rows_to_columns(day_rows):
+    """Convert day/plant replay rows into NumPy columns (one array per metric)."""
+    rows = list(day_rows or [])
+    count = len(rows)
+    columns = {
+        name: np.fromiter((int(row.get(name) or 0) for row in rows), dtype=np.int64, count=count)
+        for name in _REPLAY_INT_COLUMNS
+    }
+    columns.update(
+        {
+            name: np.fromiter((float(row.get(name) or 0.0) for row in rows), dtype=np.float64, count=count)
+            for name in _REPLAY_FLOAT_COLUMNS
+        }
+    )
+    return columns
 
-    rollups = []
-    for date_created in sorted(grouped.keys()):
-        rows = grouped[date_created]
-        actual_loads = sum(int(row.get("actual_loads") or 0) for row in rows)
-        optimized_loads = sum(int(row.get("optimized_loads") or 0) for row in rows)
 
-        actual_util_num = sum(float(row.get("actual_avg_utilization") or 0.0) * int(row.get("actual_loads") or 0) for row in rows)
-        optimized_util_num = sum(float(row.get("optimized_avg_utilization") or 0.0) * int(row.get("optimized_loads") or 0) for row in rows)
-        actual_avg_util = (actual_util_num / actual_loads) if actual_loads else 0.0
-        optimized_avg_util = (optimized_util_num / optimized_loads) if optimized_loads else 0.0
+def _group_presence(group_ids, rows, name, bucket_count):
+    present = np.fromiter((row.get(name) is not None for row in rows), dtype=bool, count=len(rows))
+    return np.bincount(group_ids[present], minlength=bucket_count)
+
+
+def build_network_daily_rollup(day_rows, columns=None):
+    rows = list(day_rows or [])
+    if not rows:
+        return []
+    if columns is None:
+        columns = _rows_to_columns(rows)
+
+    dates = sorted({row.get("date_created") for row in rows})
+    date_index = {date_created: idx for idx, date_created in enumerate(dates)}
+    group_ids = np.fromiter(
+        (date_index[row.get("date_created")] for row in rows),
+        dtype=np.int64,
+        count=len(rows),
+    )
+    bucket_count = len(dates)
+
+    def _group_sum(values):
+        return np.bincount(group_ids, weights=values, minlength=bucket_count)
+
+    plants = np.bincount(group_ids, minlength=bucket_count)
+    actual_loads = _group_sum(columns["actual_loads"])
+    optimized_loads = _group_sum(columns["optimized_loads"])
+    actual_util_num = _group_sum(columns["actual_avg_utilization"] * columns["actual_loads"])
+    optimized_util_num = _group_sum(columns["optimized_avg_utilization"] * columns["optimized_loads"])
+    matched_orders = _group_sum(columns["matched_orders"])
+    missing_orders = _group_sum(columns["missing_orders"])
+    actual_total_miles = _group_sum(columns["actual_total_miles"])
+    optimized_total_miles = _group_sum(columns["optimized_total_miles"])
+    actual_total_cost = _group_sum(columns["actual_total_cost"])
+    optimized_total_cost = _group_sum(columns["optimized_total_cost"])
+    delta_total_miles = _group_sum(columns["delta_total_miles"])
+    report_ref_cost = _group_sum(columns["report_ref_cost"])
+    report_ref_miles = _group_sum(columns["report_ref_miles"])
+    # Days where no plant reported a reference value keep the integer 0 that
+    # summing an empty selection used to give.
+    report_ref_cost_counts = _group_presence(group_ids, rows, "report_ref_cost", bucket_count)
+    report_ref_miles_counts = _group_presence(group_ids, rows, "report_ref_miles", bucket_count)
 
-        actual_total_cost = sum(float(row.get("actual_total_cost") or 0.0) for row in rows)
-        optimized_total_cost = sum(float(row.get("optimized_total_cost") or 0.0) for row in rows)
-        delta_cost = optimized_total_cost - actual_total_cost
+    rollups = []
+    for idx, date_created in enumerate(dates):
+        bucket_actual_loads = int(actual_loads[idx])
+        bucket_optimized_loads = int(optimized_loads[idx])
+        actual_avg_util = (float(actual_util_num[idx]) / bucket_actual_loads) if bucket_actual_loads else 0.0
+        optimized_avg_util = (
+            (float(optimized_util_num[idx]) / bucket_optimized_loads) if bucket_optimized_loads else 0.0
+        )
+        bucket_actual_cost = float(actual_total_cost[idx])
+        bucket_optimized_cost = float(optimized_total_cost[idx])
+        delta_cost = bucket_optimized_cost - bucket_actual_cost
 
         rollups.append(
             {
                 "date_created": date_created,
-                "plants": len(rows),
-                "matched_orders": sum(int(row.get("matched_orders") or 0) for row in rows),
-                "missing_orders": sum(int(row.get("missing_orders") or 0) for row in rows),
-                "actual_loads": actual_loads,
+                "plants": int(plants[idx]),
+                "matched_orders": int(matched_orders[idx]),
+                "missing_orders": int(missing_orders[idx]),
+                "actual_loads": bucket_actual_loads,
                 "actual_avg_utilization": actual_avg_util,
-                "actual_total_miles": sum(float(row.get("actual_total_miles") or 0.0) for row in rows),
-                "actual_total_cost": actual_total_cost,
-                "optimized_loads": optimized_loads,
+                "actual_total_miles": float(actual_total_miles[idx]),
+                "actual_total_cost": bucket_actual_cost,
+                "optimized_loads": bucket_optimized_loads,
                 "optimized_avg_utilization": optimized_avg_util,
-                "optimized_total_miles": sum(float(row.get("optimized_total_miles") or 0.0) for row in rows),
-                "optimized_total_cost": optimized_total_cost,
-                "delta_loads": optimized_loads - actual_loads,
+                "optimized_total_miles": float(optimized_total_miles[idx]),
+                "optimized_total_cost": bucket_optimized_cost,
+                "delta_loads": bucket_optimized_loads - bucket_actual_loads,
                 "delta_avg_utilization": optimized_avg_util - actual_avg_util,
-                "delta_total_miles": sum(float(row.get("delta_total_miles") or 0.0) for row in rows),
+                "delta_total_miles": float(delta_total_miles[idx]),
                 "delta_total_cost": delta_cost,
-                "delta_cost_pct": _safe_pct(delta_cost, actual_total_cost),
-                "report_ref_cost": sum(float(row.get("report_ref_cost") or 0.0) for row in rows if row.get("report_ref_cost") is not None),
-                "report_ref_miles": sum(float(row.get("report_ref_miles") or 0.0) for row in rows if row.get("report_ref_miles") is not None),
+                "delta_cost_pct": _safe_pct(delta_cost, bucket_actual_cost),
+                "report_ref_cost": float(report_ref_cost[idx]) if report_ref_cost_counts[idx] else 0,
+                "report_ref_miles": float(report_ref_miles[idx]) if report_ref_miles_counts[idx] else 0,
             }
         )
     return rollups
@@ -1237,32 +1310,49 @@ def _finalize_replay_run(
     db.add_replay_eval_issues(run_id, all_issues)
     db.add_replay_eval_load_metrics(run_id, load_metrics)
 
-    network_rows = build_network_daily_rollup(day_rows)
+    day_columns = _rows_to_columns(day_rows)
+    network_rows = build_network_daily_rollup(day_rows, columns=day_columns)
+
+    # Collect the distinct-value and ops-parity tallies in one pass over the
+    # day/plant rows instead of one generator per summary field.
+    day_values = set()
+    plant_values = set()
+    parity_total = 0
+    parity_applied = 0
+    parity_rejected = 0
+    envelope_loads = 0
+    envelope_max_overfill_ft = None
+    for row in day_rows:
+        get = row.get
+        day_values.add(get("date_created"))
+        plant_values.add(get("plant_code"))
+        parity_enabled = bool(get("ops_parity_enabled"))
+        applied = bool(get("ops_parity_applied"))
+        parity_total += parity_enabled
+        parity_applied += applied
+        parity_rejected += parity_enabled and not applied
+        envelope_loads += int(get("ops_parity_envelope_loads") or 0)
+        overfill_ft = float(get("ops_parity_envelope_max_overfill_ft") or 0.0)
+        if envelope_max_overfill_ft is None or overfill_ft > envelope_max_overfill_ft:
+            envelope_max_overfill_ft = overfill_ft
+
     summary_payload = {
         "network_daily": network_rows,
-        "day_count": len({row.get("date_created") for row in day_rows}),
+        "day_count": len(day_values),
         "plant_day_count": len(day_rows),
-        "total_matched_orders": sum(int(row.get("matched_orders") or 0) for row in day_rows),
-        "total_missing_orders": sum(int(row.get("missing_orders") or 0) for row in day_rows),
-        "actual_total_cost": sum(float(row.get("actual_total_cost") or 0.0) for row in day_rows),
-        "optimized_total_cost": sum(float(row.get("optimized_total_cost") or 0.0) for row in day_rows),
-        "delta_total_cost": sum(float(row.get("delta_total_cost") or 0.0) for row in day_rows),
+        "total_matched_orders": int(day_columns["matched_orders"].sum()),
+        "total_missing_orders": int(day_columns["missing_orders"].sum()),
+        "actual_total_cost": float(day_columns["actual_total_cost"].sum()),
+        "optimized_total_cost": float(day_columns["optimized_total_cost"].sum()),
+        "delta_total_cost": float(day_columns["delta_total_cost"].sum()),
         "issue_count": len(all_issues),
         "evaluation_scope": scope_key,
         "ops_parity_enabled": parity_requested,
-        "ops_parity_buckets_total": sum(1 for row in day_rows if row.get("ops_parity_enabled")),
-        "ops_parity_buckets_applied": sum(1 for row in day_rows if row.get("ops_parity_applied")),
-        "ops_parity_rejected_buckets": sum(
-            1
-            for row in day_rows
-            if row.get("ops_parity_enabled") and not row.get("ops_parity_applied")
-        ),
-        "ops_parity_envelope_overfilled_loads": sum(
-            int(row.get("ops_parity_envelope_loads") or 0) for row in day_rows
-        ),
-        "ops_parity_envelope_max_overfill_ft": max(
-            [float(row.get("ops_parity_envelope_max_overfill_ft") or 0.0) for row in day_rows] or [0.0]
-        ),
+        "ops_parity_buckets_total": parity_total,
+        "ops_parity_buckets_applied": parity_applied,
+        "ops_parity_rejected_buckets": parity_rejected,
+        "ops_parity_envelope_overfilled_loads": envelope_loads,
+        "ops_parity_envelope_max_overfill_ft": envelope_max_overfill_ft or 0.0,
     }
     if summary_meta:
         summary_payload.update(summary_meta)
@@ -1274,8 +1364,8 @@ def _finalize_replay_run(
             "completed_at": datetime.utcnow().isoformat(timespec="seconds"),
             "summary_json": json.dumps(summary_payload),
             "total_rows": int(parsed_total_rows or 0),
-            "total_days": len({row.get("date_created") for row in day_rows}),
-            "total_plants": len({row.get("plant_code") for row in day_rows}),
+            "total_days": len(day_values),
+            "total_plants": len(plant_values),
             "total_orders_matched": summary_payload["total_matched_orders"],
             "total_orders_missing": summary_payload["total_missing_orders"],
             "total_issues": len(all_issues),
@@ -3,6 +3,23 @@ from itertools import permutations
 from services import geo_utils
 
 
+def _memoized_distance(distance_fn):
+    """Wrap ``distance_fn`` with a cache keyed on coordinate identity.
+
+    One solve passes the same origin and stop coordinate objects around for
+    every permutation and 2-opt candidate, so each pair is computed once.
+    """
+    cache = {}
+
+    def distance(coords1, coords2):
+        key = (id(coords1), id(coords2))
+        if key not in cache:
+            cache[key] = distance_fn(coords1, coords2)
+        return cache[key]
+
+    return distance
+
+
 def _route_distance(origin_coords, stops, distance_fn, return_to_origin=False):
     total = 0.0
     current = origin_coords
@@ -162,7 +179,7 @@ def solve_route(
     if not origin_coords or not stops:
         return []
 
-    distance_fn = distance_fn or geo_utils.haversine_distance_coords
+    distance_fn = _memoized_distance(distance_fn or geo_utils.haversine_distance_coords)
 
     with_coords = [stop for stop in stops if stop.get("coords")]
     without_coords = [stop for stop in stops if not stop.get("coords")]
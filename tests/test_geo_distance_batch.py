@@ -0,0 +1,81 @@
+import math
+import unittest
+
+from services import geo_utils
+
+
+class GeoDistanceBatchTests(unittest.TestCase):
+    def test_batch_distances_match_scalar_haversine(self):
+        origin = (34.43611, -83.10639)
+        coords = [(30.0 + idx * 0.13, -100.0 + idx * 0.29) for idx in range(150)]
+
+        for sample in (coords[:5], coords):
+            batch = geo_utils.haversine_distances_from(origin, sample)
+            self.assertEqual(len(batch), len(sample))
+            for dist, point in zip(batch, sample):
+                self.assertAlmostEqual(dist, geo_utils.haversine_distance_coords(origin, point), places=6)
+
+    def test_batch_distances_handle_empty_input(self):
+        self.assertEqual(geo_utils.haversine_distances_from((34.0, -83.0), []), [])
+
+    def test_min_distance_picks_the_nearest_stop(self):
+        stops = [(33.75, -84.39), (35.23, -80.84), (32.08, -81.09)]
+        ruler = geo_utils.cheap_ruler_factors(sum(stop[0] for stop in stops) / len(stops))
+        for point in [(34.0, -84.0), (35.0, -81.0), (32.5, -81.5), (40.0, -75.0)]:
+            expected = min(geo_utils.haversine_distance_coords(point, stop) for stop in stops)
+            self.assertEqual(geo_utils.min_haversine_distance(point, stops, ruler), expected)
+
+    def test_radius_bounds_never_reject_points_inside_the_radius(self):
+        for seed in [(25.8, -80.2), (34.4, -83.1), (47.6, -122.3), (64.8, -147.7)]:
+            for radius in (5.0, 75.0, 400.0):
+                lat_delta, lon_delta = geo_utils.radius_degree_bounds(seed, radius)
+                for step in range(72):
+                    bearing = math.radians(step * 5)
+                    # Walk out along the bearing until just past the radius.
+                    lat_rad, lon_rad = math.radians(seed[0]), math.radians(seed[1])
+                    angle = (radius * 0.9999) / 3959
+                    end_lat = math.asin(
+                        math.sin(lat_rad) * math.cos(angle)
+                        + math.cos(lat_rad) * math.sin(angle) * math.cos(bearing)
+                    )
+                    end_lon = lon_rad + math.atan2(
+                        math.sin(bearing) * math.sin(angle) * math.cos(lat_rad),
+                        math.cos(angle) - math.sin(lat_rad) * math.sin(end_lat),
+                    )
+                    point = (math.degrees(end_lat), math.degrees(end_lon))
+                    self.assertLessEqual(geo_utils.haversine_distance_coords(seed, point), radius)
+                    self.assertLessEqual(abs(point[0] - seed[0]), lat_delta)
+                    self.assertLessEqual(abs(point[1] - seed[1]), lon_delta)
+
+                far_lat = (seed[0] + lat_delta * 1.01, seed[1])
+                self.assertGreater(geo_utils.haversine_distance_coords(seed, far_lat), radius)
+
+    def test_prepared_haversine_matches_scalar_formula(self):
+        points = [(33.75, -84.39), (35.23, -80.84), (47.6, -122.3), (25.8, -80.2)]
+        prepared = [geo_utils.prepare_haversine_point(point) for point in points]
+        for left, left_prepared in zip(points, prepared):
+            for right, right_prepared in zip(points, prepared):
+                self.assertAlmostEqual(
+                    geo_utils.haversine_prepared(left_prepared, right_prepared),
+                    geo_utils.haversine_distance_coords(left, right),
+                    places=9,
+                )
+
+    def test_normalize_zip_handles_mixed_inputs(self):
+        cases = [
+            (None, ""),
+            ("", ""),
+            (" 30301-1234 ", "30301"),
+            ("2134.0", "02134"),
+            (2134, "02134"),
+            (2134.0, "02134"),
+            (float("nan"), ""),
+            ("ABC", ""),
+        ]
+        for value, expected in cases:
+            self.assertEqual(geo_utils.normalize_zip(value), expected)
+            self.assertEqual(geo_utils.normalize_zip(value), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import json
+import os
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+
+os.environ.setdefault("FLASK_SECRET_KEY", "test-secret")
+
+import app as app_module
+
+
+class JsonProviderTests(unittest.TestCase):
+    def test_jsonify_matches_stdlib_encoding(self):
+        payload = {
+            "b": [1, 2.5, None, True],
+            "a": {"when": date(2026, 3, 4), "at": datetime(2026, 3, 4, 5, 6, 7)},
+            "cost": Decimal("12.30"),
+            "name": "Café",
+        }
+        with app_module.app.test_request_context("/"):
+            response = app_module.jsonify(payload)
+            stdlib_text = json.dumps(
+                payload,
+                default=app_module.app.json.default,
+                sort_keys=True,
+                separators=(",", ":"),
+            )
+        self.assertEqual(response.get_json(), json.loads(stdlib_text))
+        self.assertEqual(list(response.get_json()), ["a", "b", "cost", "name"])
+
+    def test_numeric_keys_are_serialized_as_strings(self):
+        self.assertEqual(json.loads(app_module.app.json.dumps({7: "x", 3: "y"})), {"3": "y", "7": "x"})
+
+    def test_unsupported_values_still_raise_type_error(self):
+        with self.assertRaises(TypeError):
+            app_module.app.json.dumps({"value": object()})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import json
+import os
+import unittest
+from datetime import date
+
+os.environ.setdefault("FLASK_SECRET_KEY", "test-secret")
+
+import app as app_module
+
+
+class JsonResponseTests(unittest.TestCase):
+    def test_jsonify_output_matches_stdlib_encoding(self):
+        payload = {"b": [1.5, None, "x"], "a": {"when": date(2026, 5, 14)}, "c": 3}
+        with app_module.app.app_context():
+            response = app_module.jsonify(payload)
+            expected = json.dumps(
+                payload,
+                default=app_module.app.json.default,
+                sort_keys=True,
+                separators=(",", ":"),
+            )
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.get_data(as_text=True), f"{expected}\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
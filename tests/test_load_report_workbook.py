@@ -0,0 +1,85 @@
+import os
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("FLASK_SECRET_KEY", "test-secret")
+
+import app as app_module
+
+
+class LoadReportWorkbookTests(unittest.TestCase):
+    def _build(self, report_rows):
+        with patch.object(
+            app_module,
+            "_get_stop_color_palette",
+            return_value=list(app_module.DEFAULT_STOP_COLOR_PALETTE),
+        ), patch.object(app_module, "_build_load_sheet_stops", return_value=[]):
+            return app_module._build_load_report_workbook({}, report_rows)
+
+    def test_data_sheets_keep_row_styles(self):
+        workbook = self._build(
+            [
+                {
+                    "load_number": "L1",
+                    "orders": [
+                        {"so_num": "S1", "early_flag": "YES", "total_qty": 3},
+                        {"so_num": "S2", "total_qty": 2},
+                    ],
+                    "lines": [{"so_num": "S1", "sku": "K1", "qty": 3}],
+                },
+                {"load_number": "L2", "orders": [{"so_num": "S3", "total_qty": 5}], "lines": []},
+            ]
+        )
+
+        summary = workbook["Load Summary"]
+        self.assertEqual(summary["A1"].value, "Load ID")
+        self.assertTrue(summary["A1"].font.b)
+        self.assertEqual(summary["J2"].fill.fgColor.rgb, "FFFDE68A")
+        self.assertEqual(summary["B3"].border.bottom.style, "medium")
+        self.assertEqual(summary["B2"].border.bottom.style, "thin")
+        self.assertEqual(summary["I4"].number_format, "#,##0")
+        self.assertEqual(summary["A5"].value, "SESSION TOTALS")
+        self.assertEqual(summary["I5"].value, 10)
+        self.assertIn("A5:H5", {str(cell_range) for cell_range in summary.merged_cells.ranges})
+
+        stop_details = workbook["Stop Details"]
+        self.assertEqual(stop_details.max_row, 4)
+        self.assertEqual(stop_details["C2"].font.u, "single")
+        self.assertEqual(stop_details["K2"].alignment.horizontal, "right")
+
+        sku_breakdown = workbook["SKU Breakdown"]
+        self.assertEqual(sku_breakdown["C2"].value, "K1")
+        self.assertEqual(sku_breakdown["F2"].alignment.horizontal, "right")
+
+    def test_load_sheets_tab_can_be_skipped(self):
+        rows = [{"load_number": "L1", "orders": [], "lines": []}]
+        self.assertIn("Load Sheets", self._build(rows).sheetnames)
+        workbook = app_module._build_load_report_workbook({}, rows, include_load_sheets=False)
+        self.assertEqual(workbook.sheetnames, ["Load Summary", "Stop Details", "SKU Breakdown"])
+
+    def test_single_load_report_row_only_builds_the_requested_load(self):
+        loads = [{"id": 1, "status": "APPROVED"}, {"id": 2, "status": "APPROVED"}]
+        built = []
+
+        def _fake_rows(selected):
+            built.append([load["id"] for load in selected])
+            return [dict(load) for load in selected]
+
+        with patch.object(
+            app_module, "_get_scoped_planning_session_or_404", return_value={"status": "ACTIVE"}
+        ), patch.object(app_module.load_builder, "list_loads", return_value=loads), patch.object(
+            app_module, "_sync_planning_session_status", return_value="ACTIVE"
+        ) as sync_status, patch.object(app_module, "_build_load_report_rows", side_effect=_fake_rows), patch.object(
+            app_module, "_sync_load_utilization_from_report_rows"
+        ):
+            _session, matched = app_module._get_session_report_load_row(10, 2)
+            _session, missing = app_module._get_session_report_load_row(10, 3)
+
+        self.assertEqual(matched["id"], 2)
+        self.assertIsNone(missing)
+        self.assertEqual(built, [[2], []])
+        sync_status.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -127,6 +127,63 @@ def test_route_geometry_endpoint_refreshes_stale_cached_geometry(monkeypatch):
     assert captured["update_payload"]["route_geometry"] == payload["route_geometry"]
 
 
+def test_route_geometry_endpoint_revalidates_cached_geometry_with_etag(monkeypatch):
+    client = app_module.app.test_client()
+    _set_authenticated_session(client)
+
+    load = {
+        "id": 42,
+        "origin_plant": "ATL",
+        "status": "DRAFT",
+        "route_reversed": 0,
+        "route_geometry": [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]],
+        "route_fallback": 0,
+        "route_provider": "ors",
+        "route_profile": "driving-hgv",
+        "route_total_miles": 60.0,
+    }
+    ordered_stops = [
+        {"coords": (1.0, 0.0), "zip": "11111", "state": "AA"},
+        {"coords": (1.0, 1.0), "zip": "22222", "state": "BB"},
+        {"coords": (0.0, 1.0), "zip": "33333", "state": "CC"},
+    ]
+
+    monkeypatch.setattr(app_module.db, "get_load", lambda load_id: dict(load) if load_id == 42 else None)
+    monkeypatch.setattr(app_module.db, "list_load_lines", lambda _load_id: [{"so_num": "SO-1"}])
+    monkeypatch.setattr(app_module, "_load_access_failure_reason", lambda _load: None)
+    monkeypatch.setattr(app_module.geo_utils, "load_zip_coordinates", lambda: {})
+    monkeypatch.setattr(app_module.geo_utils, "plant_coords_for_code", lambda _plant: (0.0, 0.0))
+    monkeypatch.setattr(app_module, "_build_load_carrier_pricing_context", lambda: {})
+    monkeypatch.setattr(app_module, "_requires_return_to_origin", lambda _lines: False)
+    monkeypatch.setattr(app_module, "_alternate_requires_return_hint", lambda *_args, **_kwargs: False)
+    monkeypatch.setattr(app_module, "_load_has_lowes_order", lambda _lines: False)
+    monkeypatch.setattr(app_module, "_ordered_stops_for_lines", lambda *_args, **_kwargs: list(ordered_stops))
+    monkeypatch.setattr(app_module, "_apply_route_stop_order", lambda ordered_stops, load=None: list(ordered_stops))
+    monkeypatch.setattr(app_module, "_apply_load_route_direction", lambda ordered_stops, load=None, reverse_route=None: list(ordered_stops))
+    monkeypatch.setattr(
+        app_module,
+        "_load_route_display_metrics",
+        lambda *_args, **_kwargs: {"route_legs": [10.0, 20.0, 30.0], "route_geometry": []},
+    )
+    monkeypatch.setattr(app_module.routing_service, "get_routing_service", lambda: None)
+
+    headers = {"X-Requested-With": "XMLHttpRequest", "Accept": "application/json"}
+    first = client.get("/api/loads/42/route-geometry", headers=headers)
+    assert first.status_code == 200
+    assert first.get_json()["route_geometry"] == load["route_geometry"]
+    etag = first.headers["ETag"]
+
+    second = client.get("/api/loads/42/route-geometry", headers={**headers, "If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.data == b""
+    assert second.headers["ETag"] == etag
+
+    load["route_total_miles"] = 75.0
+    third = client.get("/api/loads/42/route-geometry", headers={**headers, "If-None-Match": etag})
+    assert third.status_code == 200
+    assert third.headers["ETag"] != etag
+
+
 def test_reverse_load_order_endpoint_toggles_route_flag(monkeypatch):
     client = app_module.app.test_client()
     _set_authenticated_session(client)
@@ -812,6 +869,37 @@ def test_ordered_stops_for_lines_uses_local_tsp_sequence(monkeypatch):
     assert [stop.get("zip") for stop in ordered] == ["73008", "73301"]
 
 
+def test_ordered_stops_for_lines_reuses_solved_order_for_equivalent_loads(monkeypatch):
+    zip_coords = {
+        "73301": (30.2672, -97.7431),
+        "73008": (35.5187, -97.6323),
+    }
+    calls = []
+
+    def _fake_solve_route(_origin, stops, return_to_origin=False):
+        calls.append(return_to_origin)
+        return list(reversed(stops))
+
+    monkeypatch.setattr(app_module.geo_utils, "plant_coords_for_code", lambda _plant: (33.0, -84.0))
+    monkeypatch.setattr(app_module.tsp_solver, "solve_route", _fake_solve_route)
+
+    for cust_name in ("A", "B"):
+        lines = [
+            {"state": "TX", "zip": "73301", "city": "Austin", "cust_name": cust_name},
+            {"state": "OK", "zip": "73008", "city": "Bethany", "cust_name": cust_name},
+        ]
+        ordered = app_module._ordered_stops_for_lines(
+            lines,
+            origin_plant="ATL",
+            zip_coords=zip_coords,
+            return_to_origin=False,
+        )
+        assert [stop.get("zip") for stop in ordered] == ["73008", "73301"]
+        assert ordered[0]["customers"] == [cust_name]
+
+    assert calls == [False]
+
+
 def test_schematic_and_edit_payloads_share_reversed_stop_color_mapping(monkeypatch):
     load_id = 55
     load = {
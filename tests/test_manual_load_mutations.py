@@ -26,8 +26,7 @@ def test_manual_add_orders_removes_selected_orders_from_other_loads(monkeypatch)
     }
     called = {
         "strip": None,
-        "build_source": None,
-        "created_lines": [],
+        "added_lines": None,
     }
 
     monkeypatch.setattr(app_module.db, "get_load", lambda load_id: load if load_id == 10 else None)
@@ -55,17 +54,9 @@ def test_manual_add_orders_removes_selected_orders_from_other_loads(monkeypatch)
     )
     monkeypatch.setattr(
         app_module.db,
-        "update_load_build_source",
-        lambda load_id, source: called.update({"build_source": (load_id, source)}),
-    )
-    monkeypatch.setattr(
-        app_module.db,
-        "create_load_line",
-        lambda load_id, order_line_id, total_ft: called["created_lines"].append(
-            (load_id, order_line_id, total_ft)
-        ),
+        "add_manual_load_lines",
+        lambda load_id, line_rows: called.update({"added_lines": (load_id, list(line_rows))}),
     )
-    monkeypatch.setattr(app_module.db, "delete_load_schematic_override", lambda _load_id: None)
     monkeypatch.setattr(app_module, "_start_reopt_job", lambda *_args, **_kwargs: "job-1")
 
     response = client.post("/loads/10/manual_add", data={"so_nums": ["SO-2"]})
@@ -79,8 +70,7 @@ def test_manual_add_orders_removes_selected_orders_from_other_loads(monkeypatch)
         "session_id": 77,
         "exclude_load_id": 10,
     }
-    assert called["build_source"] == (10, "MANUAL")
-    assert called["created_lines"] == [(10, 501, 12.0)]
+    assert called["added_lines"] == (10, [(501, 12.0)])
 
 
 def test_remove_order_find_next_best_marks_load_manual_and_reoptimizes(monkeypatch):
@@ -236,11 +226,6 @@ def test_manual_add_suggestions_reports_stack_aware_fit(monkeypatch):
     monkeypatch.setattr(app_module.db, "get_load", lambda load_id: load if load_id == 30 else None)
     monkeypatch.setattr(app_module, "_load_access_failure_reason", lambda _load: None)
     monkeypatch.setattr(app_module.db, "list_load_lines", lambda _load_id: [existing_line])
-    monkeypatch.setattr(
-        app_module.db,
-        "list_orders_by_so_nums",
-        lambda _plant, _so_nums: [{"so_num": "SO-BASE", "due_date": "2026-05-14", "total_length_ft": 50.0}],
-    )
     monkeypatch.setattr(
         app_module,
         "_build_load_schematic_payload",
@@ -256,27 +241,26 @@ def test_manual_add_suggestions_reports_stack_aware_fit(monkeypatch):
     )
     monkeypatch.setattr(
         app_module.db,
-        "list_eligible_manual_orders",
-        lambda _plant, search=None, limit=None: [
-            {
-                "so_num": "SO-NEW",
-                "cust_name": "Stack Fit Customer",
-                "due_date": "2026-05-15",
-                "city": "Dallas",
-                "state": "TX",
-                "zip": "75001",
-                "total_length_ft": 6.0,
-                "utilization_pct": 11.0,
-            }
-        ],
+        "get_manual_add_order_data",
+        lambda _plant, _so_nums, search=None: {
+            "existing_orders": [{"so_num": "SO-BASE", "due_date": "2026-05-14", "total_length_ft": 50.0}],
+            "candidates": [
+                {
+                    "so_num": "SO-NEW",
+                    "cust_name": "Stack Fit Customer",
+                    "due_date": "2026-05-15",
+                    "city": "Dallas",
+                    "state": "TX",
+                    "zip": "75001",
+                    "total_length_ft": 6.0,
+                    "utilization_pct": 11.0,
+                }
+            ],
+            "lines": [existing_line, candidate_line],
+        },
     )
     monkeypatch.setattr(app_module, "_get_effective_planning_setting", lambda _key: {"value_text": ""})
     monkeypatch.setattr(app_module, "_parse_strategic_customers", lambda _value: [])
-    monkeypatch.setattr(
-        app_module.db,
-        "list_order_lines_for_so_nums",
-        lambda _plant, _so_nums: [existing_line, candidate_line],
-    )
     monkeypatch.setattr(app_module.db, "list_sku_specs", lambda: [])
     monkeypatch.setattr(app_module.geo_utils, "load_zip_coordinates", lambda: {})
     monkeypatch.setattr(app_module, "_ordered_stops_for_lines", lambda _lines, _plant, _coords: [])
@@ -352,11 +336,6 @@ def test_manual_add_suggestions_reports_stack_overflow_amount(monkeypatch):
     monkeypatch.setattr(app_module.db, "get_load", lambda load_id: load if load_id == 31 else None)
     monkeypatch.setattr(app_module, "_load_access_failure_reason", lambda _load: None)
     monkeypatch.setattr(app_module.db, "list_load_lines", lambda _load_id: [line])
-    monkeypatch.setattr(
-        app_module.db,
-        "list_orders_by_so_nums",
-        lambda _plant, _so_nums: [{"so_num": "SO-BASE", "due_date": "2026-05-14", "total_length_ft": 50.0}],
-    )
     monkeypatch.setattr(
         app_module,
         "_build_load_schematic_payload",
@@ -372,23 +351,26 @@ def test_manual_add_suggestions_reports_stack_overflow_amount(monkeypatch):
     )
     monkeypatch.setattr(
         app_module.db,
-        "list_eligible_manual_orders",
-        lambda _plant, search=None, limit=None: [
-            {
-                "so_num": "SO-OVER",
-                "cust_name": "Overflow Customer",
-                "due_date": "2026-05-16",
-                "city": "Dallas",
-                "state": "TX",
-                "zip": "75001",
-                "total_length_ft": 8.0,
-                "utilization_pct": 15.0,
-            }
-        ],
+        "get_manual_add_order_data",
+        lambda _plant, _so_nums, search=None: {
+            "existing_orders": [{"so_num": "SO-BASE", "due_date": "2026-05-14", "total_length_ft": 50.0}],
+            "candidates": [
+                {
+                    "so_num": "SO-OVER",
+                    "cust_name": "Overflow Customer",
+                    "due_date": "2026-05-16",
+                    "city": "Dallas",
+                    "state": "TX",
+                    "zip": "75001",
+                    "total_length_ft": 8.0,
+                    "utilization_pct": 15.0,
+                }
+            ],
+            "lines": [line, candidate],
+        },
     )
     monkeypatch.setattr(app_module, "_get_effective_planning_setting", lambda _key: {"value_text": ""})
     monkeypatch.setattr(app_module, "_parse_strategic_customers", lambda _value: [])
-    monkeypatch.setattr(app_module.db, "list_order_lines_for_so_nums", lambda _plant, _so_nums: [line, candidate])
     monkeypatch.setattr(app_module.db, "list_sku_specs", lambda: [])
     monkeypatch.setattr(app_module.geo_utils, "load_zip_coordinates", lambda: {})
     monkeypatch.setattr(app_module, "_ordered_stops_for_lines", lambda _lines, _plant, _coords: [])
@@ -424,3 +406,120 @@ def test_manual_add_suggestions_reports_stack_overflow_amount(monkeypatch):
     assert suggestion["fit_assessment"]["available"] is True
     assert suggestion["fit_assessment"]["fits_in_capacity"] is False
     assert suggestion["fit_assessment"]["over_capacity_by_ft"] == 2.3
+
+
+def test_manual_load_search_omits_internal_due_day(monkeypatch):
+    client = app_module.app.test_client()
+    _set_authenticated_session(client)
+    monkeypatch.setattr(app_module, "_get_allowed_plants", lambda: ["GA"])
+    monkeypatch.setattr(
+        app_module.db,
+        "list_eligible_manual_orders",
+        lambda _plant, search=None, limit=25: [{"so_num": "SO-1", "due_date": "2026-05-03", "due_day": "2026-05-03"}],
+    )
+
+    response = client.get("/loads/manual/search?plant=GA&q=SO")
+
+    assert response.status_code == 200
+    assert response.get_json()["orders"] == [{"so_num": "SO-1", "due_date": "2026-05-03"}]
+
+
+def _sqlite_ordered_candidates(due_dates):
+    import sqlite3
+
+    connection = sqlite3.connect(":memory:")
+    connection.row_factory = sqlite3.Row
+    connection.execute("CREATE TABLE orders (so_num TEXT, due_date TEXT)")
+    connection.executemany(
+        "INSERT INTO orders (so_num, due_date) VALUES (?, ?)",
+        [(f"SO-{index:03d}", due_date) for index, due_date in enumerate(due_dates)],
+    )
+    rows = connection.execute(
+        "SELECT orders.*, DATE(orders.due_date) AS due_day FROM orders ORDER BY due_day ASC, orders.so_num ASC"
+    ).fetchall()
+    connection.close()
+    return [dict(row) for row in rows]
+
+
+def _exact_window(orders, center, window_days):
+    def _in_window(order):
+        due = app_module._parse_date(order["due_date"])
+        return not due or abs((due - center).days) <= window_days
+
+    return [order["so_num"] for order in orders if _in_window(order)]
+
+
+def test_orders_near_due_date_keeps_every_in_window_order():
+    from datetime import date, timedelta
+
+    base = date(2026, 5, 1)
+    due_dates = [None, "", "05/03/2026", "2026-05-20 08:00:00"]
+    due_dates += [(base + timedelta(days=offset)).isoformat() for offset in range(0, 40, 3)]
+    orders = _sqlite_ordered_candidates(due_dates)
+    center = date(2026, 5, 20)
+
+    narrowed = app_module._orders_near_due_date(orders, center, 5)
+
+    assert _exact_window(narrowed, center, 5) == _exact_window(orders, center, 5)
+    assert "2026-05-01" not in {order["due_date"] for order in narrowed}
+
+
+def test_orders_near_due_date_matches_exact_filter_for_odd_due_dates():
+    import random
+    from datetime import date
+
+    odd_values = [
+        None,
+        "",
+        "05/03/2026",
+        "2026-05-03 ",
+        "2026-02-30",
+        "2460800.5",
+        "now",
+        "2026-05-03T08",
+        "2026-05-03 08:00:00 -0500",
+        "2026-05-03T23:00:00-05:00",
+        "not a date",
+    ]
+    rng = random.Random(7)
+    for _ in range(300):
+        due_dates = [
+            rng.choice(odd_values)
+            if rng.random() < 0.3
+            else date(2026, rng.randint(1, 12), rng.randint(1, 28)).isoformat()
+            for _ in range(rng.randint(0, 30))
+        ]
+        orders = _sqlite_ordered_candidates(due_dates)
+        center = date(2026, rng.randint(1, 12), rng.randint(1, 28))
+        window_days = rng.randint(1, 45)
+
+        narrowed = app_module._orders_near_due_date(orders, center, window_days)
+
+        assert _exact_window(narrowed, center, window_days) == _exact_window(orders, center, window_days)
+
+
+def test_add_manual_load_lines_writes_lines_and_resets_load_state(monkeypatch, tmp_path):
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "app.db")
+    db.init_db()
+    load_id = db.create_load({"origin_plant": "GA", "destination_state": "TX", "status": "PROPOSED"})
+    db.upsert_load_schematic_override(load_id, "STEP_DECK", "{}")
+
+    db.add_manual_load_lines(load_id, [(501, 12.0), (502, 6.5)])
+
+    with db.get_connection() as connection:
+        lines = connection.execute(
+            "SELECT order_line_id, line_total_feet FROM load_lines WHERE load_id = ? ORDER BY order_line_id",
+            (load_id,),
+        ).fetchall()
+        load_row = connection.execute(
+            "SELECT build_source, route_fallback FROM loads WHERE id = ?",
+            (load_id,),
+        ).fetchone()
+        overrides = connection.execute(
+            "SELECT COUNT(*) FROM load_schematic_overrides WHERE load_id = ?",
+            (load_id,),
+        ).fetchone()[0]
+    assert [tuple(row) for row in lines] == [(501, 12.0), (502, 6.5)]
+    assert load_row["build_source"] == "MANUAL"
+    assert load_row["route_fallback"] == 1
+    assert overrides == 0
@@ -0,0 +1,34 @@
+import csv
+import io
+import os
+import unittest
+
+os.environ.setdefault("FLASK_SECRET_KEY", "test-secret")
+
+import app as app_module
+
+
+class OrdersCsvExportTests(unittest.TestCase):
+    def test_csv_lines_match_buffered_writer(self):
+        header = ["so_num", "plant", "notes"]
+        rows = [["SO-1", "GA", 'says "hi", twice'], ["SO-2", "", None]]
+
+        buffered = io.StringIO()
+        writer = csv.writer(buffered)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+        streamed = "".join(app_module._iter_csv_lines(header, iter(rows)))
+        self.assertEqual(streamed, buffered.getvalue())
+
+    def test_csv_lines_are_flushed_in_batches(self):
+        rows = [[str(idx)] for idx in range(5)]
+        chunks = list(app_module._iter_csv_lines(["n"], rows, batch_size=2))
+        self.assertEqual(chunks, ["n\r\n0\r\n1\r\n", "2\r\n3\r\n", "4\r\n"])
+
+    def test_csv_lines_with_no_rows_emit_header_only(self):
+        self.assertEqual(list(app_module._iter_csv_lines([], [])), ["\r\n"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import unittest
+from datetime import date
+
+os.environ.setdefault("FLASK_SECRET_KEY", "test-secret")
+
+import app as app_module
+
+
+class ParseCacheHelperTests(unittest.TestCase):
+    def test_parse_date_accepts_strings_dates_and_blanks(self):
+        self.assertEqual(app_module._parse_date("2026-03-04"), date(2026, 3, 4))
+        self.assertEqual(app_module._parse_date("03/04/26"), date(2026, 3, 4))
+        self.assertEqual(app_module._parse_date(date(2026, 1, 2)), date(2026, 1, 2))
+        self.assertIsNone(app_module._parse_date("not a date"))
+        self.assertIsNone(app_module._parse_date(""))
+        self.assertIsNone(app_module._parse_date(20260304))
+
+    def test_repeated_due_dates_hit_the_parse_cache(self):
+        app_module._parse_date_text.cache_clear()
+        for _ in range(5):
+            app_module._parse_date("2026-05-06")
+        info = app_module._parse_date_text.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 4)
+
+    def test_line_stop_key_normalizes_state_and_zip(self):
+        self.assertEqual(app_module._line_stop_key(" ga ", "30301-1234"), "GA|30301")
+        self.assertEqual(app_module._line_stop_key(None, None), "|")
+        self.assertEqual(app_module._line_stop_key("tx", "abc"), "TX|abc")
+
+    def test_safe_filename_part_replaces_unsafe_runs(self):
+        self.assertEqual(app_module._safe_filename_part("GA 12/34"), "GA_12_34")
+        self.assertEqual(app_module._safe_filename_part("  "), "")
+
+    def test_color_helpers_are_memoized(self):
+        app_module._lighten_hex_color.cache_clear()
+        for _ in range(3):
+            self.assertEqual(app_module._lighten_hex_color("#000000", ratio=0.5), "#7F7F7F")
+        self.assertEqual(app_module._lighten_hex_color.cache_info().misses, 1)
+        self.assertEqual(app_module._hex_to_excel_argb("1d4ed8"), "FF1D4ED8")
+        self.assertLess(app_module._color_luminance("#000000"), 138)
+        self.assertEqual(app_module._color_for_stop_sequence(3, ("#111111", "#222222")), "#111111")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import sqlite3
+
+import db
+
+
+def _build_session_fixture_db():
+    connection = sqlite3.connect(":memory:")
+    connection.row_factory = sqlite3.Row
+    connection.executescript(
+        """
+        CREATE TABLE planning_sessions (
+            id INTEGER PRIMARY KEY,
+            session_code TEXT,
+            plant_code TEXT,
+            created_by TEXT,
+            is_sandbox INTEGER DEFAULT 0,
+            status TEXT,
+            created_at TEXT
+        );
+
+        CREATE TABLE loads (
+            id INTEGER PRIMARY KEY,
+            planning_session_id INTEGER,
+            origin_plant TEXT,
+            utilization_pct REAL
+        );
+        """
+    )
+    connection.executemany(
+        """
+        INSERT INTO planning_sessions (id, session_code, plant_code, created_by, is_sandbox, status, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (1, "GA-0301", "GA", "alice", 0, "DRAFT", "2026-03-01 10:00:00"),
+            (2, "TX-0302", "TX", "bob", 0, "DRAFT", "2026-03-02 10:00:00"),
+            (3, "GA-0303", "GA", "bob", 1, "DRAFT", "2026-03-03 10:00:00"),
+            (4, "VA-0304", "VA", "carol", 0, "DRAFT", "2026-03-04 10:00:00"),
+        ],
+    )
+    connection.executemany(
+        "INSERT INTO loads (id, planning_session_id, origin_plant, utilization_pct) VALUES (?, ?, ?, ?)",
+        [
+            (10, 1, "GA", 80.0),
+            (11, 1, " tx", 90.0),
+            (12, 2, "TX", 70.0),
+            (13, 3, "GA", 50.0),
+            (14, None, "VA", 99.0),
+        ],
+    )
+    connection.commit()
+    return connection
+
+
+def test_planning_session_option_lists_are_distinct_sorted_and_scoped(monkeypatch):
+    connection = _build_session_fixture_db()
+    connection.execute(
+        """
+        INSERT INTO planning_sessions (id, session_code, plant_code, created_by, is_sandbox, status, created_at)
+        VALUES (5, 'GA-0305', 'GA', '', 0, 'DRAFT', '2026-03-05 10:00:00')
+        """
+    )
+    monkeypatch.setattr(db, "get_connection", lambda: connection)
+    try:
+        assert db.list_planning_session_planners({}, allowed_plants=["GA", "TX", "VA"]) == ["alice", "bob", "carol"]
+        assert db.list_planning_session_planners({}, allowed_plants=["GA"], sandbox=False) == ["alice"]
+        assert db.list_planning_session_plants({}, allowed_plants=["GA", "TX"]) == ["GA", "TX"]
+        assert db.list_planning_session_plants({"created_by": "carol"}, allowed_plants=["GA", "TX", "VA"]) == ["VA"]
+    finally:
+        connection.close()
+
+
+def test_list_session_plant_codes_returns_session_and_load_origins(monkeypatch):
+    connection = _build_session_fixture_db()
+    monkeypatch.setattr(db, "get_connection", lambda: connection)
+    try:
+        plant_codes = db.list_session_plant_codes(1)
+        assert plant_codes["session"] == "GA"
+        assert sorted(plant_codes["loads"]) == [" tx", "GA"]
+        assert db.list_session_plant_codes(4) == {"session": "VA", "loads": []}
+        assert db.list_session_plant_codes(99) == {"session": None, "loads": []}
+    finally:
+        connection.close()
+
+
+def test_list_session_plant_codes_for_ids_matches_single_lookups(monkeypatch):
+    connection = _build_session_fixture_db()
+    monkeypatch.setattr(db, "get_connection", lambda: connection)
+    try:
+        bulk = db.list_session_plant_codes_for_ids([1, 2, 4, 99])
+        assert sorted(bulk) == [1, 2, 4, 99]
+        for session_id, plant_codes in bulk.items():
+            single = db.list_session_plant_codes(session_id)
+            assert plant_codes["session"] == single["session"]
+            assert sorted(plant_codes["loads"]) == sorted(single["loads"])
+        assert db.list_session_plant_codes_for_ids([]) == {}
+    finally:
+        connection.close()
+
+
+def test_list_session_plant_codes_for_ids_stays_under_sqlite_variable_limit(monkeypatch):
+    connection = _build_session_fixture_db()
+    connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    monkeypatch.setattr(db, "get_connection", lambda: connection)
+    try:
+        bulk = db.list_session_plant_codes_for_ids(range(1, 1201))
+        assert len(bulk) == 1200
+        assert bulk[1]["session"] == "GA"
+        assert bulk[4]["session"] == "VA"
+        assert bulk[1200] == {"session": None, "loads": []}
+    finally:
+        connection.close()
@@ -0,0 +1,159 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+os.environ.setdefault("FLASK_SECRET_KEY", "test-secret")
+
+import app as app_module
+
+
+class PlanningSettingRequestCacheTests(unittest.TestCase):
+    def test_float_settings_are_read_once_per_request(self):
+        calls = []
+
+        def _fake_setting(key):
+            calls.append(key)
+            return {"value_text": "12.5"}
+
+        with patch.object(app_module, "_get_effective_planning_setting", side_effect=_fake_setting):
+            with app_module.app.test_request_context("/"):
+                for _ in range(3):
+                    self.assertEqual(app_module._get_stop_fee_amount(), 12.5)
+                    self.assertEqual(app_module._get_fuel_surcharge_per_mile(), 12.5)
+            self.assertEqual(len(calls), 2)
+
+            with app_module.app.test_request_context("/"):
+                app_module._get_stop_fee_amount()
+            self.assertEqual(len(calls), 3)
+
+    def test_scoped_upsert_clears_request_cache(self):
+        values = iter(["10", "25"])
+
+        with patch.object(
+            app_module,
+            "_get_effective_planning_setting",
+            side_effect=lambda _key: {"value_text": next(values)},
+        ), patch.object(app_module, "_active_planner_profile_name", return_value=""), patch.object(
+            app_module.db,
+            "upsert_planning_setting",
+        ):
+            with app_module.app.test_request_context("/"):
+                self.assertEqual(app_module._get_stop_fee_amount(), 10.0)
+                app_module._upsert_scoped_planning_setting(app_module.STOP_FEE_SETTING_KEY, "25.00")
+                self.assertEqual(app_module._get_stop_fee_amount(), 25.0)
+
+    def test_active_profile_is_loaded_once_per_request(self):
+        with patch.object(app_module.db, "get_access_profile", return_value=None) as get_profile:
+            with app_module.app.test_request_context("/"):
+                app_module.session[app_module.SESSION_PROFILE_ID_KEY] = 7
+                self.assertIsNone(app_module._ensure_active_profile())
+                self.assertIsNone(app_module._ensure_active_profile())
+            get_profile.assert_called_once_with(7)
+
+    def test_allowed_plants_are_memoized_until_the_profile_changes(self):
+        with app_module.app.test_request_context("/"):
+            app_module.session["allowed_plants"] = ["GA", "ZZ"]
+            plants = app_module._get_allowed_plants()
+            self.assertEqual(plants, ["GA"])
+            plants.append("TX")
+            app_module.session["allowed_plants"] = ["TX"]
+            self.assertEqual(app_module._get_allowed_plants(), ["GA"])
+            app_module._apply_profile_to_session(
+                {"id": 3, "name": "Planner", "allowed_plants": "VA", "default_plants": ""}
+            )
+            self.assertEqual(app_module._get_allowed_plants(), ["VA"])
+
+    def test_sku_specs_and_stop_palette_are_loaded_once_per_request(self):
+        specs = [{"sku": "A1", "length_with_tongue_ft": 12.0}]
+        app_module._SKU_SPEC_MAP_CACHE = None
+        with patch.object(app_module.db, "list_sku_specs", return_value=specs) as list_specs, patch.object(
+            app_module.db,
+            "get_table_version",
+            return_value=1,
+        ), patch.object(
+            app_module,
+            "_get_effective_planning_setting",
+            return_value={"value_text": ""},
+        ) as get_setting:
+            with app_module.app.test_request_context("/"):
+                self.assertEqual(app_module._get_sku_spec_map(), {"A1": specs[0]})
+                app_module._get_sku_spec_map()
+                palette = app_module._get_stop_color_palette()
+                palette.append("#000000")
+                self.assertEqual(
+                    app_module._get_stop_color_palette(),
+                    list(app_module.DEFAULT_STOP_COLOR_PALETTE),
+                )
+            self.assertEqual(list_specs.call_count, 1)
+            self.assertEqual(get_setting.call_count, 1)
+
+    def test_sku_spec_map_is_reused_until_table_version_changes(self):
+        app_module._SKU_SPEC_MAP_CACHE = None
+        first = [{"sku": "A1"}]
+        second = [{"sku": "B2"}]
+        with patch.object(app_module.db, "get_table_version", side_effect=[4, 4, 5]), patch.object(
+            app_module.db,
+            "list_sku_specs",
+            side_effect=[first, second],
+        ) as list_specs:
+            for expected in ({"A1": first[0]}, {"A1": first[0]}, {"B2": second[0]}):
+                with app_module.app.test_request_context("/"):
+                    self.assertEqual(app_module._get_sku_spec_map(), expected)
+        self.assertEqual(list_specs.call_count, 2)
+        app_module._SKU_SPEC_MAP_CACHE = None
+
+    def test_sku_spec_writes_bump_table_version(self):
+        db = app_module.db
+        with tempfile.TemporaryDirectory() as tmp_dir, patch.object(db, "DB_PATH", Path(tmp_dir) / "app.db"):
+            self.assertIsNone(db.get_table_version("sku_specifications"))
+            db.init_db()
+            before = db.get_table_version("sku_specifications")
+            db.upsert_sku_spec({"sku": "ZZ-VERSION-TEST", "category": "TEST", "length_with_tongue_ft": 10.0})
+            db.delete_sku_spec(db.get_sku_spec_by_sku("ZZ-VERSION-TEST")["id"])
+            self.assertEqual(db.get_table_version("sku_specifications"), before + 2)
+
+    def test_return_to_origin_rules_are_loaded_once_per_request(self):
+        strategic = [{"key": "acme", "patterns": ["ACME"], "requires_return_to_origin": True}]
+        with patch.object(
+            app_module,
+            "_get_effective_planning_setting",
+            return_value={"value_text": "[]"},
+        ) as get_setting, patch.object(app_module, "_parse_strategic_customers", return_value=strategic):
+            with app_module.app.test_request_context("/"):
+                self.assertTrue(app_module._requires_return_to_origin([{"cust_name": "Other"}, {"cust_name": "ACME"}]))
+                self.assertFalse(app_module._requires_return_to_origin([{"cust_name": "Other"}, {}]))
+                self.assertFalse(app_module._requires_return_to_origin([]))
+            self.assertEqual(get_setting.call_count, 1)
+
+    def test_stack_assumptions_and_trailer_rules_are_loaded_once_per_request(self):
+        with patch.object(
+            app_module,
+            "_get_optimizer_default_settings",
+            return_value={"stack_overflow_max_height": 3},
+        ) as get_defaults, patch.object(
+            app_module.db,
+            "get_planning_setting",
+            return_value={"value_text": ""},
+        ) as get_setting:
+            with app_module.app.test_request_context("/"):
+                assumptions = app_module._get_stack_capacity_assumptions()
+                assumptions["stack_overflow_max_height"] = 99
+                self.assertEqual(app_module._get_stack_capacity_assumptions()["stack_overflow_max_height"], 3)
+                rules = app_module._get_trailer_assignment_rules()
+                rules["livestock_category_tokens"].append("EXTRA")
+                self.assertEqual(
+                    app_module._get_trailer_assignment_rules(),
+                    app_module.DEFAULT_TRAILER_ASSIGNMENT_RULES,
+                )
+            self.assertEqual(get_defaults.call_count, 1)
+            self.assertEqual(get_setting.call_count, 1)
+
+    def test_freight_breakdown_requires_keyword_accessorials(self):
+        with self.assertRaises(TypeError):
+            app_module._build_freight_breakdown({}, 0.0, 0.0, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import db
+
+
+class ReplayEvalQueryTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self._db_path_patch = patch.object(db, "DB_PATH", Path(self._tmpdir.name) / "app.db")
+        self._db_path_patch.start()
+        db.init_db()
+        self.run_id = db.create_replay_eval_run({"filename": "replay.csv"})
+        db.add_replay_eval_issues(
+            self.run_id,
+            [
+                {"date_created": "2026-02-18", "plant_code": "TX", "load_number": "TX-2", "issue_type": "MISSING_ORDER"},
+                {"date_created": "2026-02-18", "plant_code": "GA", "load_number": "GA-1", "issue_type": "MISSING_ORDER"},
+                {"date_created": "2026-02-17", "plant_code": "GA", "load_number": "GA-0", "issue_type": "PARSE"},
+            ],
+        )
+        db.add_replay_eval_load_metrics(
+            self.run_id,
+            [
+                {"date_created": "2026-02-18", "plant_code": "GA", "scenario": "OPTIMIZED", "load_key": "b"},
+                {"date_created": "2026-02-18", "plant_code": "GA", "scenario": "ACTUAL", "load_key": "a"},
+                {"date_created": "2026-02-17", "plant_code": "TX", "scenario": "ACTUAL", "load_key": "c"},
+            ],
+        )
+
+    def tearDown(self):
+        self._db_path_patch.stop()
+        self._tmpdir.cleanup()
+
+    def test_init_db_creates_replay_date_plant_indexes(self):
+        with db.get_connection() as connection:
+            index_columns = {
+                name: [row["name"] for row in connection.execute(f"PRAGMA index_info({name})")]
+                for name in ("idx_replay_eval_issues_run_date", "idx_replay_eval_load_metrics_run_date")
+            }
+        self.assertEqual(
+            index_columns,
+            {
+                "idx_replay_eval_issues_run_date": ["run_id", "date_created", "plant_code"],
+                "idx_replay_eval_load_metrics_run_date": ["run_id", "date_created", "plant_code"],
+            },
+        )
+
+    def test_iter_replay_eval_issues_filters_in_export_order(self):
+        issues = db.iter_replay_eval_issues(self.run_id, batch_size=1)
+        self.assertEqual([issue["load_number"] for issue in issues], ["GA-0", "GA-1", "TX-2"])
+
+        filtered = db.iter_replay_eval_issues(self.run_id, date_created="2026-02-18", plant_code=" ga ")
+        self.assertEqual([issue["load_number"] for issue in filtered], ["GA-1"])
+
+        by_type = db.list_replay_eval_issues(self.run_id, issue_type="MISSING_ORDER", plant_code="TX")
+        self.assertEqual([issue["load_number"] for issue in by_type], ["TX-2"])
+
+    def test_iter_replay_eval_issues_empty_results(self):
+        self.assertEqual(list(db.iter_replay_eval_issues(None)), [])
+        self.assertEqual(list(db.iter_replay_eval_issues(self.run_id, date_created="2026-03-01")), [])
+        self.assertEqual(db.list_replay_eval_issues(self.run_id + 1), [])
+
+    def test_iter_replay_eval_load_metrics_filters_in_export_order(self):
+        metrics = db.iter_replay_eval_load_metrics(self.run_id, batch_size=2)
+        self.assertEqual([metric["load_key"] for metric in metrics], ["c", "a", "b"])
+
+        filtered = db.iter_replay_eval_load_metrics(self.run_id, date_created="2026-02-18", plant_code="ga")
+        self.assertEqual([metric["load_key"] for metric in filtered], ["a", "b"])
+
+        by_scenario = db.list_replay_eval_load_metrics(self.run_id, scenario="optimized")
+        self.assertEqual([metric["load_key"] for metric in by_scenario], ["b"])
+
+    def test_iter_replay_eval_load_metrics_empty_results(self):
+        self.assertEqual(list(db.iter_replay_eval_load_metrics(None)), [])
+        self.assertEqual(list(db.iter_replay_eval_load_metrics(self.run_id, plant_code="VA")), [])
+        self.assertEqual(db.list_replay_eval_load_metrics(self.run_id, scenario="ACTUAL", date_created="2026-02-19"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
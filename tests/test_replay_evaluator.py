@@ -395,5 +395,134 @@ class ReplayEvaluatorReproduceTests(unittest.TestCase):
         mock_finalize.assert_called_once()
 
 
+def _reference_network_daily_rollup(day_rows):
+    # The per-date generator sums build_network_daily_rollup used before the
+    # NumPy columns; kept here as the oracle for the vectorized version.
+    grouped = {}
+    for row in day_rows:
+        grouped.setdefault(row.get("date_created"), []).append(row)
+    rollups = []
+    for date_created in sorted(grouped):
+        rows = grouped[date_created]
+        actual_loads = sum(int(row.get("actual_loads") or 0) for row in rows)
+        optimized_loads = sum(int(row.get("optimized_loads") or 0) for row in rows)
+        actual_util_num = sum(
+            float(row.get("actual_avg_utilization") or 0.0) * int(row.get("actual_loads") or 0) for row in rows
+        )
+        optimized_util_num = sum(
+            float(row.get("optimized_avg_utilization") or 0.0) * int(row.get("optimized_loads") or 0) for row in rows
+        )
+        actual_avg_util = (actual_util_num / actual_loads) if actual_loads else 0.0
+        optimized_avg_util = (optimized_util_num / optimized_loads) if optimized_loads else 0.0
+        actual_total_cost = sum(float(row.get("actual_total_cost") or 0.0) for row in rows)
+        optimized_total_cost = sum(float(row.get("optimized_total_cost") or 0.0) for row in rows)
+        delta_cost = optimized_total_cost - actual_total_cost
+        rollups.append(
+            {
+                "date_created": date_created,
+                "plants": len(rows),
+                "matched_orders": sum(int(row.get("matched_orders") or 0) for row in rows),
+                "missing_orders": sum(int(row.get("missing_orders") or 0) for row in rows),
+                "actual_loads": actual_loads,
+                "actual_avg_utilization": actual_avg_util,
+                "actual_total_miles": sum(float(row.get("actual_total_miles") or 0.0) for row in rows),
+                "actual_total_cost": actual_total_cost,
+                "optimized_loads": optimized_loads,
+                "optimized_avg_utilization": optimized_avg_util,
+                "optimized_total_miles": sum(float(row.get("optimized_total_miles") or 0.0) for row in rows),
+                "optimized_total_cost": optimized_total_cost,
+                "delta_loads": optimized_loads - actual_loads,
+                "delta_avg_utilization": optimized_avg_util - actual_avg_util,
+                "delta_total_miles": sum(float(row.get("delta_total_miles") or 0.0) for row in rows),
+                "delta_total_cost": delta_cost,
+                "delta_cost_pct": replay_evaluator._safe_pct(delta_cost, actual_total_cost),
+                "report_ref_cost": sum(
+                    float(row.get("report_ref_cost") or 0.0)
+                    for row in rows
+                    if row.get("report_ref_cost") is not None
+                ),
+                "report_ref_miles": sum(
+                    float(row.get("report_ref_miles") or 0.0)
+                    for row in rows
+                    if row.get("report_ref_miles") is not None
+                ),
+            }
+        )
+    return rollups
+
+
+def _rounded_rollup(rows):
+    return [
+        {key: round(value, 6) if isinstance(value, float) else value for key, value in row.items()}
+        for row in rows
+    ]
+
+
+class NetworkDailyRollupTests(unittest.TestCase):
+    def test_rollup_matches_pure_python_aggregation_on_mixed_rows(self):
+        day_rows = [
+            {
+                "date_created": "2026-02-18",
+                "plant_code": "GA",
+                "actual_loads": 3,
+                "optimized_loads": "2",
+                "matched_orders": 11,
+                "missing_orders": None,
+                "actual_avg_utilization": 81.456,
+                "optimized_avg_utilization": "92.1",
+                "actual_total_miles": 1234.5,
+                "optimized_total_miles": 1100.25,
+                "actual_total_cost": 4567.89,
+                "optimized_total_cost": 4012.1,
+                "delta_total_miles": -134.25,
+                "delta_total_cost": -555.79,
+                "report_ref_cost": None,
+                "report_ref_miles": 980.0,
+            },
+            {
+                "date_created": "2026-02-17",
+                "plant_code": "TX",
+                "actual_loads": 0,
+                "optimized_loads": 0,
+                "matched_orders": 0,
+                "missing_orders": 2,
+                "actual_avg_utilization": None,
+                "optimized_avg_utilization": 0.0,
+                "actual_total_cost": 0,
+                "optimized_total_cost": 0,
+            },
+            {
+                "date_created": "2026-02-18",
+                "plant_code": "TX",
+                "actual_loads": 5,
+                "optimized_loads": 4,
+                "matched_orders": "7",
+                "missing_orders": 1,
+                "actual_avg_utilization": 0.1,
+                "optimized_avg_utilization": 0.2,
+                "actual_total_miles": 0.1,
+                "optimized_total_miles": 0.2,
+                "actual_total_cost": 0.1,
+                "optimized_total_cost": 0.3,
+                "delta_total_miles": 0.1,
+                "delta_total_cost": 0.2,
+                "report_ref_cost": 12.34,
+                "report_ref_miles": None,
+            },
+            {"date_created": "2026-02-19", "plant_code": "GA"},
+        ]
+
+        rollup = replay_evaluator.build_network_daily_rollup(day_rows)
+        expected = _reference_network_daily_rollup(day_rows)
+
+        self.assertEqual(_rounded_rollup(rollup), _rounded_rollup(expected))
+        for actual_row, expected_row in zip(rollup, expected):
+            self.assertEqual(
+                {key: type(value) for key, value in actual_row.items()},
+                {key: type(value) for key, value in expected_row.items()},
+            )
+        self.assertEqual(replay_evaluator.build_network_daily_rollup([]), [])
+
+
 if __name__ == "__main__":
     unittest.main()
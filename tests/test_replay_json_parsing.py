@@ -0,0 +1,22 @@
+import json
+import os
+import unittest
+
+os.environ.setdefault("FLASK_SECRET_KEY", "test-secret")
+
+import app as app_module
+
+
+class ReplayJsonParsingTests(unittest.TestCase):
+    def test_json_loads_accepts_nan_and_infinity_like_stdlib_json(self):
+        parsed = app_module._json_loads('{"utilization_pct": NaN, "max_overfill_ft": Infinity, "min": -Infinity}')
+        self.assertNotEqual(parsed["utilization_pct"], parsed["utilization_pct"])
+        self.assertEqual(parsed["max_overfill_ft"], float("inf"))
+        self.assertEqual(parsed["min"], float("-inf"))
+        self.assertEqual(app_module._parse_replay_load_json('{"miles": NaN, "lines": []}')["lines"], [])
+        with self.assertRaises(json.JSONDecodeError):
+            app_module._json_loads("{not json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import io
+import os
+import unittest
+
+os.environ.setdefault("FLASK_SECRET_KEY", "test-secret")
+
+from openpyxl import load_workbook
+
+import app as app_module
+
+
+class ReplayWorkbookExportTests(unittest.TestCase):
+    def _round_trip(self, workbook):
+        output = io.BytesIO()
+        workbook.save(output)
+        output.seek(0)
+        return load_workbook(output)
+
+    def test_replay_workbook_streams_all_sheets_with_frozen_headers(self):
+        workbook = app_module._build_replay_workbook(
+            {},
+            [
+                {
+                    "date_created": "2026-01-05",
+                    "actual_loads": 3,
+                    "actual_avg_utilization": 81.4567,
+                    "actual_total_cost": 1234.5678,
+                    "delta_cost_pct": 0.123456,
+                }
+            ],
+            [
+                {
+                    "date_created": "2026-01-05",
+                    "plant_code": "GA",
+                    "optimized_total_miles": 987.654,
+                    "report_ref_cost": None,
+                    "report_ref_miles": 12.345678,
+                }
+            ],
+            [{"plant_code": "GA", "issue_type": "MISSING_ORDER", "severity": "warn"}],
+            [{"plant_code": "GA", "scenario": "optimized", "utilization_pct": 81.456, "estimated_cost": 99.999}],
+        )
+        reloaded = self._round_trip(workbook)
+
+        self.assertEqual(reloaded.sheetnames, ["Network Daily", "Plant Daily", "Issues", "Load Metrics"])
+        for sheet in reloaded.worksheets:
+            self.assertEqual(sheet.freeze_panes, "A2")
+            self.assertEqual(sheet.sheet_format.defaultColWidth, 18)
+            self.assertEqual(sheet.max_row, 2)
+
+        network = reloaded["Network Daily"]
+        self.assertEqual(network["A1"].value, "Replay Date / Period")
+        self.assertEqual(network["E2"].value, 3)
+        self.assertEqual(network["F2"].value, 81.46)
+        self.assertEqual(network["H2"].value, 1234.57)
+        self.assertEqual(network["Q2"].value, 0.1235)
+        plant = reloaded["Plant Daily"]
+        self.assertEqual(plant["O2"].value, 987.65)
+        self.assertIsNone(plant["V2"].value)
+        self.assertEqual(plant["W2"].value, 12.35)
+        metrics = reloaded["Load Metrics"]
+        self.assertEqual(metrics["F2"].value, 81.46)
+        self.assertEqual(metrics["H2"].value, 100.0)
+
+    def test_parse_replay_order_numbers_keeps_numeric_zero_and_skips_blanks(self):
+        parsed = app_module._parse_replay_order_numbers('[" SO-1 ", "", null, 0, 12345, "  "]')
+        self.assertEqual(parsed, ["SO-1", "0", "12345"])
+        self.assertEqual(app_module._parse_replay_order_numbers('{"so": 1}'), [])
+        self.assertEqual(app_module._parse_replay_order_numbers("not json"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,84 @@
+import json
 import os
+import tempfile
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
 os.environ.setdefault("FLASK_SECRET_KEY", "test-secret")
 
 import app as app_module
 
 
+ASSUMPTIONS = {
+    "stack_overflow_max_height": 5,
+    "max_back_overhang_ft": 4.0,
+    "upper_two_across_max_length_ft": 7.0,
+    "upper_deck_exception_max_length_ft": 16.0,
+    "upper_deck_exception_overhang_allowance_ft": 6.0,
+    "upper_deck_exception_categories": ["USA", "UTA"],
+    "equal_length_deck_length_order_enabled": True,
+}
+SKU_SPECS = {
+    "5X8GW2K": {
+        "sku": "5X8GW2K",
+        "max_stack_step_deck": 4,
+        "max_stack_flat_bed": 4,
+        "category": "CARGO",
+    },
+    "6X14GW": {
+        "sku": "6X14GW",
+        "max_stack_step_deck": 2,
+        "max_stack_flat_bed": 2,
+        "category": "CARGO",
+    },
+}
+LINES = [
+    # Same order/SKU appears at two different stops.
+    {
+        "id": 11,
+        "order_line_id": 11,
+        "so_num": "SO-100",
+        "item": "5X8GWE2K",
+        "item_desc": "5X8GWE2K",
+        "sku": "5X8GW2K",
+        "qty": 8,
+        "unit_length_ft": 7.0,
+        "state": "VA",
+        "zip": "23456",
+    },
+    {
+        "id": 12,
+        "order_line_id": 12,
+        "so_num": "SO-100",
+        "item": "5X8GWE2K",
+        "item_desc": "5X8GWE2K",
+        "sku": "5X8GW2K",
+        "qty": 4,
+        "unit_length_ft": 7.0,
+        "state": "VA",
+        "zip": "23434",
+    },
+    {
+        "id": 13,
+        "order_line_id": 13,
+        "so_num": "SO-200",
+        "item": "6X14SF7K",
+        "item_desc": "6X14SF7K",
+        "sku": "6X14GW",
+        "qty": 2,
+        "unit_length_ft": 14.0,
+        "state": "VA",
+        "zip": "23061",
+    },
+]
+ORDERED_STOPS = [
+    {"state": "VA", "zip": "23061"},
+    {"state": "VA", "zip": "23434"},
+    {"state": "VA", "zip": "23456"},
+]
+
+
 def _position_item_signature(schematic):
     signature = []
     for position in (schematic or {}).get("positions") or []:
@@ -25,73 +98,10 @@ def _position_item_signature(schematic):
 
 class SchematicLayoutStopMappingTests(unittest.TestCase):
     def test_layout_from_schematic_keeps_stop_assignment_for_same_order_and_sku(self):
-        assumptions = {
-            "stack_overflow_max_height": 5,
-            "max_back_overhang_ft": 4.0,
-            "upper_two_across_max_length_ft": 7.0,
-            "upper_deck_exception_max_length_ft": 16.0,
-            "upper_deck_exception_overhang_allowance_ft": 6.0,
-            "upper_deck_exception_categories": ["USA", "UTA"],
-            "equal_length_deck_length_order_enabled": True,
-        }
-        sku_specs = {
-            "5X8GW2K": {
-                "sku": "5X8GW2K",
-                "max_stack_step_deck": 4,
-                "max_stack_flat_bed": 4,
-                "category": "CARGO",
-            },
-            "6X14GW": {
-                "sku": "6X14GW",
-                "max_stack_step_deck": 2,
-                "max_stack_flat_bed": 2,
-                "category": "CARGO",
-            },
-        }
-        lines = [
-            # Same order/SKU appears at two different stops.
-            {
-                "id": 11,
-                "order_line_id": 11,
-                "so_num": "SO-100",
-                "item": "5X8GWE2K",
-                "item_desc": "5X8GWE2K",
-                "sku": "5X8GW2K",
-                "qty": 8,
-                "unit_length_ft": 7.0,
-                "state": "VA",
-                "zip": "23456",
-            },
-            {
-                "id": 12,
-                "order_line_id": 12,
-                "so_num": "SO-100",
-                "item": "5X8GWE2K",
-                "item_desc": "5X8GWE2K",
-                "sku": "5X8GW2K",
-                "qty": 4,
-                "unit_length_ft": 7.0,
-                "state": "VA",
-                "zip": "23434",
-            },
-            {
-                "id": 13,
-                "order_line_id": 13,
-                "so_num": "SO-200",
-                "item": "6X14SF7K",
-                "item_desc": "6X14SF7K",
-                "sku": "6X14GW",
-                "qty": 2,
-                "unit_length_ft": 14.0,
-                "state": "VA",
-                "zip": "23061",
-            },
-        ]
-        ordered_stops = [
-            {"state": "VA", "zip": "23061"},
-            {"state": "VA", "zip": "23434"},
-            {"state": "VA", "zip": "23456"},
-        ]
+        assumptions = ASSUMPTIONS
+        sku_specs = SKU_SPECS
+        lines = LINES
+        ordered_stops = ORDERED_STOPS
         stop_sequence_map = app_module._stop_sequence_map_from_ordered_stops(ordered_stops)
         order_colors = app_module._build_order_colors_for_lines(
             lines,
@@ -126,6 +136,71 @@ class SchematicLayoutStopMappingTests(unittest.TestCase):
             _position_item_signature(base_schematic),
         )
 
+    def test_valid_override_skips_the_base_stack_pack(self):
+        with tempfile.TemporaryDirectory() as tmp_dir, patch.object(
+            app_module.db,
+            "DB_PATH",
+            Path(tmp_dir) / "app.db",
+        ):
+            app_module.db.init_db()
+            self._assert_override_skips_base_pack()
+
+    def _assert_override_skips_base_pack(self):
+        stop_sequence_map = app_module._stop_sequence_map_from_ordered_stops(ORDERED_STOPS)
+        base_schematic, base_line_items, base_order_numbers = app_module._calculate_load_schematic(
+            LINES,
+            SKU_SPECS,
+            "FLATBED_48",
+            stop_sequence_map=stop_sequence_map,
+            assumptions=ASSUMPTIONS,
+        )
+        units = app_module._build_schematic_units(
+            LINES,
+            SKU_SPECS,
+            "FLATBED_48",
+            stop_sequence_map=stop_sequence_map,
+        )
+        override = {
+            "trailer_type": "FLATBED_48",
+            "layout_json": json.dumps(app_module._layout_from_schematic(base_schematic, units)),
+        }
+        with patch.object(app_module.db, "get_load_schematic_override", return_value=override), patch.object(
+            app_module.stack_calculator,
+            "calculate_stack_configuration",
+        ) as calculate:
+            result = app_module._calculate_load_schematic_with_override(
+                1,
+                LINES,
+                SKU_SPECS,
+                "FLATBED_48",
+                stop_sequence_map=stop_sequence_map,
+                assumptions=ASSUMPTIONS,
+            )
+        calculate.assert_not_called()
+        self.assertTrue(result["has_custom_schematic"])
+        self.assertEqual(result["line_items"], base_line_items)
+        self.assertEqual(result["order_numbers"], base_order_numbers)
+        self.assertEqual(
+            _position_item_signature(result["schematic"]),
+            _position_item_signature(base_schematic),
+        )
+
+        override["layout_json"] = "{not json"
+        with patch.object(app_module.db, "get_load_schematic_override", return_value=override):
+            result = app_module._calculate_load_schematic_with_override(
+                1,
+                LINES,
+                SKU_SPECS,
+                "FLATBED_48",
+                stop_sequence_map=stop_sequence_map,
+                assumptions=ASSUMPTIONS,
+            )
+        self.assertFalse(result["has_custom_schematic"])
+        self.assertEqual(
+            _position_item_signature(result["schematic"]),
+            _position_item_signature(base_schematic),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
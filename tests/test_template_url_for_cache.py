@@ -0,0 +1,50 @@
+import os
+import unittest
+
+os.environ.setdefault("FLASK_SECRET_KEY", "test-secret")
+
+from flask import url_for
+
+import app as app_module
+
+
+class TemplateUrlForCacheTests(unittest.TestCase):
+    def setUp(self):
+        app_module._url_for_cached.cache_clear()
+
+    def test_cached_url_for_matches_flask_and_reuses_entries(self):
+        with app_module.app.test_request_context("/planning-sessions"):
+            expected = url_for("cot.load_detail", load_id=42)
+            self.assertEqual(app_module._template_url_for("cot.load_detail", load_id=42), expected)
+            self.assertEqual(app_module._template_url_for("cot.load_detail", load_id=42), expected)
+            info = app_module._url_for_cached.cache_info()
+            self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_cache_is_keyed_on_script_root(self):
+        with app_module.app.test_request_context("/planning-sessions"):
+            plain = app_module._template_url_for("cot.load_detail", load_id=7)
+        with app_module.app.test_request_context("/planning-sessions", base_url="http://localhost/cot"):
+            mounted = app_module._template_url_for("cot.load_detail", load_id=7)
+        self.assertEqual(plain, "/loads/7")
+        self.assertEqual(mounted, "/cot/loads/7")
+
+    def test_cache_distinguishes_equal_values_of_different_types(self):
+        with app_module.app.test_request_context("/"):
+            for value in (1, True, 1.0):
+                self.assertEqual(
+                    app_module._template_url_for("cot.load_detail", load_id=3, page=value),
+                    url_for("cot.load_detail", load_id=3, page=value),
+                )
+        self.assertEqual(app_module._url_for_cached.cache_info().currsize, 3)
+
+    def test_external_and_unhashable_values_bypass_cache(self):
+        with app_module.app.test_request_context("/"):
+            external = app_module._template_url_for("cot.load_detail", load_id=3, _external=True)
+            self.assertTrue(external.startswith("http://"))
+            listed = app_module._template_url_for("cot.load_detail", load_id=3, tab=["a", "b"])
+            self.assertIn("tab=a", listed)
+        self.assertEqual(app_module._url_for_cached.cache_info().currsize, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+
+from services import geo_utils, tsp_solver
+
+
+class TspSolverTests(unittest.TestCase):
+    def test_each_coordinate_pair_is_measured_once_per_solve(self):
+        calls = []
+
+        def _distance(coords1, coords2):
+            calls.append((coords1, coords2))
+            return geo_utils.haversine_distance_coords(coords1, coords2)
+
+        origin = (34.43611, -83.10639)
+        stops = [{"id": idx, "coords": (33.0 + idx * 0.4, -84.0 + (idx % 3) * 0.7)} for idx in range(6)]
+
+        ordered = tsp_solver.solve_route(origin, stops, distance_fn=_distance, return_to_origin=True)
+
+        self.assertEqual(sorted(stop["id"] for stop in ordered), list(range(6)))
+        self.assertEqual(len(calls), len(set(calls)))
+        self.assertLessEqual(len(calls), 7 * 7)
+
+
+if __name__ == "__main__":
+    unittest.main()